@@ -3,15 +3,15 @@ Warehouse Management Service
 
 A service for managing warehouses, rooms, and customers with DynamoDB backend.
 """
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from decimal import Decimal
-import json
 from app.config import get_settings
+from app.utils import ORJSONResponse
 
 # Package metadata
 __version__ = "0.1.0"
@@ -27,12 +27,34 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Custom JSON encoder for Decimal
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return str(obj)
-        return super().default(obj)
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Manage application startup and shutdown events."""
+    # Startup
+    logger.info("Starting Warehouse Management Service")
+    # boto3 calls run in the loop's default executor; size it to the HTTP
+    # connection pool so concurrent requests are not capped at its ~cpu+4 threads.
+    executor = ThreadPoolExecutor(
+        max_workers=settings.DYNAMODB_MAX_POOL_CONNECTIONS,
+        thread_name_prefix="dynamodb"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    # Imported here so that importing the package does not pull in boto3.
+    from app.dependencies import init_databases, init_services
+    init_databases(app)
+    init_services(app)
+    yield
+    # Shutdown
+    logger.info("Shutting down Warehouse Management Service")
+    executor.shutdown(wait=False)
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log unexpected errors in one place and return a generic 500."""
+    logger.exception("Unhandled error during %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Internal server error"}
+    )
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -42,37 +64,19 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url=None,  # Disable default docs
         redoc_url=None,  # Disable default redoc
-        json_encoder=DecimalEncoder,
-        default_response_class=JSONResponse
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
 
     # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(CORSMiddleware, **settings.cors_settings)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
 
     return app
 
 # Default application instance
 app = create_app()
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Manage application startup and shutdown events."""
-    # Startup
-    logger.info("Starting Warehouse Management Service")
-    # Add any startup initialization here
-    yield
-    # Shutdown
-    logger.info("Shutting down Warehouse Management Service")
-    # Add any cleanup here
-
-app.lifespan = lifespan
-
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -0,0 +1,187 @@
+"""
+In-process response cache for read-only GET endpoints.
+
+Successful GET responses are kept in a bounded TTL cache keyed on the path,
+query string and Authorization header. Any successful write (POST/PUT/PATCH/
+DELETE) drops the cached responses of its own collection and of the
+collections that depend on it. The cache is per process, so with several
+workers a write only invalidates the worker that served it; entries elsewhere
+expire after the TTL, which is why fast-moving collections can be given a
+shorter per-collection TTL (or 0 to bypass the cache for them).
+
+Independently of that cache, ``ETagMiddleware`` tags successful GET responses
+with a hash of their body so polling clients can revalidate with
+``If-None-Match`` and get an empty 304 instead of the full payload.
+"""
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional
+from app.utils import TTLCache
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving repeated GETs from memory until a write invalidates them."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ttl: float,
+        maxsize: int = 1024,
+        invalidates: Optional[Mapping[str, Iterable[str]]] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+    ):
+        self.app = app
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Collection prefix -> the prefixes a write to it makes stale
+        self.invalidates = {
+            prefix: tuple(dependents) for prefix, dependents in (invalidates or {}).items()
+        }
+        # Collection prefix -> TTL overriding the default for its responses
+        self.ttls = dict(ttls or {})
+
+    @staticmethod
+    def _longest_prefix(path: str, prefixes: Iterable[str]) -> Optional[str]:
+        matches = [prefix for prefix in prefixes if path == prefix or path.startswith(prefix + "/")]
+        return max(matches, key=len) if matches else None
+
+    def _collection(self, path: str) -> Optional[str]:
+        """Return the longest configured collection prefix ``path`` falls under."""
+        return self._longest_prefix(path, self.invalidates)
+
+    def _ttl(self, path: str) -> float:
+        """Return the TTL for responses under ``path``."""
+        prefix = self._longest_prefix(path, self.ttls)
+        return self.cache.ttl if prefix is None else self.ttls[prefix]
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached responses made stale by a write to ``path``."""
+        collection = self._collection(path)
+        stale = self.invalidates.get(collection, (collection,)) if collection else (path,)
+        for key in [key for key in self.cache.keys() if key[0].startswith(stale)]:
+            self.cache.pop(key)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method == "GET":
+            await self._cached_get(scope, receive, send)
+        elif method in _WRITE_METHODS:
+            await self._write(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _cached_get(self, scope: Scope, receive: Receive, send: Send) -> None:
+        ttl = self._ttl(scope["path"])
+        if ttl <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        key = (scope["path"], scope["query_string"], headers.get(b"authorization", b""))
+        cached = self.cache.get(key)
+        if cached is not None:
+            status, response_headers, body = cached
+            await send({
+                "type": "http.response.start",
+                "status": status,
+                "headers": response_headers + [(b"x-cache", b"HIT")],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False) and self._cacheable(start):
+                    self.cache.set(key, (start["status"], list(start.get("headers", [])), b"".join(chunks)), ttl)
+            await send(message)
+
+        await self.app(scope, receive, capture)
+
+    async def _write(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def invalidate_on_success(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                self.invalidate(scope["path"])
+            await send(message)
+
+        await self.app(scope, receive, invalidate_on_success)
+
+    @staticmethod
+    def _cacheable(start: Mapping[str, Any]) -> bool:
+        if start.get("status") != 200:
+            return False
+        return not any(name.lower() == b"set-cookie" for name, _ in start.get("headers", []))
+
+
+def _etag(body: bytes) -> bytes:
+    # Weak: the tag identifies the JSON content, not a byte-exact encoding of it
+    return b'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+def _etag_matches(etag: bytes, if_none_match: bytes) -> bool:
+    """Apply the weak comparison used for ``If-None-Match``."""
+    opaque = etag.removeprefix(b"W/")
+    return any(
+        candidate == b"*" or candidate.removeprefix(b"W/") == opaque
+        for candidate in (part.strip() for part in if_none_match.split(b","))
+    )
+
+class ETagMiddleware:
+    """ASGI middleware adding ETags to GET responses and answering matching revalidations with 304."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def tag(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                start.update(message)
+                return
+            if not start or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if message.get("more_body", False) and not chunks:
+                # Streamed bodies are passed through untagged rather than buffered
+                await send(start.copy())
+                start.clear()
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            body = b"".join(chunks)
+            etag = _etag(body)
+            headers = [(name, value) for name, value in start.get("headers", []) if name.lower() != b"etag"]
+            if if_none_match is not None and _etag_matches(etag, if_none_match):
+                headers = [(name, value) for name, value in headers if name.lower() != b"content-length"]
+                await send({**start, "status": 304, "headers": headers + [(b"etag", etag)]})
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({**start, "headers": headers + [(b"etag", etag)]})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, tag)
@@ -1,9 +1,38 @@
-from functools import lru_cache
-from typing import List, Optional
-from pydantic import field_validator, ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import json
+import os
+from dataclasses import dataclass, fields
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple, get_type_hints
+from botocore.config import Config
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+def _coerce(raw: str, annotation: Any) -> Any:
+    """Convert a raw environment string to the field's declared type."""
+    if annotation == Optional[str]:
+        return raw
+    if annotation == Optional[int]:
+        return int(raw) if raw else None
+    if annotation is bool:
+        if raw.lower() in {"1", "true", "yes", "on"}:
+            return True
+        if raw.lower() in {"0", "false", "no", "off"}:
+            return False
+        raise ValueError(f"Invalid boolean value: {raw}")
+    if annotation is int:
+        return int(raw)
+    if annotation is float:
+        return float(raw)
+    if annotation == Tuple[str, ...]:
+        return tuple(json.loads(raw))
+    return raw
+
+
+ENV_PREFIX = "WMS_"
+ENV_FILE = ".env"
+
+@dataclass(frozen=True)
+class Settings:
     """
     Application settings with environment variable overrides.
     """
@@ -13,22 +42,35 @@ class Settings(BaseSettings):
     
     # API Settings
     API_VERSION: str = "v1"
-    API_PREFIX: str = f"/api/{API_VERSION}"
+    API_PREFIX: str = "/api/v1"
     PROJECT_NAME: str = "Warehouse Management Service"
     
     # Database Settings
     CUSTOMERS_TABLE: str = "dev-Customers"
     WAREHOUSES_TABLE: str = "dev-Warehouses"
+    ROOMS_TABLE: str = "dev-Rooms"
+    INVENTORY_TABLE: str = "dev-Inventory"
     AWS_REGION: str = "us-east-1"
     AWS_ACCESS_KEY_ID: Optional[str] = None
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     DYNAMODB_ENDPOINT_URL: Optional[str] = None  # For local development/testing
+    DYNAMODB_MAX_POOL_CONNECTIONS: int = 64
+    DYNAMODB_CONNECT_TIMEOUT: float = 1.0  # Seconds
+    DYNAMODB_READ_TIMEOUT: float = 2.0  # Seconds
+    DYNAMODB_MAX_ATTEMPTS: int = 3
+    DYNAMODB_SCAN_SEGMENTS: int = 4  # Parallel segments for full-table scans
+    DAX_ENDPOINT: Optional[str] = None  # Serve item reads and writes through DAX when set
+    CUSTOMER_CACHE_TTL: int = 60  # Seconds a verified customer ID is trusted
+
+    # Response cache for GET endpoints (0 disables it)
+    RESPONSE_CACHE_TTL: int = 0  # Seconds
+    RESPONSE_CACHE_MAXSIZE: int = 1024
     
     # CORS Settings
-    CORS_ORIGINS: List[str] = ["*"]
+    CORS_ORIGINS: Tuple[str, ...] = ("*",)
     CORS_ALLOW_CREDENTIALS: bool = True
-    CORS_ALLOW_METHODS: List[str] = ["*"]
-    CORS_ALLOW_HEADERS: List[str] = ["*"]
+    CORS_ALLOW_METHODS: Tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS")
+    CORS_ALLOW_HEADERS: Tuple[str, ...] = ("Authorization", "Content-Type")
     
     # Security Settings
     AUTH_REQUIRED: bool = True
@@ -42,6 +84,7 @@ class Settings(BaseSettings):
     # Application Limits
     MAX_WAREHOUSE_CAPACITY: int = 1000
     MAX_STACK_HEIGHT: int = 10
+    MAX_CONCURRENT_WRITES: int = 32  # In-flight write requests per worker before 503
     
     # Email Settings
     SMTP_HOST: Optional[str] = None
@@ -49,68 +92,76 @@ class Settings(BaseSettings):
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        case_sensitive=True,
-        env_prefix="WMS_",
-        extra="ignore"
-    )
-    
-    @field_validator("ENV")
-    def validate_environment(cls, v: str) -> str:
+    def __post_init__(self) -> None:
         allowed = {"development", "staging", "production"}
-        if v not in allowed:
+        if self.ENV not in allowed:
             raise ValueError(f"Environment must be one of {allowed}")
-        return v
-    
-    @field_validator("AUTH_SECRET_KEY")
-    def validate_secret_key(cls, v: str, info: ValidationInfo) -> str:
-        if info.data.get("ENV") == "production" and v == "development_secret_key":
+        if self.ENV == "production" and self.AUTH_SECRET_KEY == "development_secret_key":
             raise ValueError("Production environment requires a secure AUTH_SECRET_KEY")
-        return v
-    
-    @field_validator("MAX_STACK_HEIGHT")
-    def validate_stack_height(cls, v: int) -> int:
-        if v < 1 or v > 20:
+        if self.MAX_STACK_HEIGHT < 1 or self.MAX_STACK_HEIGHT > 20:
             raise ValueError("Stack height must be between 1 and 20")
-        return v
     
-    def get_database_settings(self) -> dict:
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Builds settings from ``WMS_``-prefixed variables in ``.env`` and the environment.
+        """
+        if environ is None:
+            environ = {**dotenv_values(ENV_FILE), **os.environ}
+        hints = get_type_hints(cls)
+        values = {}
+        for f in fields(cls):
+            raw = environ.get(ENV_PREFIX + f.name)
+            if raw is not None:
+                values[f.name] = _coerce(raw, hints[f.name])
+        return cls(**values)
+    
+    @cached_property
+    def database_settings(self) -> Mapping[str, Any]:
         """
         Returns database configuration settings.
         """
-        return {
+        return MappingProxyType({
             "region_name": self.AWS_REGION,
             "aws_access_key_id": self.AWS_ACCESS_KEY_ID,
             "aws_secret_access_key": self.AWS_SECRET_ACCESS_KEY,
-        }
+            "config": Config(
+                max_pool_connections=self.DYNAMODB_MAX_POOL_CONNECTIONS,
+                connect_timeout=self.DYNAMODB_CONNECT_TIMEOUT,
+                read_timeout=self.DYNAMODB_READ_TIMEOUT,
+                retries={"max_attempts": self.DYNAMODB_MAX_ATTEMPTS, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        })
     
-    def get_cors_settings(self) -> dict:
+    @cached_property
+    def cors_settings(self) -> Mapping[str, Any]:
         """
         Returns CORS configuration settings.
         """
-        return {
+        return MappingProxyType({
             "allow_origins": self.CORS_ORIGINS,
             "allow_credentials": self.CORS_ALLOW_CREDENTIALS,
             "allow_methods": self.CORS_ALLOW_METHODS,
             "allow_headers": self.CORS_ALLOW_HEADERS,
-        }
+        })
     
-    def get_email_settings(self) -> dict:
+    @cached_property
+    def email_settings(self) -> Mapping[str, Any]:
         """
         Returns email configuration settings.
         """
-        return {
+        return MappingProxyType({
             "smtp_host": self.SMTP_HOST,
             "smtp_port": self.SMTP_PORT,
             "smtp_user": self.SMTP_USER,
             "smtp_password": self.SMTP_PASSWORD,
-        }
+        })
 
 @lru_cache
 def get_settings() -> Settings:
     """
     Returns cached settings instance.
     """
-    return Settings()
+    return Settings.from_env()
 
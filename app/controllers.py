@@ -1,14 +1,15 @@
 import logging
-from typing import Dict, List, Optional, Any, Type
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Any, Type
 from uuid import UUID
 from fastapi import HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.models import (
     CustomerCreate, CustomerResponse,
     WarehouseCreate, WarehouseResponse,
     RoomCreate, RoomResponse,
-    InventoryResponse
+    InventoryListItem
 )
 from app.services import WarehouseService
 from app.utils import (
@@ -21,7 +22,74 @@ from app.database import ValidationError, ItemNotFoundError
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=32)
+def _dumper_for(model: Type[BaseModel]) -> Callable[[Any], Dict]:
+    """Return a cached callable that dumps trusted service data as ``model``."""
+    construct = model.model_construct
+
+    def dump(data: Any) -> Dict:
+        if isinstance(data, BaseModel):
+            return data.model_dump()
+        if isinstance(data, dict):
+            return construct(**data).model_dump(warnings=False)
+        raise ValueError(f"Unexpected data type: {type(data)}")
+
+    return dump
+
+@lru_cache(maxsize=32)
+def _list_dumper_for(model: Type[BaseModel]) -> Callable[[List[Any]], List[Dict]]:
+    """Return a cached callable that dumps a list of trusted service data in one pass."""
+    adapter = TypeAdapter(List[model])
+    construct = model.model_construct
+
+    def dump(items: List[Any]) -> List[Dict]:
+        models = []
+        for item in items:
+            if isinstance(item, dict):
+                item = construct(**item)
+            elif not isinstance(item, BaseModel):
+                raise ValueError(f"Unexpected data type: {type(item)}")
+            models.append(item)
+        return adapter.dump_python(models, warnings=False)
+
+    return dump
+
+_REQUEST_REQUIRED = "Request data is required"
+
+_CUSTOMER_DELETED = {"message": "Customer deleted successfully"}
+_WAREHOUSE_DELETED = {"message": "Warehouse deleted successfully"}
+_ROOM_DELETED = {"message": "Room deleted successfully"}
+
+# Errors the service is expected to raise; anything else propagates to the
+# application-level handler and becomes a 500.
+_HANDLED_ERRORS = (HTTPException, ValidationError, ItemNotFoundError, ValueError)
+
+_NOT_FOUND = partial(HTTPException, status.HTTP_404_NOT_FOUND)
+_UNPROCESSABLE = partial(HTTPException, status.HTTP_422_UNPROCESSABLE_ENTITY)
+_SERVER_ERROR = partial(HTTPException, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+_HTTP_ERROR_BY_EXC = (
+    (ValidationError, _UNPROCESSABLE),
+    (ItemNotFoundError, _NOT_FOUND),
+)
+
+def _http_error_for(error: Exception, message: str) -> Callable[..., HTTPException]:
+    """Map an exception to the HTTPException factory for its status code."""
+    for exc_type, factory in _HTTP_ERROR_BY_EXC:
+        if isinstance(error, exc_type):
+            return factory
+    # The service still raises bare ValueErrors; classify those by message.
+    if isinstance(error, ValueError):
+        lowered = message.lower()
+        if "not found" in lowered:
+            return _NOT_FOUND
+        if "invalid" in lowered:
+            return _UNPROCESSABLE
+    return _SERVER_ERROR
+
 class BaseController:
+    __slots__ = ("service",)
+
     def __init__(self, service: Optional[WarehouseService] = None):
         if service is None:
             raise ValueError("Service instance is required")
@@ -29,60 +97,46 @@ class BaseController:
 
     async def handle_error(self, error: Exception, operation: str) -> None:
         """Handle and log errors from operations."""
-        logger.error(f"Error during {operation}: {str(error)}")
         if isinstance(error, HTTPException):
+            logger.error("Error during %s: %s", operation, error.detail)
             raise error
-        if isinstance(error, ValidationError):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=str(error)
-            )
-        if isinstance(error, ItemNotFoundError) or "not found" in str(error).lower():
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=str(error)
-            )
-        if "invalid" in str(error).lower():
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=str(error)
-            )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(error)
-        )
+        message = str(error)
+        logger.error("Error during %s: %s", operation, message)
+        raise _http_error_for(error, message)(detail=message)
 
     def validate_request(self, data: BaseModel) -> None:
         """Validate incoming request data."""
-        if not data:
+        if data is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Request data is required"
+                detail=_REQUEST_REQUIRED
             )
 
     def format_response(self, data: Dict, response_model: Type[BaseModel]) -> Dict:
-        """Format response data according to the response model."""
+        """Format response data according to the response model.
+
+        Service results are already validated, so dicts are wrapped with
+        ``model_construct`` rather than being validated a second time.
+        """
         try:
-            if isinstance(data, BaseModel):
-                return data.dict()
-            if isinstance(data, dict):
-                return response_model(**data).dict()
-            raise ValueError(f"Unexpected data type: {type(data)}")
+            return _dumper_for(response_model)(data)
         except Exception as e:
-            logger.error(f"Error formatting response: {str(e)}")
+            detail = f"Error formatting response: {e}"
+            logger.error(detail)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Error formatting response: {str(e)}"
+                detail=detail
             )
 
 class CustomerController(BaseController):
+    __slots__ = ()
+
     async def create_customer(self, customer_data: CustomerCreate) -> Dict:
         """Create a new customer."""
         try:
-            self.validate_request(customer_data)
             result = await self.service.create_customer(customer_data)
             return self.format_response(result, CustomerResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "customer creation")
 
     async def update_customer(self, customer_id: UUID, customer_data: Dict) -> Dict:
@@ -90,7 +144,7 @@ class CustomerController(BaseController):
         try:
             result = await self.service.update_customer(customer_id, customer_data)
             return self.format_response(result, CustomerResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "customer update")
 
     async def get_customer(self, customer_id: UUID) -> Dict:
@@ -98,33 +152,34 @@ class CustomerController(BaseController):
         try:
             result = await self.service.get_customer(customer_id)
             return self.format_response(result, CustomerResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "customer retrieval")
 
     async def list_customers(self, skip: int = 0, limit: int = 100) -> List[Dict]:
         """List all customers with pagination."""
         try:
             results = await self.service.list_customers(skip, limit)
-            return [self.format_response(r, CustomerResponse) for r in results]
-        except Exception as e:
+            return _list_dumper_for(CustomerResponse)(results)
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "customer listing")
 
     async def delete_customer(self, customer_id: UUID) -> Dict:
         """Delete a customer."""
         try:
             await self.service.delete_customer(customer_id)
-            return {"message": "Customer deleted successfully"}
-        except Exception as e:
+            return _CUSTOMER_DELETED
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "customer deletion")
 
 class WarehouseController(BaseController):
+    __slots__ = ()
+
     async def create_warehouse(self, warehouse_data: WarehouseCreate) -> Dict:
         """Create a new warehouse."""
         try:
-            self.validate_request(warehouse_data)
             result = await self.service.create_warehouse(warehouse_data)
             return self.format_response(result, WarehouseResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "warehouse creation")
 
     async def update_warehouse(self, warehouse_id: UUID, warehouse_data: Dict) -> Dict:
@@ -132,7 +187,7 @@ class WarehouseController(BaseController):
         try:
             result = await self.service.update_warehouse(warehouse_id, warehouse_data)
             return self.format_response(result, WarehouseResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "warehouse update")
 
     async def get_warehouse(self, warehouse_id: UUID) -> Dict:
@@ -140,33 +195,34 @@ class WarehouseController(BaseController):
         try:
             result = await self.service.get_warehouse(warehouse_id)
             return self.format_response(result, WarehouseResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "warehouse retrieval")
 
     async def list_warehouses(self, skip: int = 0, limit: int = 100) -> List[Dict]:
         """List all warehouses with pagination."""
         try:
             results = await self.service.list_warehouses(skip, limit)
-            return [self.format_response(r, WarehouseResponse) for r in results]
-        except Exception as e:
+            return _list_dumper_for(WarehouseResponse)(results)
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "warehouse listing")
 
     async def delete_warehouse(self, warehouse_id: UUID) -> Dict:
         """Delete a warehouse."""
         try:
             await self.service.delete_warehouse(warehouse_id)
-            return {"message": "Warehouse deleted successfully"}
-        except Exception as e:
+            return _WAREHOUSE_DELETED
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "warehouse deletion")
 
 class RoomController(BaseController):
+    __slots__ = ()
+
     async def create_room(self, warehouse_id: UUID, room_data: RoomCreate) -> Dict:
         """Create a new room in a warehouse."""
         try:
-            self.validate_request(room_data)
             result = await self.service.create_room(warehouse_id, room_data)
             return self.format_response(result, RoomResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "room creation")
 
     async def update_room(self, warehouse_id: UUID, room_id: UUID, room_data: Dict) -> Dict:
@@ -174,7 +230,7 @@ class RoomController(BaseController):
         try:
             result = await self.service.update_room(warehouse_id, room_id, room_data)
             return self.format_response(result, RoomResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "room update")
 
     async def get_room(self, warehouse_id: UUID, room_id: UUID) -> Dict:
@@ -182,39 +238,41 @@ class RoomController(BaseController):
         try:
             result = await self.service.get_room(warehouse_id, room_id)
             return self.format_response(result, RoomResponse)
-        except Exception as e:
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "room retrieval")
 
     async def list_rooms(self, warehouse_id: UUID, skip: int = 0, limit: int = 100) -> List[Dict]:
         """List all rooms in a warehouse with pagination."""
         try:
             results = await self.service.list_rooms(warehouse_id, skip, limit)
-            return [self.format_response(r, RoomResponse) for r in results]
-        except Exception as e:
+            return _list_dumper_for(RoomResponse)(results)
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "room listing")
 
     async def delete_room(self, warehouse_id: UUID, room_id: UUID) -> Dict:
         """Delete a room."""
         try:
             await self.service.delete_room(warehouse_id, room_id)
-            return {"message": "Room deleted successfully"}
-        except Exception as e:
+            return _ROOM_DELETED
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "room deletion")
 
 class InventoryController(BaseController):
+    __slots__ = ()
+
     async def list_by_room(self, room_id: str) -> List[Dict]:
         """List all inventory items in a room."""
         try:
             results = await self.service.list_inventory_by_room(room_id)
-            return [self.format_response(r, InventoryResponse) for r in results]
-        except Exception as e:
+            return _list_dumper_for(InventoryListItem)(results)
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "inventory listing")
 
     async def search(self, sku: str) -> List[Dict]:
         """Search inventory by SKU."""
         try:
             results = await self.service.search_inventory(sku)
-            return [self.format_response(r, InventoryResponse) for r in results]
-        except Exception as e:
+            return _list_dumper_for(InventoryListItem)(results)
+        except _HANDLED_ERRORS as e:
             await self.handle_error(e, "inventory search")
 
@@ -1,7 +1,11 @@
+import asyncio
 import boto3
 import uuid
+from bisect import bisect_right
+from enum import Enum
+from functools import lru_cache, partial
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypeVar, Generic, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Generic, Union, get_args, get_origin
 from botocore.exceptions import ClientError
 from pydantic import BaseModel
 from decimal import Decimal
@@ -9,10 +13,34 @@ from uuid import UUID, uuid4
 from boto3.dynamodb.conditions import Key
 
 from .config import get_settings
-from .models import CustomerCreate, CustomerResponse, WarehouseCreate, WarehouseResponse, RoomBase, RoomStatus, RoomCreate, RoomResponse, RoomUpdate, InventoryCreate, InventoryResponse, InventoryUpdate
+from .utils import SingleFlight, TTLCache
+from .models import CustomerCreate, CustomerResponse, WarehouseCreate, WarehouseResponse, RoomBase, RoomStatus, RoomCreate, RoomResponse, RoomUpdate, InventoryCreate, InventoryResponse, InventoryListItem, InventoryUpdate, InventoryTransfer
 
 settings = get_settings()
 
+# DynamoDB limits keys per BatchGetItem request to 100
+BATCH_GET_LIMIT = 100
+BATCH_MAX_RETRIES = 3
+BATCH_RETRY_BASE_DELAY = 0.05
+
+# DynamoDB limits TransactWriteItems to 100 operations
+TRANSACT_WRITE_LIMIT = 100
+
+# GSI on the rooms and inventory tables keyed by the owning warehouse
+WAREHOUSE_ID_INDEX = 'warehouse_id-index'
+
+# Key condition builders for the attributes queries are keyed on
+_EMAIL_KEY = Key('email')
+_CUSTOMER_ID_KEY = Key('customer_id')
+_WAREHOUSE_ID_KEY = Key('warehouse_id')
+_SKU_KEY = Key('sku')
+
+# Inventory search pages fetch only the list projection, leaving out transfer_history
+INVENTORY_SEARCH_ATTRIBUTES = tuple(InventoryListItem.model_fields)
+
+# Customer IDs recently seen to exist; customers are rarely deleted
+_known_customers = TTLCache(maxsize=10_000, ttl=settings.CUSTOMER_CACHE_TTL)
+
 T = TypeVar('T', bound=BaseModel)
 R = TypeVar('R', bound=BaseModel)
 
@@ -41,298 +69,657 @@ class OperationError(Exception):
     """Raised when an operation cannot be completed."""
     pass
 
+@lru_cache(maxsize=None)
+def get_dynamodb_resource() -> Any:
+    """Return the process-wide DynamoDB resource, bypassing DAX."""
+    return boto3.resource(
+        'dynamodb',
+        endpoint_url=settings.DYNAMODB_ENDPOINT_URL,
+        **settings.database_settings
+    )
+
+@lru_cache(maxsize=None)
+def get_item_resource() -> Any:
+    """Return the resource item reads and all writes go through: DAX when DAX_ENDPOINT is set, else DynamoDB.
+
+    DAX only refreshes its item cache for writes it sees, so writes must take
+    the same client as the reads that follow them.
+    """
+    if not settings.DAX_ENDPOINT:
+        return get_dynamodb_resource()
+    # Optional dependency, only needed when DAX is enabled
+    from amazondax import AmazonDaxClient
+    return AmazonDaxClient.resource(
+        endpoint_url=settings.DAX_ENDPOINT,
+        region_name=settings.AWS_REGION
+    )
+
+@lru_cache(maxsize=None)
+def get_table(table_name: str) -> Any:
+    """Return the shared Table handle item reads and writes of ``table_name`` use."""
+    return get_item_resource().Table(table_name)
+
+@lru_cache(maxsize=None)
+def get_query_table(table_name: str) -> Any:
+    """Return the Table handle queries and scans of ``table_name`` use.
+
+    These always go to DynamoDB: DAX's query cache is not updated by writes,
+    even writes made through DAX, so it would serve stale lists.
+    """
+    if not settings.DAX_ENDPOINT:
+        return get_table(table_name)
+    return get_dynamodb_resource().Table(table_name)
+
+def _projection(attributes: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Return get_item/query kwargs that fetch only ``attributes`` (all of them when None)."""
+    if attributes is None:
+        return {}
+    names = {f'#a{i}': name for i, name in enumerate(attributes)}
+    return {
+        'ProjectionExpression': ', '.join(names),
+        'ExpressionAttributeNames': names
+    }
+
+@lru_cache(maxsize=256)
+def _set_clause(fields: Tuple[str, ...]) -> Tuple[str, Dict[str, str]]:
+    """Return the SET expression and attribute names for an update touching ``fields``.
+
+    Updates come in a handful of shapes (e.g. quantity-only), so the assembled
+    strings are cached per field tuple.
+    """
+    expression = 'SET ' + ', '.join(f'#{field} = :{field}' for field in fields)
+    return expression, {f'#{field}': field for field in fields}
+
+# Shared Decimals for the small integers that dominate quantities and counters
+_SMALL_INT_DECIMALS = tuple(Decimal(i) for i in range(1024))
+
+def _to_dynamo_value(value: Any) -> Any:
+    """Convert ints and floats to Decimal and UUIDs to str for DynamoDB; other values pass through."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if isinstance(value, int):
+        return _SMALL_INT_DECIMALS[value] if 0 <= value < 1024 else Decimal(value)
+    return Decimal(repr(value))
+
+def _coercer_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Return a converter for a stored value of ``annotation``, or None when it is kept as-is."""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        inner = _coercer_for(args[0]) if len(args) == 1 else None
+        return None if inner is None else (lambda v: None if v is None else inner(v))
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        inner = _coercer_for(args[0]) if args else None
+        return None if inner is None else (lambda v: [inner(i) for i in v])
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        return lambda v: v if isinstance(v, annotation) else _construct(annotation, v)
+    if issubclass(annotation, UUID):
+        return lambda v: v if isinstance(v, UUID) else UUID(str(v))
+    if issubclass(annotation, datetime):
+        return lambda v: v if isinstance(v, datetime) else datetime.fromisoformat(v)
+    if issubclass(annotation, Enum):
+        return annotation
+    return None
+
+@lru_cache(maxsize=None)
+def _coercers(model: Type[BaseModel]) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """Per-model list of the fields that need converting from their stored form."""
+    coercers = []
+    for name, field in model.model_fields.items():
+        coercer = _coercer_for(field.annotation)
+        if coercer is not None:
+            coercers.append((name, coercer))
+    return tuple(coercers)
+
+def _construct(model: Type[R], item: dict) -> R:
+    """Build ``model`` from a trusted stored item without running validation."""
+    values = dict(item)
+    for name, coercer in _coercers(model):
+        value = values.get(name)
+        if value is not None:
+            values[name] = coercer(value)
+    return model.model_construct(**values)
+
+def _construct_many(model: Type[R], items: Iterable[dict]) -> List[R]:
+    """Build a page of ``model`` instances, resolving the field coercers once per batch."""
+    coercers = _coercers(model)
+    construct = model.model_construct
+    results = []
+    for item in items:
+        values = dict(item)
+        for name, coercer in coercers:
+            value = values.get(name)
+            if value is not None:
+                values[name] = coercer(value)
+        results.append(construct(**values))
+    return results
+
 class BaseDB(Generic[T, R]):
     """Base class for database operations."""
+    # Names the item in not-found messages, which the API returns as-is
+    entity_name = "Item"
     
     def __init__(self, table_name: str):
-        settings = get_settings()
-        self.dynamodb = boto3.resource(
-            'dynamodb',
-            endpoint_url=settings.DYNAMODB_ENDPOINT_URL,
-            region_name=settings.AWS_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+        self.dynamodb = get_item_resource()
+        self.table = get_table(table_name)
+        self.query_table = get_query_table(table_name)
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking boto3 call in a worker thread so it does not stall the event loop.
+
+        Every DynamoDB call goes through here, on the loop's default executor
+        (sized to the connection pool in the app lifespan). Unlike
+        ``asyncio.to_thread`` this skips copying the caller's context, which
+        boto3 calls never read.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def _iter_items(self, operation: Callable[..., Any], **kwargs: Any) -> AsyncIterator[dict]:
+        """Yield items from a table query or scan a page at a time, following LastEvaluatedKey."""
+        while True:
+            response = await self._run(operation, **kwargs)
+            for item in response.get('Items', []):
+                yield item
+            if 'LastEvaluatedKey' not in response:
+                return
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    async def _scan_all(self, table: Any = None) -> List[dict]:
+        """Scan a whole table with parallel segments and merge the results."""
+        table = table or self.query_table
+        total_segments = max(1, settings.DYNAMODB_SCAN_SEGMENTS)
+
+        async def scan_segment(segment: int) -> List[dict]:
+            return [
+                item async for item in self._iter_items(
+                    table.scan, Segment=segment, TotalSegments=total_segments
+                )
+            ]
+
+        segments = await asyncio.gather(*(scan_segment(segment) for segment in range(total_segments)))
+        return [item for segment in segments for item in segment]
+
+    @staticmethod
+    def _warehouse_totals_update(warehouse_id: Any, deltas: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the UpdateItem arguments that ADD ``deltas`` to a warehouse's running totals.
+
+        With no non-zero delta the update is a bare existence check on the warehouse.
+        """
+        names = [name for name, delta in deltas.items() if delta]
+        update = {
+            'Key': {'id': str(warehouse_id)},
+            'ConditionExpression': 'attribute_exists(id)'
+        }
+        if names:
+            update.update({
+                'UpdateExpression': 'ADD ' + ', '.join(f'#{name} :{name}' for name in names),
+                'ExpressionAttributeNames': {f'#{name}': name for name in names},
+                'ExpressionAttributeValues': {f':{name}': Decimal(str(deltas[name])) for name in names}
+            })
+        return update
+
+    async def _adjust_warehouse_totals(self, warehouse_id: Any, **deltas: Any) -> None:
+        """Atomically ADD ``deltas`` to the running capacity totals on a warehouse item."""
+        update = self._warehouse_totals_update(warehouse_id, deltas)
+        if 'UpdateExpression' not in update:
+            return
+        try:
+            await self._run(get_table(settings.WAREHOUSES_TABLE).update_item, **update)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+            raise DatabaseError(f"Failed to update warehouse totals: {str(e)}") from e
+
+    async def _put_with_warehouse_totals(
+        self, table: Any, item: dict, entity_name: str, **deltas: Any
+    ) -> None:
+        """Put a new ``item`` and ADD ``deltas`` to its warehouse's totals in one transaction.
+
+        Either both writes happen or neither does, so an unknown warehouse
+        leaves no item behind and a failed put leaves the totals untouched.
+        """
+        warehouse_id = item['warehouse_id']
+        update = self._warehouse_totals_update(warehouse_id, deltas)
+        warehouse_write = (
+            {'Update': {'TableName': settings.WAREHOUSES_TABLE, **update}}
+            if 'UpdateExpression' in update
+            else {'ConditionCheck': {'TableName': settings.WAREHOUSES_TABLE, **update}}
         )
-        self.table = self.dynamodb.Table(table_name)
+        try:
+            await self._transact_write([
+                {'Put': {
+                    'TableName': table.name,
+                    'Item': item,
+                    'ConditionExpression': 'attribute_not_exists(id)'
+                }},
+                warehouse_write
+            ])
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'TransactionCanceledException':
+                raise
+            reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+            if reasons[1:2] == ['ConditionalCheckFailed']:
+                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+            if reasons[:1] == ['ConditionalCheckFailed']:
+                raise ConflictError(f"{entity_name} already exists")
+            raise
 
     def _format_item(self, item_dict: dict) -> dict:
         """Format item for DynamoDB, converting Pydantic models to dicts and handling Decimals."""
         if hasattr(item_dict, 'model_dump'):
             item_dict = item_dict.model_dump()
-        
-        # Generate ID if not present
-        if 'id' not in item_dict:
-            item_dict['id'] = str(uuid4())
-        
-        # Convert all numeric values to Decimal
-        formatted_dict = {}
-        for key, value in item_dict.items():
-            if isinstance(value, (int, float)):
-                formatted_dict[key] = Decimal(str(value))
-            elif isinstance(value, dict):
-                formatted_dict[key] = self._format_item(value)
-            elif isinstance(value, list):
-                formatted_dict[key] = [self._format_item(i) if isinstance(i, dict) else i for i in value]
-            else:
-                formatted_dict[key] = value
-        
-        return formatted_dict
 
-    def _convert_to_response(self, item: dict) -> R:
-        """Convert a DynamoDB item to a response model."""
-        converted_item = {}
-        for key, value in item.items():
-            if isinstance(value, Decimal):
-                # Try to convert to int first if it's a whole number
-                if value % 1 == 0:
-                    converted_item[key] = int(value)
-                else:
-                    converted_item[key] = float(value)
-            elif isinstance(value, dict):
-                converted_item[key] = self._convert_decimal_to_number(value)
-            elif isinstance(value, list):
-                converted_item[key] = [
-                    self._convert_decimal_to_number(i) if isinstance(i, dict) else i 
-                    for i in value
-                ]
+        # Walk nested dicts and lists with an explicit stack instead of recursing
+        formatted_dict: dict = {}
+        stack = [(item_dict, formatted_dict)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                # Generate ID if not present
+                if 'id' not in source:
+                    source['id'] = str(uuid4())
+                items = source.items()
             else:
-                converted_item[key] = value
-        return self.response_model(**converted_item)
-
-    def _convert_decimal_to_number(self, d: dict) -> dict:
-        """Helper method to convert Decimal to number in nested dictionaries."""
-        result = {}
-        for key, value in d.items():
-            if isinstance(value, Decimal):
-                if value % 1 == 0:
-                    result[key] = int(value)
+                items = enumerate(source)
+            for key, value in items:
+                if isinstance(value, dict):
+                    child: Any = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    child = [None] * len(value)
+                    stack.append((value, child))
                 else:
-                    result[key] = float(value)
-            elif isinstance(value, dict):
-                result[key] = self._convert_decimal_to_number(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    self._convert_decimal_to_number(i) if isinstance(i, dict) else i 
-                    for i in value
-                ]
-            else:
-                result[key] = value
-        return result
+                    child = _to_dynamo_value(value)
+                target[key] = child
+
+        return formatted_dict
 
     async def create_item(self, item: T) -> R:
         """Create a new item in the database."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        item_dict = item.model_dump()
+        item_dict.update({
+            'id': str(uuid4()),
+            'created_at': timestamp,
+            'updated_at': timestamp
+        })
+        formatted_item = self._format_item(item_dict)
+        
         try:
-            timestamp = datetime.now(timezone.utc).isoformat()
-            item_dict = item.model_dump()
-            item_dict.update({
-                'id': str(uuid4()),
-                'created_at': timestamp,
-                'updated_at': timestamp
-            })
-            formatted_item = self._format_item(item_dict)
-            
-            try:
-                self.table.put_item(
-                    Item=formatted_item,
-                    ConditionExpression='attribute_not_exists(id)'
-                )
-                return self._convert_to_response(formatted_item)
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                    raise ConflictError("Item already exists")
-                raise DatabaseError(f"Failed to create item: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ConflictError, ValidationError, ItemNotFoundError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to create item: {str(e)}")
+            await self._run(self.table.put_item,
+                Item=formatted_item,
+                ConditionExpression='attribute_not_exists(id)'
+            )
+            return _construct(self.response_model, formatted_item)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise ConflictError("Item already exists")
+            raise DatabaseError(f"Failed to create item: {str(e)}") from e
+
+    async def get_item(
+        self,
+        id: str,
+        attributes: Optional[Iterable[str]] = None,
+        consistent: bool = False
+    ) -> R:
+        """Get an item by its ID, optionally fetching only ``attributes``.
 
-    async def get_item(self, id: str) -> R:
-        """Get an item by its ID."""
+        Reads are eventually consistent (half the read capacity) unless
+        ``consistent`` is set; only read-then-write paths that derive a write
+        from the value read need that (DAX passes them through to DynamoDB).
+        """
         try:
-            response = self.table.get_item(Key={'id': id})
+            if consistent:
+                response = await self._run(self.table.get_item,
+                    Key={'id': id}, ConsistentRead=True, **_projection(attributes)
+                )
+            else:
+                response = await self._run(self.table.get_item, Key={'id': id}, **_projection(attributes))
             if 'Item' not in response:
-                raise ItemNotFoundError(f"Item with id {id} not found")
-            return self._convert_to_response(response['Item'])
+                raise ItemNotFoundError(f"{self.entity_name} {id} not found")
+            return _construct(self.response_model, response['Item'])
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                raise ItemNotFoundError(f"Item with id {id} not found")
-            raise DatabaseError(f"Failed to get item: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ItemNotFoundError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to get item: {str(e)}")
+                raise ItemNotFoundError(f"{self.entity_name} {id} not found")
+            raise DatabaseError(f"Failed to get item: {str(e)}") from e
 
-    async def update_item(self, id: str, item: T) -> R:
-        """Update an item in the database."""
+    async def _apply_update(self, id: str, item: T, return_values: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """SET the fields ``item`` sets and return the stored values written and the ``return_values`` image."""
         try:
-            # First check if item exists
-            existing_item = await self.get_item(id)
-            
-            item_dict = item.model_dump(exclude_unset=True)
-            update_expr = []
-            expr_attr_values = {}
-            expr_attr_names = {}
-            
             # Always update updated_at timestamp
-            timestamp = datetime.now(timezone.utc).isoformat()
-            update_expr.append("#updated_at = :updated_at")
-            expr_attr_names["#updated_at"] = "updated_at"
-            expr_attr_values[":updated_at"] = timestamp
-            
-            for key, value in item_dict.items():
+            values = {'updated_at': datetime.now(timezone.utc).isoformat()}
+            for key, value in item.model_dump(exclude_unset=True).items():
                 if value is not None:
-                    update_expr.append(f"#{key} = :{key}")
-                    expr_attr_names[f"#{key}"] = key
-                    if isinstance(value, (int, float)):
-                        expr_attr_values[f":{key}"] = Decimal(str(value))
-                    else:
-                        expr_attr_values[f":{key}"] = value
-            
-            response = self.table.update_item(
+                    values[key] = _to_dynamo_value(value)
+
+            update_expression, attribute_names = _set_clause(tuple(values))
+            response = await self._run(self.table.update_item,
                 Key={'id': id},
-                UpdateExpression="SET " + ", ".join(update_expr),
-                ExpressionAttributeNames=expr_attr_names,
-                ExpressionAttributeValues=expr_attr_values,
-                ReturnValues="ALL_NEW"
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=dict(attribute_names),
+                ExpressionAttributeValues={f':{key}': value for key, value in values.items()},
+                ConditionExpression='attribute_exists(id)',
+                ReturnValues=return_values
             )
-            return self._convert_to_response(response['Attributes'])
+            return values, response['Attributes']
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                raise ItemNotFoundError(f"Item with id {id} not found")
+                raise ItemNotFoundError(f"{self.entity_name} {id} not found")
             elif e.response['Error']['Code'] == 'ValidationException':
                 raise ValidationError(str(e))
-            raise DatabaseError(f"Failed to update item: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ItemNotFoundError, ValidationError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to update item: {str(e)}")
+            raise DatabaseError(f"Failed to update item: {str(e)}") from e
 
-    async def delete_item(self, id: str) -> None:
-        """Delete an item by its ID."""
+    async def update_item(self, id: str, item: T) -> R:
+        """Update an item in the database."""
+        _, attributes = await self._apply_update(id, item, 'ALL_NEW')
+        return _construct(self.response_model, attributes)
+
+    async def _update_item_with_old(self, id: str, item: T) -> Tuple[R, R]:
+        """Update an item and return it as it was before and after the write.
+
+        The old image comes back from the update itself, so running totals
+        derived from the difference stay exact under concurrent writes.
+        """
+        values, old = await self._apply_update(id, item, 'ALL_OLD')
+        return _construct(self.response_model, old), _construct(self.response_model, {**old, **values})
+
+    async def _delete_item_with_old(self, id: str) -> Dict[str, Any]:
+        """Delete an item by its ID and return the item as stored."""
         try:
-            # First check if item exists
-            await self.get_item(id)
-            
-            self.table.delete_item(
+            response = await self._run(self.table.delete_item,
                 Key={'id': id},
-                ConditionExpression='attribute_exists(id)'
+                ConditionExpression='attribute_exists(id)',
+                ReturnValues='ALL_OLD'
             )
+            return response['Attributes']
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                raise ItemNotFoundError(f"Item with id {id} not found")
-            raise DatabaseError(f"Failed to delete item: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ItemNotFoundError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to delete item: {str(e)}")
+                raise ItemNotFoundError(f"{self.entity_name} {id} not found")
+            raise DatabaseError(f"Failed to delete item: {str(e)}") from e
+
+    async def delete_item(self, id: str) -> None:
+        """Delete an item by its ID."""
+        await self._delete_item_with_old(id)
 
-    async def list_items(self, skip: int = 0, limit: int = 10) -> List[R]:
-        """List items with pagination."""
+    async def list_items(
+        self,
+        cursor: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        attributes: Optional[Iterable[str]] = None
+    ) -> Tuple[List[R], Optional[Dict[str, Any]]]:
+        """List one page of items, optionally fetching only ``attributes``.
+
+        Returns the page and the ``LastEvaluatedKey`` to pass back as ``cursor``
+        for the next page, or None when there are no more items.
+        """
         try:
-            response = self.table.scan(
-                Limit=limit
-            )
+            scan_kwargs = {'Limit': limit, **_projection(attributes)}
+            if cursor:
+                scan_kwargs['ExclusiveStartKey'] = cursor
+            response = await self._run(self.query_table.scan, **scan_kwargs)
             items = response.get('Items', [])
-            return [self._convert_to_response(item) for item in items[skip:skip + limit]]
+            return _construct_many(self.response_model, items), response.get('LastEvaluatedKey')
         except ClientError as e:
-            raise DatabaseError(f"Failed to list items: {str(e)}")
-        except Exception as e:
-            if isinstance(e, DatabaseError):
-                raise
-            raise DatabaseError(f"Failed to list items: {str(e)}")
+            raise DatabaseError(f"Failed to list items: {str(e)}") from e
+
+    async def _batch_get_chunk(
+        self,
+        chunk: List[str],
+        table_name: Optional[str] = None,
+        attributes: Optional[Iterable[str]] = None
+    ) -> List[dict]:
+        """Fetch up to BATCH_GET_LIMIT items, retrying unprocessed keys with backoff."""
+        table_name = table_name or self.table.name
+        items = []
+        request = {table_name: {'Keys': [{'id': id} for id in chunk], **_projection(attributes)}}
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            response = await self._run(self.dynamodb.batch_get_item, RequestItems=request)
+            items.extend(response.get('Responses', {}).get(table_name, []))
+            request = response.get('UnprocessedKeys')
+            if not request:
+                return items
+            if attempt == BATCH_MAX_RETRIES:
+                raise DatabaseError("Failed to batch get items: unprocessed keys remain after retries")
+            await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+        return items
+
+    async def batch_get(self, ids: List[str]) -> List[R]:
+        """Get many items by ID using BatchGetItem; IDs that do not exist are skipped."""
+        # BatchGetItem rejects duplicate keys within a request
+        unique_ids = list(dict.fromkeys(ids))
+        try:
+            # Chunks are independent, so their requests go out concurrently
+            pages = await asyncio.gather(*(
+                self._batch_get_chunk(unique_ids[start:start + BATCH_GET_LIMIT])
+                for start in range(0, len(unique_ids), BATCH_GET_LIMIT)
+            ))
+            return _construct_many(self.response_model, (item for page in pages for item in page))
+        except ClientError as e:
+            raise DatabaseError(f"Failed to batch get items: {str(e)}") from e
+
+    async def _transact_write(self, operations: List[Dict[str, Any]]) -> None:
+        """Apply ``operations`` atomically in one TransactWriteItems call.
+
+        The resource's client carries boto3's DynamoDB type transformations, so
+        operations use plain Python values like the Table methods do.
+        """
+        if len(operations) > TRANSACT_WRITE_LIMIT:
+            raise ValidationError(f"A transaction can include at most {TRANSACT_WRITE_LIMIT} writes")
+        await self._run(self.dynamodb.meta.client.transact_write_items, TransactItems=operations)
+
+    def _write_batch(self, items: List[dict], table: Any = None) -> None:
+        """Blocking BatchWriteItem loop; run it through ``_run``."""
+        # batch_writer chunks into 25-item requests and resends unprocessed items
+        with (table or self.table).batch_writer() as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+    def _new_items(self, items: List[T]) -> List[dict]:
+        """Format ``items`` for storage, each with a fresh ID and one shared timestamp."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        formatted_items = []
+        for item in items:
+            item_dict = item.model_dump()
+            item_dict.update({
+                'id': str(uuid4()),
+                'created_at': timestamp,
+                'updated_at': timestamp
+            })
+            formatted_items.append(self._format_item(item_dict))
+        return formatted_items
+
+    async def batch_create(self, items: List[T]) -> List[R]:
+        """Create many items using BatchWriteItem.
+
+        Unlike ``create_item`` this does not guard against overwriting existing
+        IDs; every item gets a freshly generated one.
+        """
+        formatted_items = self._new_items(items)
+        try:
+            await self._run(self._write_batch, formatted_items)
+            return _construct_many(self.response_model, formatted_items)
+        except ClientError as e:
+            raise DatabaseError(f"Failed to batch create items: {str(e)}") from e
 
 class CustomerDB(BaseDB[CustomerCreate, CustomerResponse]):
     """Customer-specific database operations."""
     
+    entity_name = "Customer"
+
     def __init__(self):
-        settings = get_settings()
         super().__init__(settings.CUSTOMERS_TABLE)
         self.response_model = CustomerResponse
     
     async def get_by_email(self, email: str) -> CustomerResponse:
         """Get a customer by email using GSI."""
         try:
-            response = self.table.query(
+            response = await self._run(self.query_table.query,
                 IndexName='email-index',
-                KeyConditionExpression='email = :email',
-                ExpressionAttributeValues={':email': email}
+                KeyConditionExpression=_EMAIL_KEY.eq(email)
             )
             if not response['Items']:
                 raise ItemNotFoundError(f"Customer with email {email} not found")
-            return self._convert_to_response(response['Items'][0])
+            return _construct(self.response_model, response['Items'][0])
         except ClientError as e:
-            raise DatabaseError(f"Failed to get customer by email: {str(e)}")
+            raise DatabaseError(f"Failed to get customer by email: {str(e)}") from e
+
+    async def delete_item(self, id: str) -> None:
+        """Delete a customer and forget that it was seen to exist."""
+        _known_customers.pop(str(id))
+        await super().delete_item(id)
 
 class WarehouseDB(BaseDB[WarehouseCreate, WarehouseResponse]):
     """DynamoDB service for warehouse management."""
     
+    entity_name = "Warehouse"
+
     def __init__(self):
         super().__init__(settings.WAREHOUSES_TABLE)
-        self.customers_table = self.dynamodb.Table(settings.CUSTOMERS_TABLE)
+        self.customers_table = get_table(settings.CUSTOMERS_TABLE)
+        self.rooms_table = get_table(settings.ROOMS_TABLE)
+        self.inventory_table = get_table(settings.INVENTORY_TABLE)
         self.response_model = WarehouseResponse
 
+    async def _query_by_warehouse(
+        self, table: Any, warehouse_id: str, attributes: Optional[Iterable[str]] = None
+    ) -> List[dict]:
+        """Return every item on ``table`` that belongs to ``warehouse_id``."""
+        return [
+            item async for item in self._iter_items(
+                get_query_table(table.name).query,
+                IndexName=WAREHOUSE_ID_INDEX,
+                KeyConditionExpression=_WAREHOUSE_ID_KEY.eq(str(warehouse_id)),
+                **_projection(attributes)
+            )
+        ]
+
+    async def _iter_by_customer(self, customer_id: str) -> AsyncIterator[WarehouseResponse]:
+        """Yield the warehouses owned by ``customer_id`` a query page at a time."""
+        async for item in self._iter_items(
+            self.query_table.query,
+            IndexName='customer-id-index',
+            KeyConditionExpression=_CUSTOMER_ID_KEY.eq(str(customer_id))
+        ):
+            yield _construct(self.response_model, item)
+
+    async def _query_by_customer(self, customer_id: str) -> List[WarehouseResponse]:
+        """Return every warehouse owned by ``customer_id``."""
+        return [warehouse async for warehouse in self._iter_by_customer(customer_id)]
+
+    async def _customer_exists(self, customer_id: Any) -> bool:
+        """Check that a customer exists, trusting recent positive answers for a short TTL."""
+        customer_key = str(customer_id)
+        if _known_customers.get(customer_key):
+            return True
+        response = await self._run(self.customers_table.get_item,
+            Key={'id': customer_key},
+            **_projection(('id',))
+        )
+        if 'Item' not in response:
+            return False
+        _known_customers.set(customer_key, True)
+        return True
+
     async def create_item(self, warehouse_data: WarehouseCreate) -> WarehouseResponse:
         """Create a new warehouse."""
         try:
             # Verify customer exists
-            customer_response = self.customers_table.get_item(
-                Key={'id': str(warehouse_data.customer_id)}
-            )
-            if 'Item' not in customer_response:
-                raise ItemNotFoundError("Customer", warehouse_data.customer_id)
+            if not await self._customer_exists(warehouse_data.customer_id):
+                raise ItemNotFoundError(f"Customer {warehouse_data.customer_id} not found")
 
             warehouse_id = str(uuid.uuid4())
             warehouse_dict = warehouse_data.model_dump()
+            timestamp = datetime.now(timezone.utc).isoformat()
             warehouse_dict['id'] = warehouse_id
-            warehouse_dict['created_at'] = datetime.now(timezone.utc).isoformat()
-            warehouse_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
-            warehouse_dict['rooms'] = []
-            warehouse_dict['inventory'] = []
-
-            # Create initial rooms if provided
-            for room in warehouse_data.rooms:
-                room_dict = room.model_dump()
+            warehouse_dict['created_at'] = timestamp
+            warehouse_dict['updated_at'] = timestamp
+            warehouse_dict['available_capacity'] = warehouse_dict['total_capacity']
+            initial_rooms = warehouse_dict.pop('rooms')
+
+            # Rooms live in the rooms table, keyed back to the warehouse
+            rooms = []
+            for room in initial_rooms:
+                room_dict = dict(room)
                 room_dict['id'] = str(uuid.uuid4())
                 room_dict['warehouse_id'] = warehouse_id
-                room_dict['created_at'] = warehouse_dict['created_at']
-                room_dict['updated_at'] = warehouse_dict['updated_at']
+                room_dict['created_at'] = timestamp
+                room_dict['updated_at'] = timestamp
                 room_dict['current_utilization'] = Decimal('0.00')
+                room_dict['available_capacity'] = room_dict['capacity']
                 room_dict['status'] = RoomStatus.ACTIVE
-                warehouse_dict['rooms'].append(room_dict)
+                rooms.append(self._format_item(room_dict))
 
-            self.table.put_item(
-                Item=warehouse_dict,
-                ConditionExpression='attribute_not_exists(id)'
-            )
-            return WarehouseResponse(**warehouse_dict)
+            # Running totals kept current by room and inventory writes. The
+            # declared total_capacity is left as given; rooms_volume is the
+            # volume of the active rooms, the base that later room writes ADD to
+            warehouse_dict['rooms_volume'] = sum((RoomDB._counted_volume(room) for room in rooms), Decimal('0'))
+            warehouse_dict['rooms_capacity'] = sum((room['capacity'] for room in rooms), Decimal('0'))
+            warehouse_dict['used_capacity'] = Decimal('0')
+
+            # The warehouse and its initial rooms are written all-or-nothing
+            await self._transact_write([
+                {'Put': {
+                    'TableName': table.name,
+                    'Item': item,
+                    'ConditionExpression': 'attribute_not_exists(id)'
+                }}
+                for table, item in [(self.table, self._format_item(warehouse_dict))]
+                + [(self.rooms_table, room) for room in rooms]
+            ])
+            warehouse_dict['rooms'] = rooms
+            return _construct(self.response_model, warehouse_dict)
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            if e.response['Error']['Code'] in ('ConditionalCheckFailedException', 'TransactionCanceledException'):
                 raise ConflictError("Warehouse", warehouse_id)
-            raise DatabaseError(f"Failed to create warehouse: {str(e)}")
+            raise DatabaseError(f"Failed to create warehouse: {str(e)}") from e
 
     async def list_by_customer(self, customer_id: str) -> List[WarehouseResponse]:
         """List warehouses for a specific customer."""
         try:
-            response = self.table.query(
-                IndexName='customer-id-index',
-                KeyConditionExpression='customer_id = :customer_id',
-                ExpressionAttributeValues={':customer_id': customer_id}
+            return await self._query_by_customer(customer_id)
+        except ClientError as e:
+            raise DatabaseError(f"Failed to list warehouses: {str(e)}") from e
+
+    async def iter_by_customer(self, customer_id: str) -> AsyncIterator[WarehouseResponse]:
+        """Stream warehouses for a specific customer without collecting them first."""
+        try:
+            async for warehouse in self._iter_by_customer(customer_id):
+                yield warehouse
+        except ClientError as e:
+            raise DatabaseError(f"Failed to list warehouses: {str(e)}") from e
+
+    async def warehouse_exists(self, warehouse_id: Any) -> bool:
+        """Check that a warehouse exists by fetching only its key."""
+        try:
+            response = await self._run(self.table.get_item,
+                Key={'id': str(warehouse_id)},
+                **_projection(('id',))
             )
-            return [WarehouseResponse(**item) for item in response['Items']]
+            return 'Item' in response
         except ClientError as e:
-            raise DatabaseError(f"Failed to list warehouses: {str(e)}")
+            raise DatabaseError(f"Failed to get warehouse: {str(e)}") from e
+
+    async def get_warehouse(self, warehouse_id: UUID) -> WarehouseResponse:
+        """Get a warehouse by ID together with its rooms.
 
-    async def get_warehouse(self, warehouse_id: UUID) -> Optional[WarehouseResponse]:
-        """Get a warehouse by ID."""
+        The warehouse item and its rooms live in separate tables, so both reads
+        are issued at once and the detail costs one round trip of wall time.
+        """
         try:
-            response = self.table.get_item(
-                Key={'id': str(warehouse_id)}
+            response, rooms = await asyncio.gather(
+                self._run(self.table.get_item, Key={'id': str(warehouse_id)}),
+                self._query_by_warehouse(self.rooms_table, warehouse_id)
             )
             if 'Item' not in response:
                 raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
-            return WarehouseResponse(**response['Item'])
+            return _construct(self.response_model, {**response['Item'], 'rooms': rooms})
         except ClientError as e:
-            raise DatabaseError(f"Failed to get warehouse: {str(e)}")
+            raise DatabaseError(f"Failed to get warehouse: {str(e)}") from e
 
     async def update_warehouse(self, warehouse_id: str, update_data: Dict[str, Any]) -> WarehouseResponse:
         """Update warehouse details."""
@@ -345,236 +732,218 @@ class WarehouseDB(BaseDB[WarehouseCreate, WarehouseResponse]):
                 raise ValidationError("No valid fields to update")
 
             update_dict['updated_at'] = datetime.now(timezone.utc).isoformat()
-            
-            update_expr = []
-            expr_names = {}
-            expr_values = {}
-            
-            for key, value in update_dict.items():
-                update_expr.append(f"#{key} = :{key}")
-                expr_names[f"#{key}"] = key
-                expr_values[f":{key}"] = value
 
-            response = self.table.update_item(
+            update_expression, attribute_names = _set_clause(tuple(update_dict))
+            response = await self._run(self.table.update_item,
                 Key={'id': str(warehouse_id)},
-                UpdateExpression=f"SET {', '.join(update_expr)}",
-                ExpressionAttributeNames=expr_names,
-                ExpressionAttributeValues=expr_values,
+                UpdateExpression=update_expression,
+                ExpressionAttributeNames=dict(attribute_names),
+                ExpressionAttributeValues={f':{key}': value for key, value in update_dict.items()},
                 ReturnValues="ALL_NEW",
                 ConditionExpression='attribute_exists(id)'
             )
             
-            return WarehouseResponse(**response['Attributes'])
+            return _construct(self.response_model, response['Attributes'])
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                raise ItemNotFoundError("Warehouse", warehouse_id)
-            raise DatabaseError(f"Failed to update warehouse: {str(e)}")
+                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+            raise DatabaseError(f"Failed to update warehouse: {str(e)}") from e
 
     async def delete_warehouse(self, warehouse_id: str) -> None:
         """Delete a warehouse."""
         try:
-            self.table.delete_item(
+            await self._run(self.table.delete_item,
                 Key={'id': str(warehouse_id)},
                 ConditionExpression='attribute_exists(id)'
             )
         except ClientError as e:
             if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                raise ItemNotFoundError("Warehouse", warehouse_id)
-            raise DatabaseError(f"Failed to delete warehouse: {str(e)}")
+                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+            raise DatabaseError(f"Failed to delete warehouse: {str(e)}") from e
 
     async def list_warehouses(self, customer_id: Optional[str] = None) -> List[WarehouseResponse]:
         """List all warehouses, optionally filtered by customer."""
         try:
             if customer_id:
-                response = self.table.query(
-                    IndexName='customer-id-index',
-                    KeyConditionExpression='customer_id = :customer_id',
-                    ExpressionAttributeValues={':customer_id': str(customer_id)}
-                )
-            else:
-                response = self.table.scan()
-            
-            return [WarehouseResponse(**item) for item in response.get('Items', [])]
+                return await self._query_by_customer(customer_id)
+            return _construct_many(self.response_model, await self._scan_all())
         except ClientError as e:
-            raise DatabaseError(f"Failed to list warehouses: {str(e)}")
+            raise DatabaseError(f"Failed to list warehouses: {str(e)}") from e
 
     async def calculate_warehouse_utilization(self, warehouse_id: str) -> Dict[str, Decimal]:
         """Calculate warehouse utilization metrics."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
-            total_capacity = sum(
-                Decimal(str(room['max_weight_capacity']))
-                for room in warehouse.rooms
-                if room['status'] == RoomStatus.ACTIVE
-            )
-            used_capacity = sum(
-                Decimal(str(item['quantity']))
-                for item in warehouse.inventory
-            )
+            availability = await self.check_availability(warehouse_id)
+            total_capacity = availability['total_capacity']
+            used_capacity = availability['used_capacity']
             utilization = (used_capacity / total_capacity * Decimal('100')) if total_capacity > 0 else Decimal('0')
             
             return {
                 'total_capacity': total_capacity,
                 'used_capacity': used_capacity,
                 'utilization_percentage': utilization,
-                'available_capacity': total_capacity - used_capacity
+                'available_capacity': availability['available_capacity']
             }
         except ClientError as e:
-            raise DatabaseError(f"Failed to calculate utilization: {str(e)}")
+            raise DatabaseError(f"Failed to calculate utilization: {str(e)}") from e
 
     async def get_by_customer(self, customer_id: str) -> List[WarehouseResponse]:
         """Get all warehouses for a customer."""
         try:
-            response = self.table.query(
-                IndexName='customer-id-index',
-                KeyConditionExpression='customer_id = :customer_id',
-                ExpressionAttributeValues={':customer_id': str(customer_id)}
-            )
-            return [WarehouseResponse(**item) for item in response.get('Items', [])]
+            return await self._query_by_customer(customer_id)
         except ClientError as e:
-            raise DatabaseError(f"Failed to get warehouses by customer: {str(e)}")
+            raise DatabaseError(f"Failed to get warehouses by customer: {str(e)}") from e
     
     async def check_availability(self, warehouse_id: str) -> Dict[str, Any]:
-        """Check warehouse availability and capacity."""
+        """Check warehouse availability from its running capacity totals."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
-            total_capacity = sum(room.max_weight_capacity for room in warehouse.rooms if room.status == RoomStatus.ACTIVE)
-            used_capacity = sum(
-                item['quantity']
-                for item in warehouse.inventory
+            response = await self._run(self.table.get_item,
+                Key={'id': str(warehouse_id)},
+                **_projection(('rooms_capacity', 'used_capacity'))
+            )
+            if 'Item' not in response:
+                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+            item = response['Item']
+            return self._availability(
+                item.get('rooms_capacity', Decimal('0')),
+                item.get('used_capacity', Decimal('0'))
             )
-            available = total_capacity > used_capacity
-            return {
-                'available': available,
-                'total_capacity': total_capacity,
-                'used_capacity': used_capacity,
-                'available_capacity': total_capacity - used_capacity
-            }
         except ClientError as e:
-            raise DatabaseError(f"Failed to check availability: {str(e)}")
+            raise DatabaseError(f"Failed to check availability: {str(e)}") from e
+
+    @staticmethod
+    def _availability(total_capacity: Decimal, used_capacity: Decimal) -> Dict[str, Any]:
+        """Build the availability summary for a warehouse's capacity totals."""
+        return {
+            'available': total_capacity > used_capacity,
+            'total_capacity': total_capacity,
+            'used_capacity': used_capacity,
+            'available_capacity': total_capacity - used_capacity
+        }
 
     async def create_room(self, warehouse_id: str, room_data: RoomBase) -> dict:
         """Create a new room in a warehouse."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
+            timestamp = datetime.now(timezone.utc).isoformat()
             room_dict = room_data.model_dump()
             room_dict['id'] = str(uuid.uuid4())
-            room_dict['warehouse_id'] = warehouse_id
-            room_dict['created_at'] = datetime.utcnow().isoformat()
-            room_dict['updated_at'] = datetime.utcnow().isoformat()
+            room_dict['warehouse_id'] = str(warehouse_id)
+            room_dict['created_at'] = timestamp
+            room_dict['updated_at'] = timestamp
             room_dict['current_utilization'] = Decimal('0.00')
             room_dict['status'] = RoomStatus.ACTIVE
+            room_item = self._format_item(room_dict)
 
-            rooms = warehouse.rooms
-            rooms.append(room_dict)
-            await self.update_warehouse(warehouse_id, {'rooms': rooms})
-            return room_dict
+            # Also verifies the warehouse exists
+            await self._put_with_warehouse_totals(
+                self.rooms_table, room_item, "Room", rooms_capacity=room_item['capacity']
+            )
+            return room_item
         except ClientError as e:
-            raise DatabaseError(f"Failed to create room: {str(e)}")
+            raise DatabaseError(f"Failed to create room: {str(e)}") from e
 
-    async def get_rooms(self, warehouse_id: str) -> List[dict]:
-        """Get all rooms in a warehouse."""
+    async def get_rooms(self, warehouse_id: str, attributes: Optional[Iterable[str]] = None) -> List[dict]:
+        """Get all rooms in a warehouse, optionally fetching only ``attributes``."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
-            return warehouse.rooms
+            return await self._query_by_warehouse(self.rooms_table, warehouse_id, attributes)
         except ClientError as e:
-            raise DatabaseError(f"Failed to get rooms: {str(e)}")
+            raise DatabaseError(f"Failed to get rooms: {str(e)}") from e
+
+    async def adjust_capacity(self, warehouse_id: str, delta: Decimal) -> None:
+        """Atomically add ``delta`` (possibly negative) to a warehouse's room volume total."""
+        await self._adjust_warehouse_totals(warehouse_id, rooms_volume=delta)
 
     async def add_inventory(self, warehouse_id: str, inventory_data: dict) -> dict:
         """Add inventory to a warehouse."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
             availability = await self.check_availability(warehouse_id)
             
             if inventory_data.get('quantity', 0) > availability['available_capacity']:
                 raise CapacityError(f"Insufficient capacity. Available: {availability['available_capacity']}, Requested: {inventory_data.get('quantity')}")
             
-            inventory_id = str(uuid.uuid4())
-            inventory = {
-                'id': inventory_id,
-                'warehouse_id': warehouse_id,
+            timestamp = datetime.now(timezone.utc).isoformat()
+            inventory = self._format_item({
+                'id': str(uuid.uuid4()),
+                'warehouse_id': str(warehouse_id),
                 'product_id': inventory_data.get('product_id'),
                 'quantity': inventory_data.get('quantity'),
                 'unit': inventory_data.get('unit'),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
-            }
+                'created_at': timestamp,
+                'updated_at': timestamp
+            })
 
-            inventory_items = warehouse.inventory
-            inventory_items.append(inventory)
-            await self.update_warehouse(warehouse_id, {'inventory': inventory_items})
+            await self._put_with_warehouse_totals(
+                self.inventory_table, inventory, "Inventory", used_capacity=inventory.get('quantity')
+            )
             return inventory
         except ClientError as e:
-            raise DatabaseError(f"Failed to add inventory: {str(e)}")
+            raise DatabaseError(f"Failed to add inventory: {str(e)}") from e
 
     async def get_inventory(self, warehouse_id: str) -> List[dict]:
         """Get all inventory in a warehouse."""
         try:
-            warehouse = await self.get_warehouse(warehouse_id)
-            return warehouse.inventory
+            return await self._query_by_warehouse(self.inventory_table, warehouse_id)
         except ClientError as e:
-            raise DatabaseError(f"Failed to get inventory: {str(e)}")
+            raise DatabaseError(f"Failed to get inventory: {str(e)}") from e
 
     async def create_customer(self, customer_data: CustomerCreate) -> dict:
         """Create a new customer."""
         try:
+            timestamp = datetime.now(timezone.utc).isoformat()
             customer_dict = customer_data.model_dump()
             customer_dict['id'] = str(uuid.uuid4())
-            customer_dict['created_at'] = datetime.utcnow().isoformat()
-            customer_dict['updated_at'] = datetime.utcnow().isoformat()
+            customer_dict['created_at'] = timestamp
+            customer_dict['updated_at'] = timestamp
             await self.create_item(customer_dict)
             return customer_dict
         except ClientError as e:
-            raise DatabaseError(f"Failed to create customer: {str(e)}")
+            raise DatabaseError(f"Failed to create customer: {str(e)}") from e
 
     async def verify_customer(self, customer_id: str, verification_data: dict) -> dict:
         """Verify a customer."""
         try:
-            verification_data['verified_at'] = datetime.utcnow().isoformat()
+            verification_data['verified_at'] = datetime.now(timezone.utc).isoformat()
             return await self.update_item(customer_id, verification_data)
         except ClientError as e:
-            raise DatabaseError(f"Failed to verify customer: {str(e)}")
+            raise DatabaseError(f"Failed to verify customer: {str(e)}") from e
 
 class RoomDB(BaseDB[RoomCreate, RoomResponse]):
     """Room-specific database operations."""
     
+    entity_name = "Room"
+
     def __init__(self):
-        settings = get_settings()
         super().__init__(settings.ROOMS_TABLE)
         self.response_model = RoomResponse
     
     async def create_room(self, room: RoomCreate) -> RoomResponse:
         """Create a new room."""
+        # Add status if not provided
+        if not hasattr(room, 'status'):
+            room.status = RoomStatus.AVAILABLE
+        
+        # Add timestamps
+        timestamp = datetime.now(timezone.utc).isoformat()
+        room_dict = room.model_dump()
+        room_dict.update({
+            'id': str(uuid4()),
+            'created_at': timestamp,
+            'updated_at': timestamp
+        })
+        
+        formatted_room = self._format_item(room_dict)
+        # Only active rooms count towards the warehouse's capacity
+        active = formatted_room.get('status') == RoomStatus.ACTIVE
+        
         try:
-            # Add status if not provided
-            if not hasattr(room, 'status'):
-                room.status = RoomStatus.AVAILABLE
-            
-            # Add timestamps
-            timestamp = datetime.now(timezone.utc).isoformat()
-            room_dict = room.model_dump()
-            room_dict.update({
-                'id': str(uuid4()),
-                'created_at': timestamp,
-                'updated_at': timestamp
-            })
-            
-            formatted_room = self._format_item(room_dict)
-            
-            try:
-                self.table.put_item(
-                    Item=formatted_room,
-                    ConditionExpression='attribute_not_exists(id)'
-                )
-                return self._convert_to_response(formatted_room)
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                    raise ConflictError("Room already exists")
-                raise DatabaseError(f"Failed to create room: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ConflictError, ValidationError, ItemNotFoundError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to create room: {str(e)}")
+            await self._put_with_warehouse_totals(
+                self.table, formatted_room, self.entity_name,
+                rooms_capacity=formatted_room['capacity'] if active else 0,
+                rooms_volume=self._counted_volume(formatted_room)
+            )
+            return _construct(self.response_model, formatted_room)
+        except ClientError as e:
+            raise DatabaseError(f"Failed to create room: {str(e)}") from e
 
     async def get_room(self, room_id: str) -> RoomResponse:
         """Get a room by its ID."""
@@ -582,31 +951,54 @@ class RoomDB(BaseDB[RoomCreate, RoomResponse]):
 
     async def update_room(self, room_id: str, update_data: RoomUpdate) -> RoomResponse:
         """Update a room."""
-        return await self.update_item(room_id, update_data)
+        before, room = await self._update_item_with_old(room_id, update_data)
+        await self._adjust_warehouse_totals(
+            room.warehouse_id,
+            rooms_capacity=self._counted_capacity(room) - self._counted_capacity(before),
+            rooms_volume=self._counted_volume(room) - self._counted_volume(before)
+        )
+        return room
+
+    @staticmethod
+    def _counted_capacity(room: RoomResponse) -> Decimal:
+        """Return the capacity a room adds to its warehouse's total; only active rooms count."""
+        return room.capacity if room.status == RoomStatus.ACTIVE else Decimal(0)
+
+    @staticmethod
+    def _counted_volume(room: Union[RoomResponse, Dict[str, Any]]) -> Decimal:
+        """Return the volume a room adds to its warehouse's total; only active rooms count."""
+        status, dimensions = (
+            (room.get('status'), room['dimensions']) if isinstance(room, dict) else (room.status, room.dimensions)
+        )
+        if status != RoomStatus.ACTIVE:
+            return Decimal(0)
+        if not isinstance(dimensions, dict):
+            dimensions = dimensions.model_dump()
+        return dimensions['length'] * dimensions['width'] * dimensions['height']
 
     async def delete_room(self, room_id: str) -> None:
         """Delete a room."""
-        await self.delete_item(room_id)
+        room = _construct(self.response_model, await self._delete_item_with_old(room_id))
+        await self._adjust_warehouse_totals(
+            room.warehouse_id,
+            rooms_capacity=-self._counted_capacity(room),
+            rooms_volume=-self._counted_volume(room)
+        )
 
     async def list_rooms(self, warehouse_id: Optional[str] = None) -> List[RoomResponse]:
         """List rooms, optionally filtered by warehouse ID."""
         try:
             if warehouse_id:
-                response = self.table.query(
-                    IndexName='warehouse_id-index',
-                    KeyConditionExpression=Key('warehouse_id').eq(warehouse_id)
+                response = await self._run(self.query_table.query,
+                    IndexName=WAREHOUSE_ID_INDEX,
+                    KeyConditionExpression=_WAREHOUSE_ID_KEY.eq(warehouse_id)
                 )
+                items = response.get('Items', [])
             else:
-                response = self.table.scan()
-            
-            items = response.get('Items', [])
-            return [self._convert_to_response(item) for item in items]
+                items = await self._scan_all()
+            return _construct_many(self.response_model, items)
         except ClientError as e:
-            raise DatabaseError(f"Failed to list rooms: {str(e)}")
-        except Exception as e:
-            if isinstance(e, DatabaseError):
-                raise
-            raise DatabaseError(f"Failed to list rooms: {str(e)}")
+            raise DatabaseError(f"Failed to list rooms: {str(e)}") from e
 
     async def get_room_conditions(self, room_id: str) -> Dict[str, Any]:
         """Get current conditions of a room."""
@@ -620,39 +1012,133 @@ class RoomDB(BaseDB[RoomCreate, RoomResponse]):
 class InventoryDB(BaseDB[InventoryCreate, InventoryResponse]):
     """Inventory-specific database operations."""
     
+    entity_name = "Inventory"
+
     def __init__(self):
-        settings = get_settings()
         super().__init__(settings.INVENTORY_TABLE)
         self.response_model = InventoryResponse
+        self._searches = SingleFlight()
     
     async def create_inventory(self, inventory: InventoryCreate) -> InventoryResponse:
         """Create a new inventory item."""
+        # Add timestamps
+        timestamp = datetime.now(timezone.utc).isoformat()
+        inventory_dict = inventory.model_dump()
+        inventory_dict.update({
+            'id': str(uuid4()),
+            'created_at': timestamp,
+            'updated_at': timestamp
+        })
+        
+        formatted_inventory = self._format_item(inventory_dict)
+        
         try:
-            # Add timestamps
-            timestamp = datetime.now(timezone.utc).isoformat()
-            inventory_dict = inventory.model_dump()
-            inventory_dict.update({
-                'id': str(uuid4()),
-                'created_at': timestamp,
-                'updated_at': timestamp
-            })
-            
-            formatted_inventory = self._format_item(inventory_dict)
-            
+            await self._put_with_warehouse_totals(
+                self.table, formatted_inventory, "Inventory item", used_capacity=formatted_inventory['quantity']
+            )
+            return _construct(self.response_model, formatted_inventory)
+        except ClientError as e:
+            raise DatabaseError(f"Failed to create inventory: {str(e)}") from e
+
+    async def batch_create_inventory(self, items: List[InventoryCreate]) -> List[InventoryResponse]:
+        """Create many inventory items, each chunk in one transaction with its warehouse totals.
+
+        Every room and warehouse is checked with BatchGetItem before anything
+        is written. Items are then packed into chunks of at most
+        TRANSACT_WRITE_LIMIT operations: their Puts plus one ``used_capacity``
+        ADD per warehouse, so the totals always match the stored items. Chunks
+        commit in order; if a later one fails, the earlier ones stay written
+        and the error says how many items were stored.
+        """
+        formatted_items = self._new_items(items)
+        await self._check_rooms(formatted_items)
+
+        chunks: List[Tuple[List[dict], Dict[str, Decimal]]] = []
+        puts: List[dict] = []
+        added: Dict[str, Decimal] = {}
+        for item in formatted_items:
+            warehouse_id = item['warehouse_id']
+            if len(puts) + len(added) + 1 + (warehouse_id not in added) > TRANSACT_WRITE_LIMIT:
+                chunks.append((puts, added))
+                puts, added = [], {}
+            puts.append(item)
+            added[warehouse_id] = added.get(warehouse_id, Decimal(0)) + item['quantity']
+        chunks.append((puts, added))
+
+        stored = 0
+        for puts, added in chunks:
             try:
-                self.table.put_item(
-                    Item=formatted_inventory,
-                    ConditionExpression='attribute_not_exists(id)'
-                )
-                return self._convert_to_response(formatted_inventory)
+                await self._transact_write([
+                    *(
+                        {'Put': {
+                            'TableName': self.table.name,
+                            'Item': item,
+                            'ConditionExpression': 'attribute_not_exists(id)'
+                        }}
+                        for item in puts
+                    ),
+                    *(
+                        {'Update': {
+                            'TableName': settings.WAREHOUSES_TABLE,
+                            **self._warehouse_totals_update(warehouse_id, {'used_capacity': quantity})
+                        }}
+                        for warehouse_id, quantity in added.items()
+                    )
+                ])
             except ClientError as e:
-                if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
-                    raise ConflictError("Inventory item already exists")
-                raise DatabaseError(f"Failed to create inventory: {str(e)}")
-        except Exception as e:
-            if isinstance(e, (ConflictError, ValidationError, ItemNotFoundError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to create inventory: {str(e)}")
+                reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+                if 'ConditionalCheckFailed' in reasons[len(puts):] and not stored:
+                    missing = list(added)[reasons[len(puts):].index('ConditionalCheckFailed')]
+                    raise ItemNotFoundError(f"Warehouse {missing} not found")
+                raise DatabaseError(
+                    f"Failed to create inventory after storing the first {stored} of {len(formatted_items)} items: {str(e)}"
+                ) from e
+            stored += len(puts)
+        return _construct_many(self.response_model, formatted_items)
+
+    async def _check_rooms(self, items: List[dict]) -> None:
+        """Raise unless every item's warehouse exists and its room exists in that warehouse."""
+        room_ids = list(dict.fromkeys(item['room_id'] for item in items))
+        warehouse_ids = list(dict.fromkeys(item['warehouse_id'] for item in items))
+        try:
+            room_pages, warehouse_pages = await asyncio.gather(*(
+                asyncio.gather(*(
+                    self._batch_get_chunk(ids[start:start + BATCH_GET_LIMIT], table_name, attributes)
+                    for start in range(0, len(ids), BATCH_GET_LIMIT)
+                ))
+                for ids, table_name, attributes in (
+                    (room_ids, settings.ROOMS_TABLE, ('id', 'warehouse_id')),
+                    (warehouse_ids, settings.WAREHOUSES_TABLE, ('id',))
+                )
+            ))
+        except ClientError as e:
+            raise DatabaseError(f"Failed to check rooms and warehouses: {str(e)}") from e
+        found = {item['id'] for page in warehouse_pages for item in page}
+        missing = [warehouse_id for warehouse_id in warehouse_ids if warehouse_id not in found]
+        if missing:
+            raise ItemNotFoundError(f"Warehouse {missing[0]} not found")
+        rooms = {room['id']: room['warehouse_id'] for page in room_pages for room in page}
+        for item in items:
+            if item['room_id'] not in rooms:
+                raise ItemNotFoundError(f"Room {item['room_id']} not found")
+            if rooms[item['room_id']] != item['warehouse_id']:
+                raise ValidationError(f"Room {item['room_id']} does not belong to warehouse {item['warehouse_id']}")
+
+    async def list_by_warehouse(
+        self, warehouse_id: str, attributes: Optional[Iterable[str]] = None
+    ) -> List[dict]:
+        """Return the raw inventory items stored in a warehouse, optionally only ``attributes``."""
+        try:
+            return [
+                item async for item in self._iter_items(
+                    self.query_table.query,
+                    IndexName=WAREHOUSE_ID_INDEX,
+                    KeyConditionExpression=_WAREHOUSE_ID_KEY.eq(str(warehouse_id)),
+                    **_projection(attributes)
+                )
+            ]
+        except ClientError as e:
+            raise DatabaseError(f"Failed to list inventory: {str(e)}") from e
 
     async def get_inventory(self, inventory_id: str) -> InventoryResponse:
         """Get an inventory item by its ID."""
@@ -660,70 +1146,144 @@ class InventoryDB(BaseDB[InventoryCreate, InventoryResponse]):
 
     async def update_inventory(self, inventory_id: str, update_data: InventoryUpdate) -> InventoryResponse:
         """Update an inventory item."""
-        return await self.update_item(inventory_id, update_data)
+        before, inventory = await self._update_item_with_old(inventory_id, update_data)
+        await self._adjust_warehouse_totals(
+            inventory.warehouse_id, used_capacity=inventory.quantity - before.quantity
+        )
+        return inventory
 
     async def delete_inventory(self, inventory_id: str) -> None:
         """Delete an inventory item."""
-        await self.delete_item(inventory_id)
+        inventory = _construct(self.response_model, await self._delete_item_with_old(inventory_id))
+        await self._adjust_warehouse_totals(inventory.warehouse_id, used_capacity=-inventory.quantity)
 
-    async def transfer_inventory(self, inventory_id: str, transfer_data: dict) -> InventoryResponse:
+    async def transfer_inventory(self, inventory_id: str, transfer_data: InventoryTransfer) -> InventoryResponse:
         """Transfer inventory from one room to another."""
         try:
-            inventory = await self.get_inventory(inventory_id)
-            
-            # Update the room_id and add transfer record
-            update_data = InventoryUpdate(
-                room_id=transfer_data['target_room_id'],
-                transfer_history=[{
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
-                    'from_room_id': inventory.room_id,
-                    'to_room_id': transfer_data['target_room_id'],
-                    'quantity': inventory.quantity
-                }]
-            )
-            
-            return await self.update_inventory(inventory_id, update_data)
-        except Exception as e:
-            if isinstance(e, (ItemNotFoundError, ValidationError, DatabaseError)):
-                raise
-            raise DatabaseError(f"Failed to transfer inventory: {str(e)}")
+            inventory = await self.get_item(inventory_id, attributes=('room_id', 'quantity'), consistent=True)
+            from_room_id = str(inventory.room_id)
+            to_room_id = str(transfer_data.target_room_id)
+            timestamp = datetime.now(timezone.utc).isoformat()
+            record = {
+                'timestamp': timestamp,
+                'from_room_id': from_room_id,
+                'to_room_id': to_room_id,
+                'quantity': inventory.quantity
+            }
+
+            # Move the item and append its transfer record only if the target room
+            # exists and nobody moved the item since it was read
+            await self._transact_write([
+                {'ConditionCheck': {
+                    'TableName': settings.ROOMS_TABLE,
+                    'Key': {'id': to_room_id},
+                    'ConditionExpression': 'attribute_exists(id)'
+                }},
+                {'Update': {
+                    'TableName': self.table.name,
+                    'Key': {'id': inventory_id},
+                    'UpdateExpression': (
+                        'SET room_id = :to_room_id, updated_at = :updated_at, '
+                        'transfer_history = list_append(if_not_exists(transfer_history, :empty), :record)'
+                    ),
+                    'ConditionExpression': 'room_id = :from_room_id',
+                    'ExpressionAttributeValues': {
+                        ':to_room_id': to_room_id,
+                        ':from_room_id': from_room_id,
+                        ':updated_at': timestamp,
+                        ':empty': [],
+                        ':record': [record]
+                    }
+                }}
+            ])
+            return await self.get_item(inventory_id, consistent=True)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                raise ConflictError("Target room does not exist or the item was moved concurrently")
+            raise DatabaseError(f"Failed to transfer inventory: {str(e)}") from e
+
+    async def get_inventory_history(
+        self,
+        inventory_id: str,
+        after: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """Get one page of an inventory item's transfer history, oldest first.
 
-    async def get_inventory_history(self, inventory_id: str) -> List[dict]:
-        """Get transfer history of an inventory item."""
-        inventory = await self.get_inventory(inventory_id)
-        return inventory.transfer_history if hasattr(inventory, 'transfer_history') else []
+        Only the history attribute is read. Records are appended in time order,
+        so the page starts right after ``after`` (pass the last timestamp seen
+        to fetch the next page) and holds at most ``limit`` records.
+        """
+        inventory = await self.get_item(inventory_id, attributes=('id', 'transfer_history'))
+        history = getattr(inventory, 'transfer_history', None) or []
+        start = 0
+        if after is not None:
+            if after.tzinfo is None:
+                after = after.replace(tzinfo=timezone.utc)
+            start = bisect_right(history, after, key=lambda record: datetime.fromisoformat(record['timestamp']))
+        return history[start:] if limit is None else history[start:start + limit]
 
     async def search_inventory(
         self,
         sku: Optional[str] = None,
-        warehouse_id: Optional[UUID] = None
-    ) -> List[InventoryResponse]:
-        """Search inventory items by SKU and/or warehouse ID."""
+        warehouse_id: Optional[UUID] = None,
+        limit: int = 50,
+        cursor: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[InventoryListItem], Optional[Dict[str, Any]]]:
+        """Search one page of inventory by SKU and/or warehouse ID.
+
+        Returns the page and the ``LastEvaluatedKey`` to pass back as ``cursor``.
+        Concurrent identical first-page searches share a single query.
+        """
+        if not sku and not warehouse_id:
+            raise ValidationError("Provide a SKU or warehouse ID to search inventory")
+        if cursor is None:
+            key = (sku, str(warehouse_id) if warehouse_id else None, limit)
+            return await self._searches.run(key, partial(self._search_page, sku, warehouse_id, limit, cursor))
+        return await self._search_page(sku, warehouse_id, limit, cursor)
+
+    async def search_by_sku(self, sku: str) -> List[InventoryListItem]:
+        """Return all inventory with ``sku``, following every page.
+
+        Concurrent callers share the first page's query; later pages are read per caller.
+        """
+        page, cursor = await self.search_inventory(sku=sku)
+        # The first page may be shared with other callers, so extend a copy
+        items = list(page)
+        while cursor:
+            page, cursor = await self.search_inventory(sku=sku, cursor=cursor)
+            items.extend(page)
+        return items
+
+    async def _search_page(
+        self,
+        sku: Optional[str],
+        warehouse_id: Optional[UUID],
+        limit: int,
+        cursor: Optional[Dict[str, Any]]
+    ) -> Tuple[List[InventoryListItem], Optional[Dict[str, Any]]]:
+        warehouse_condition = _WAREHOUSE_ID_KEY.eq(str(warehouse_id)) if warehouse_id else None
+        if sku:
+            index_name = 'sku-warehouse_id-index'
+            key_condition = _SKU_KEY.eq(sku)
+            if warehouse_condition is not None:
+                key_condition = key_condition & warehouse_condition
+        else:
+            index_name = WAREHOUSE_ID_INDEX
+            key_condition = warehouse_condition
         try:
-            filter_expression = None
-            expression_values = {}
-            
-            if sku:
-                filter_expression = Key('sku').eq(sku)
-            
-            if warehouse_id:
-                warehouse_filter = Key('warehouse_id').eq(str(warehouse_id))
-                filter_expression = warehouse_filter if not filter_expression else filter_expression & warehouse_filter
-            
-            if filter_expression:
-                response = self.table.query(
-                    IndexName='sku-warehouse_id-index',
-                    KeyConditionExpression=filter_expression
-                )
-            else:
-                response = self.table.scan()
-            
-            items = response.get('Items', [])
-            return [self._convert_to_response(item) for item in items]
+            query_kwargs = {
+                'IndexName': index_name,
+                'KeyConditionExpression': key_condition,
+                'Limit': limit,
+                **_projection(INVENTORY_SEARCH_ATTRIBUTES)
+            }
+            if cursor:
+                query_kwargs['ExclusiveStartKey'] = cursor
+
+            response = await self._run(self.query_table.query, **query_kwargs)
+            items = _construct_many(InventoryListItem, response.get('Items', []))
+            return items, response.get('LastEvaluatedKey')
         except ClientError as e:
-            raise DatabaseError(f"Failed to search inventory: {str(e)}")
-        except Exception as e:
-            if isinstance(e, DatabaseError):
-                raise
-            raise DatabaseError(f"Failed to search inventory: {str(e)}")
+            raise DatabaseError(f"Failed to search inventory: {str(e)}") from e
 
@@ -1,17 +1,70 @@
-from fastapi import FastAPI
-from app.database import CustomerDB, WarehouseDB
+import asyncio
+from typing import AsyncGenerator
+from fastapi import FastAPI, HTTPException, Request, status
+from app.config import get_settings
+from app.database import CustomerDB, WarehouseDB, RoomDB, InventoryDB
+from app.services import WarehouseService
+from app.controllers import CustomerController, WarehouseController, RoomController, InventoryController
 
-# Database dependency functions
-async def get_customer_db(app: FastAPI):
+def init_databases(app: FastAPI) -> None:
+    """Create the process-wide database handles once at startup."""
+    app.state.customer_db = CustomerDB()
+    app.state.warehouse_db = WarehouseDB()
+    app.state.room_db = RoomDB()
+    app.state.inventory_db = InventoryDB()
+
+def init_services(app: FastAPI) -> None:
+    """Build the shared service, controllers and write limiter on top of the DB handles in ``app.state``."""
+    service = WarehouseService(
+        warehouse_db=app.state.warehouse_db,
+        inventory_db=app.state.inventory_db,
+        customer_db=app.state.customer_db
+    )
+    app.state.warehouse_service = service
+    app.state.customer_controller = CustomerController(service)
+    app.state.warehouse_controller = WarehouseController(service)
+    app.state.room_controller = RoomController(service)
+    app.state.inventory_controller = InventoryController(service)
+    app.state.write_limiter = asyncio.Semaphore(get_settings().MAX_CONCURRENT_WRITES)
+
+# Dependency functions; the instances are built once by the lifespan handler.
+# They are async so FastAPI calls them inline instead of via the threadpool.
+async def get_customer_db(request: Request) -> CustomerDB:
     """Get customer database instance."""
-    if not hasattr(app.state, 'customer_db'):
-        db = CustomerDB()
-        app.state.customer_db = db
-    return app.state.customer_db
+    return request.app.state.customer_db
 
-async def get_warehouse_db(app: FastAPI):
+async def get_warehouse_db(request: Request) -> WarehouseDB:
     """Get warehouse database instance."""
-    if not hasattr(app.state, 'warehouse_db'):
-        db = WarehouseDB()
-        app.state.warehouse_db = db
-    return app.state.warehouse_db 
\ No newline at end of file
+    return request.app.state.warehouse_db
+
+async def get_room_db(request: Request) -> RoomDB:
+    """Get room database instance."""
+    return request.app.state.room_db
+
+async def get_inventory_db(request: Request) -> InventoryDB:
+    """Get inventory database instance."""
+    return request.app.state.inventory_db
+
+async def get_warehouse_service(request: Request) -> WarehouseService:
+    """Get the warehouse service built at startup."""
+    return request.app.state.warehouse_service
+
+async def get_inventory_controller(request: Request) -> InventoryController:
+    """Get the inventory controller built at startup."""
+    return request.app.state.inventory_controller
+
+async def limit_writes(request: Request) -> AsyncGenerator[None, None]:
+    """Hold a write slot for the request, shedding it with 503 when none is free.
+
+    Rejecting instead of queueing keeps a burst of writes from piling up
+    behind the DynamoDB connection pool and stalling reads on the same worker.
+    """
+    limiter: asyncio.Semaphore = request.app.state.write_limiter
+    if limiter.locked():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent writes, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    async with limiter:
+        yield
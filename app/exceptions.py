@@ -1,26 +1,19 @@
-class WarehouseServiceError(Exception):
-    """Base exception for warehouse service errors."""
-    pass
-
-class ItemNotFoundError(WarehouseServiceError):
-    """Exception raised when an item is not found in the database."""
-    def __init__(self, item_type: str, item_id: str):
-        self.item_type = item_type
-        self.item_id = item_id
-        super().__init__(f"{item_type} {item_id} not found")
+"""Service exceptions.
 
-class ValidationError(WarehouseServiceError):
-    """Exception raised when validation fails."""
-    pass
+The canonical exception hierarchy lives in ``app.database``; it is re-exported
+here so there is a single set of classes for handlers to match against.
+"""
+from app.database import (
+    DatabaseError,
+    ItemNotFoundError,
+    ValidationError,
+    ConflictError,
+    CapacityError,
+    OperationError,
+)
 
-class DatabaseError(WarehouseServiceError):
-    """Exception raised when a database operation fails."""
-    pass
+WarehouseServiceError = DatabaseError
 
-class CapacityError(WarehouseServiceError):
-    """Exception raised when warehouse or room capacity is exceeded."""
-    pass
-
-class StatusTransitionError(WarehouseServiceError):
+class StatusTransitionError(ValidationError):
     """Exception raised when an invalid status transition is attempted."""
-    pass 
\ No newline at end of file
+    pass
@@ -1,14 +1,17 @@
-import uuid
+import secrets
 import time
 import logging
 from logging.config import dictConfig
-from uuid import UUID
-from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import ItemNotFoundError, DatabaseError, ValidationError
+from app.database import ItemNotFoundError, DatabaseError, ValidationError, ConflictError, OperationError
+from app import lifespan, unhandled_exception_handler
+from app.cache import ETagMiddleware, ResponseCacheMiddleware
 from app.config import get_settings
+from app.utils import ORJSONResponse
 from app.routes import customer_router, warehouse_router, room_router, inventory_router
 
 # Configure logging
@@ -20,7 +23,9 @@ logging_config = {
             "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         },
         "access": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            # Request fields arrive via ``extra`` and are rendered as JSON keys
+            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
+            "format": "%(asctime)s %(name)s %(levelname)s %(message)s",
         },
     },
     "handlers": {
@@ -53,17 +58,33 @@ app = FastAPI(
     description="API for managing warehouses and customers",
     version="1.0.0",
     docs_url=None,  # Disable default docs
-    redoc_url=None  # Disable default redoc
+    redoc_url=None,  # Disable default redoc
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Cache GET responses; a write drops its own collection and the ones derived from it.
+# Added before CORS so CORS headers are applied per request, not cached.
+if settings.RESPONSE_CACHE_TTL > 0:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        ttl=settings.RESPONSE_CACHE_TTL,
+        maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+        invalidates={
+            "/api/v1/customers": ("/api/v1/customers",),
+            "/api/v1/warehouses": ("/api/v1/warehouses",),
+            "/api/v1/rooms": ("/api/v1/rooms", "/api/v1/warehouses"),
+            "/api/v1/inventory": ("/api/v1/inventory", "/api/v1/rooms", "/api/v1/warehouses"),
+        },
+        # Stock levels move with every transfer; keep other workers' copies short-lived
+        ttls={"/api/v1/inventory": min(settings.RESPONSE_CACHE_TTL, 5)},
+    )
+
+# Outside the response cache so cache hits are revalidated too
+app.add_middleware(ETagMiddleware)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSMiddleware, **settings.cors_settings)
 
 # Include routers with explicit prefixes
 app.include_router(customer_router, prefix="/api/v1/customers")
@@ -71,35 +92,44 @@ app.include_router(warehouse_router, prefix="/api/v1/warehouses")
 app.include_router(room_router, prefix="/api/v1/rooms")
 app.include_router(inventory_router, prefix="/api/v1/inventory")
 
-# Validation helpers
-def validate_uuid(id_str: str, entity_type: str = "UUID") -> UUID:
-    """Validate UUID string format and return UUID object."""
-    try:
-        return UUID(id_str)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid {entity_type} ID format"
-        )
-
-# Error handlers
+# Error handlers; routes let domain errors propagate and these map them to status codes
 @app.exception_handler(ItemNotFoundError)
 async def item_not_found_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"detail": str(exc)}
     )
 
+@app.exception_handler(RequestValidationError)
+async def request_validation_handler(request, exc):
+    # Path IDs are typed UUID; keep answering malformed ones with a 400
+    errors = exc.errors()
+    if errors and all(error["loc"][0] == "path" and error["type"] == "uuid_parsing" for error in errors):
+        entity = errors[0]["loc"][-1].removesuffix("_id")
+        return ORJSONResponse(
+            status_code=400,
+            content={"detail": f"Invalid {entity} ID format"}
+        )
+    return await request_validation_exception_handler(request, exc)
+
 @app.exception_handler(ValidationError)
 async def validation_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={"detail": str(exc)}
     )
 
+@app.exception_handler(ConflictError)
+@app.exception_handler(OperationError)
+async def conflict_error_handler(request, exc):
+    return ORJSONResponse(
+        status_code=409,
+        content={"detail": str(exc)}
+    )
+
 @app.exception_handler(DatabaseError)
 async def database_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": str(exc)}
     )
@@ -107,40 +137,56 @@ async def database_error_handler(request, exc):
 # Logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    request_id = str(uuid.uuid4())
-    start_time = time.time()
+    # 64 random bits are plenty to correlate a request's log lines
+    request_id = secrets.token_hex(8)
+    start_ns = time.perf_counter_ns()
+    log_access = access_logger.isEnabledFor(logging.INFO)
     
     # Add request ID to request state
     request.state.request_id = request_id
     
-    access_logger.info(
-        f"Request started request_id={request_id} method={request.method} path={request.url.path}"
-    )
+    if log_access:
+        access_logger.info(
+            "Request started",
+            extra={"request_id": request_id, "method": request.method, "path": request.url.path}
+        )
     
     try:
         response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-        access_logger.info(
-            f"Request completed request_id={request_id} status_code={response.status_code} duration={process_time:.2f}ms"
-        )
+        if log_access:
+            access_logger.info(
+                "Request completed",
+                extra={
+                    "request_id": request_id,
+                    "status_code": response.status_code,
+                    "duration_ms": round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+                }
+            )
         response.headers["X-Request-ID"] = request_id
         return response
     except Exception as e:
-        process_time = (time.time() - start_time) * 1000
         access_logger.error(
-            f"Request failed request_id={request_id} error={str(e)} duration={process_time:.2f}ms"
+            "Request failed",
+            extra={
+                "request_id": request_id,
+                "error": str(e),
+                "duration_ms": round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+            }
         )
         raise
 
+app.add_exception_handler(Exception, unhandled_exception_handler)
+
 # Error handler
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
             "request_id": request.state.request_id
         },
+        headers=exc.headers,
     )
 
 # Custom docs endpoint with configuration
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Annotated, Any, Callable, List, Optional, Union
 from uuid import UUID
-from pydantic import BaseModel, EmailStr, Field, field_validator, ValidationInfo
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, Field, field_validator, ValidationInfo
 from decimal import Decimal, DecimalException
 import json
 from enum import Enum
@@ -11,12 +11,34 @@ from .validation import (
     validate_phone_number,
     validate_email,
     validate_capacity,
-    validate_string_length,
     validate_temperature,
     validate_humidity,
     ValidationError
 )
 
+def _checked(check: Callable[[Any, str], Any]) -> AfterValidator:
+    """Wrap a ``validation`` check as a reusable pydantic after-validator.
+
+    The wrapper is built once per type rather than once per model field, and
+    reports failures as ``ValueError`` so pydantic folds them into its usual
+    error payload.
+    """
+    def validator(value: Any, info: ValidationInfo) -> Any:
+        try:
+            return check(value, info.field_name)
+        except ValidationError as e:
+            raise ValueError(str(e))
+    return AfterValidator(validator)
+
+# At least 0.01 - dimensions and capacities
+PositiveDecimal = Annotated[Decimal, _checked(lambda v, name: validate_decimal(v, name, min_value=Decimal('0.01')))]
+# Non-negative and non-zero - quantities and remaining capacity
+NonZeroDecimal = Annotated[Decimal, _checked(lambda v, name: validate_decimal(v, name, min_value=Decimal('0')))]
+Temperature = Annotated[Decimal, _checked(lambda v, name: validate_temperature(v))]
+Humidity = Annotated[Decimal, _checked(lambda v, name: validate_humidity(v))]
+Email = Annotated[EmailStr, _checked(lambda v, name: validate_email(v))]
+PhoneNumber = Annotated[str, Field(min_length=10, max_length=15), _checked(lambda v, name: validate_phone_number(v))]
+
 class RoomStatus(str, Enum):
     ACTIVE = "active"
     MAINTENANCE = "maintenance"
@@ -28,74 +50,29 @@ class VerificationStatus(str, Enum):
     REJECTED = "REJECTED"
 
 class BaseDBModel(BaseModel):
-    class Config:
-        from_orm = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-            Decimal: lambda v: str(v)
-        }
+    # UUIDs, Decimals and datetimes serialize to strings natively in JSON mode
+    model_config = ConfigDict(from_attributes=True)
 
 class RoomDimensions(BaseModel):
-    length: Decimal
-    width: Decimal
-    height: Decimal
-
-    @field_validator('length', 'width', 'height')
-    @classmethod
-    def validate_dimensions(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_decimal(v, info.field_name, min_value=Decimal('0.01'))
-        except ValidationError as e:
-            raise ValueError(str(e))
+    length: PositiveDecimal
+    width: PositiveDecimal
+    height: PositiveDecimal
 
 class RoomBase(BaseDBModel):
     name: str = Field(..., min_length=1, max_length=100)
-    capacity: Decimal = Field(..., gt=0)
-    temperature: Decimal = Field(..., ge=-30, le=50)
-    humidity: Decimal = Field(..., ge=0, le=100)
+    capacity: PositiveDecimal = Field(..., gt=0)
+    temperature: Temperature = Field(..., ge=-30, le=50)
+    humidity: Humidity = Field(..., ge=0, le=100)
     dimensions: RoomDimensions
     warehouse_id: UUID
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            return validate_string_length(v, "name", max_length=100)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('capacity')
-    @classmethod
-    def validate_room_capacity(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_decimal(v, "capacity", min_value=Decimal('0.01'))
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('temperature')
-    @classmethod
-    def validate_room_temperature(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_temperature(v)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('humidity')
-    @classmethod
-    def validate_room_humidity(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_humidity(v)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
 class RoomCreate(RoomBase):
     status: RoomStatus = Field(default=RoomStatus.ACTIVE)
 
 class RoomResponse(RoomBase):
     id: UUID
     status: RoomStatus
-    available_capacity: Decimal = Field(..., ge=0)
+    available_capacity: NonZeroDecimal = Field(..., ge=0)
     current_utilization: Decimal = Field(default=Decimal('0.00'), ge=Decimal('0.00'))
     created_at: datetime
     updated_at: datetime
@@ -104,14 +81,6 @@ class RoomResponse(RoomBase):
     def room_id(self) -> UUID:
         return self.id
 
-    @field_validator('available_capacity')
-    @classmethod
-    def validate_available_capacity(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_decimal(v, "available_capacity", min_value=Decimal('0'))
-        except ValidationError as e:
-            raise ValueError(str(e))
-
     @field_validator('current_utilization')
     def validate_current_utilization(cls, v: Union[Decimal, str], info: ValidationInfo) -> Decimal:
         if isinstance(v, str):
@@ -123,59 +92,17 @@ class RoomResponse(RoomBase):
 
 class RoomUpdate(BaseDBModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    capacity: Optional[Decimal] = Field(None, gt=0)
-    temperature: Optional[Decimal] = Field(None, ge=-30, le=50)
-    humidity: Optional[Decimal] = Field(None, ge=0, le=100)
+    capacity: Optional[PositiveDecimal] = Field(None, gt=0)
+    temperature: Optional[Temperature] = Field(None, ge=-30, le=50)
+    humidity: Optional[Humidity] = Field(None, ge=0, le=100)
     dimensions: Optional[RoomDimensions] = None
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                return validate_string_length(v, "name", max_length=100)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('capacity', 'temperature', 'humidity')
-    @classmethod
-    def validate_decimal_fields(cls, v: Optional[Decimal], info: ValidationInfo) -> Optional[Decimal]:
-        if v is not None:
-            try:
-                if info.field_name == 'capacity':
-                    return validate_decimal(v, info.field_name, min_value=Decimal('0.01'))
-                elif info.field_name == 'temperature':
-                    return validate_temperature(v)
-                elif info.field_name == 'humidity':
-                    return validate_humidity(v)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
 class WarehouseBase(BaseDBModel):
     name: str = Field(..., min_length=1, max_length=100)
     address: str = Field(..., min_length=1, max_length=200)
-    total_capacity: Decimal = Field(..., gt=0)
+    total_capacity: PositiveDecimal = Field(..., gt=0)
     customer_id: UUID
 
-    @field_validator('name', 'address')
-    @classmethod
-    def validate_string_fields(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            max_length = 200 if info.field_name == 'address' else 100
-            return validate_string_length(v, info.field_name, max_length=max_length)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('total_capacity')
-    @classmethod
-    def validate_warehouse_capacity(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_decimal(v, "total_capacity", min_value=Decimal('0.01'))
-        except ValidationError as e:
-            raise ValueError(str(e))
-
 class WarehouseCreate(WarehouseBase):
     rooms: List[RoomCreate] = Field(default_factory=list)
 
@@ -193,103 +120,24 @@ class WarehouseResponse(WarehouseBase):
 class WarehouseUpdate(BaseDBModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     address: Optional[str] = Field(None, min_length=1, max_length=200)
-    total_capacity: Optional[Decimal] = Field(None, gt=0)
-
-    @field_validator('name', 'address')
-    @classmethod
-    def validate_string_fields(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                max_length = 200 if info.field_name == 'address' else 100
-                return validate_string_length(v, info.field_name, max_length=max_length)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('total_capacity')
-    @classmethod
-    def validate_warehouse_capacity(cls, v: Optional[Decimal], info: ValidationInfo) -> Optional[Decimal]:
-        if v is not None:
-            try:
-                return validate_decimal(v, "total_capacity", min_value=Decimal('0.01'))
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
+    total_capacity: Optional[PositiveDecimal] = Field(None, gt=0)
 
 # Customer Models
 class CustomerBase(BaseDBModel):
     name: str = Field(..., min_length=1, max_length=100)
-    email: EmailStr
-    phone_number: str = Field(..., min_length=10, max_length=15)
+    email: Email
+    phone_number: PhoneNumber
     address: str = Field(..., min_length=5, max_length=200)
 
-    @field_validator('name', 'address')
-    @classmethod
-    def validate_string_fields(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            min_length = 5 if info.field_name == 'address' else 1
-            max_length = 200 if info.field_name == 'address' else 100
-            return validate_string_length(v, info.field_name, min_length=min_length, max_length=max_length)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('email')
-    @classmethod
-    def validate_customer_email(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            return validate_email(v)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('phone_number')
-    @classmethod
-    def validate_customer_phone(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            return validate_phone_number(v)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
 class CustomerCreate(CustomerBase):
     pass
 
 class CustomerUpdate(BaseDBModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    email: Optional[EmailStr] = None
-    phone_number: Optional[str] = Field(None, min_length=10, max_length=15)
+    email: Optional[Email] = None
+    phone_number: Optional[PhoneNumber] = None
     address: Optional[str] = Field(None, min_length=5, max_length=200)
 
-    @field_validator('name', 'address')
-    @classmethod
-    def validate_string_fields(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                min_length = 5 if info.field_name == 'address' else 1
-                max_length = 200 if info.field_name == 'address' else 100
-                return validate_string_length(v, info.field_name, min_length=min_length, max_length=max_length)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('email')
-    @classmethod
-    def validate_customer_email(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                return validate_email(v)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('phone_number')
-    @classmethod
-    def validate_customer_phone(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                return validate_phone_number(v)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
 class CustomerResponse(CustomerBase):
     id: UUID
     created_at: datetime
@@ -305,90 +153,38 @@ class InventoryBase(BaseDBModel):
     sku: str = Field(..., min_length=1, max_length=50)
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    quantity: Decimal = Field(..., ge=0)
+    quantity: NonZeroDecimal = Field(..., ge=0)
     unit: str = Field(..., min_length=1, max_length=20)
     unit_weight: Decimal = Field(..., ge=0)  # Weight per unit in kg
     room_id: UUID
     warehouse_id: UUID
 
-    @field_validator('sku', 'name', 'unit')
-    @classmethod
-    def validate_string_fields(cls, v: str, info: ValidationInfo) -> str:
-        try:
-            max_length = 50 if info.field_name == 'sku' else 100 if info.field_name == 'name' else 20
-            return validate_string_length(v, info.field_name, max_length=max_length)
-        except ValidationError as e:
-            raise ValueError(str(e))
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                return validate_string_length(v, "description", max_length=500)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('quantity')
-    @classmethod
-    def validate_quantity(cls, v: Decimal, info: ValidationInfo) -> Decimal:
-        try:
-            return validate_decimal(v, "quantity", min_value=Decimal('0'))
-        except ValidationError as e:
-            raise ValueError(str(e))
-
 class InventoryCreate(InventoryBase):
     pass
 
-class InventoryResponse(InventoryBase):
+class InventoryListItem(InventoryBase):
+    """Inventory as returned by list and search endpoints, without the unbounded transfer history."""
     id: UUID
     created_at: datetime
     updated_at: datetime
-    transfer_history: Optional[List[dict]] = Field(default_factory=list)
 
     @property
     def inventory_id(self) -> UUID:
         return self.id
 
+class InventoryResponse(InventoryListItem):
+    transfer_history: Optional[List[dict]] = Field(default_factory=list)
+
 class InventoryUpdate(BaseDBModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
-    quantity: Optional[Decimal] = Field(None, ge=0)
+    quantity: Optional[NonZeroDecimal] = Field(None, ge=0)
     unit: Optional[str] = Field(None, min_length=1, max_length=20)
     room_id: Optional[UUID] = None
     transfer_history: Optional[List[dict]] = None
 
-    @field_validator('name', 'unit')
-    @classmethod
-    def validate_string_fields(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                max_length = 100 if info.field_name == 'name' else 20
-                return validate_string_length(v, info.field_name, max_length=max_length)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
-        if v is not None:
-            try:
-                return validate_string_length(v, "description", max_length=500)
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
-
-    @field_validator('quantity')
-    @classmethod
-    def validate_quantity(cls, v: Optional[Decimal], info: ValidationInfo) -> Optional[Decimal]:
-        if v is not None:
-            try:
-                return validate_decimal(v, "quantity", min_value=Decimal('0'))
-            except ValidationError as e:
-                raise ValueError(str(e))
-        return v
+class InventoryTransfer(BaseModel):
+    target_room_id: UUID
 
 # Common Response Models
 class ErrorResponse(BaseModel):
@@ -1,7 +1,10 @@
-from typing import List, Dict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Dict, Optional, Type
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, status, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, HTTPException, Depends, status, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from app.models import (
     CustomerCreate,
     CustomerResponse,
@@ -13,222 +16,204 @@ from app.models import (
     RoomResponse,
     RoomUpdate,
     InventoryCreate,
-    InventoryResponse
+    InventoryUpdate,
+    InventoryTransfer,
+    InventoryResponse,
+    InventoryListItem
 )
 from app.database import (
     CustomerDB,
     WarehouseDB,
     RoomDB,
     InventoryDB,
-    ItemNotFoundError,
-    ValidationError,
-    DatabaseError,
-    ConflictError,
-    OperationError
+    ValidationError
 )
 from app.services import WarehouseService
 from app.controllers import InventoryController
+from app.dependencies import (
+    get_customer_db,
+    get_warehouse_db,
+    get_room_db,
+    get_inventory_db,
+    get_warehouse_service,
+    get_inventory_controller,
+    limit_writes
+)
+from app.utils import encode_cursor, decode_cursor
 
 # Initialize routers
-customer_router = APIRouter()
-warehouse_router = APIRouter()
-room_router = APIRouter()
-inventory_router = APIRouter()
-
-async def get_customer_db(request: Request) -> CustomerDB:
-    """Get customer database instance."""
-    if not hasattr(request.app.state, 'customer_db'):
-        request.app.state.customer_db = CustomerDB()
-    return request.app.state.customer_db
-
-async def get_warehouse_db(request: Request) -> WarehouseDB:
-    """Get warehouse database instance."""
-    if not hasattr(request.app.state, 'warehouse_db'):
-        request.app.state.warehouse_db = WarehouseDB()
-    return request.app.state.warehouse_db
-
-async def get_room_db(request: Request) -> RoomDB:
-    """Get room database instance."""
-    if not hasattr(request.app.state, 'room_db'):
-        request.app.state.room_db = RoomDB()
-    return request.app.state.room_db
-
-async def get_inventory_db(request: Request) -> InventoryDB:
-    """Get inventory database instance."""
-    if not hasattr(request.app.state, 'inventory_db'):
-        request.app.state.inventory_db = InventoryDB()
-    return request.app.state.inventory_db
-
-async def get_warehouse_service(
-    warehouse_db: WarehouseDB = Depends(get_warehouse_db),
-    inventory_db: InventoryDB = Depends(get_inventory_db),
-    customer_db: CustomerDB = Depends(get_customer_db)
-) -> WarehouseService:
-    """Get warehouse service instance."""
-    return WarehouseService(warehouse_db=warehouse_db, inventory_db=inventory_db, customer_db=customer_db)
+customer_router = APIRouter(tags=["customers"])
+warehouse_router = APIRouter(tags=["warehouses"])
+room_router = APIRouter(tags=["rooms"])
+inventory_router = APIRouter(tags=["inventory"])
+
+# Largest body accepted by the bulk create endpoints
+BATCH_CREATE_LIMIT = 100
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+def _render(
+    result: Any,
+    model: Type[BaseModel],
+    headers: Optional[Dict[str, str]] = None,
+    status_code: int = status.HTTP_200_OK,
+    exclude_unset: bool = False
+) -> Any:
+    """Serialize already-validated ``model`` instances straight to JSON bytes.
+
+    Accepts a single instance or a list of them; either way pydantic-core
+    writes the JSON directly. Anything else is returned unchanged so FastAPI
+    validates it against the route's ``response_model`` as usual. Pass
+    ``exclude_unset`` for instances built from a projection.
+    """
+    if isinstance(result, model):
+        content = result.model_dump_json(exclude_unset=exclude_unset)
+    elif isinstance(result, list) and all(isinstance(item, model) for item in result):
+        content = _list_adapter(model).dump_json(result, exclude_unset=exclude_unset)
+    else:
+        return result
+    return Response(content=content, status_code=status_code, media_type="application/json", headers=headers)
+
+async def _stream(items: AsyncIterator[Any], model: Type[BaseModel]) -> Response:
+    """Stream ``items`` as a JSON array, encoding each one as it arrives.
+
+    The first item is awaited before the response starts so that errors on
+    the first page still reach the exception handlers; a failure after that
+    can only cut the body short.
+    """
+    def encode(item: Any) -> bytes:
+        if not isinstance(item, model):
+            item = model.model_validate(item)
+        return model.__pydantic_serializer__.to_json(item)
+
+    try:
+        first = await anext(items)
+    except StopAsyncIteration:
+        return Response(content=b"[]", media_type="application/json")
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"[" + encode(first)
+        async for item in items:
+            yield b"," + encode(item)
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
 
 # Customer routes
 @customer_router.post(
     "/",
+    dependencies=[Depends(limit_writes)],
     response_model=CustomerResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new customer",
-    tags=["customers"]
+    summary="Create a new customer"
 )
 async def create_customer(
     customer: CustomerCreate,
     db: CustomerDB = Depends(get_customer_db)
 ):
-    try:
-        return await db.create_item(customer)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.create_item(customer)
+
+@customer_router.post(
+    "/batch",
+    dependencies=[Depends(limit_writes)],
+    response_model=List[CustomerResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create customers in bulk"
+)
+async def create_customers(
+    customers: List[CustomerCreate] = Body(..., min_length=1, max_length=BATCH_CREATE_LIMIT),
+    db: CustomerDB = Depends(get_customer_db)
+):
+    return _render(await db.batch_create(customers), CustomerResponse, status_code=status.HTTP_201_CREATED)
 
 @customer_router.get(
     "/{customer_id}",
     response_model=CustomerResponse,
-    summary="Get customer by ID",
-    tags=["customers"]
+    summary="Get customer by ID"
 )
 async def get_customer(
-    customer_id: str,
+    customer_id: UUID,
     db: CustomerDB = Depends(get_customer_db)
 ):
     """
     Retrieve a customer by their ID.
     """
-    try:
-        # Validate UUID format
-        try:
-            customer_id_uuid = UUID(customer_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid customer ID format"
-            )
-            
-        customer = await db.get_item(str(customer_id_uuid))
-        if not customer:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Customer {customer_id} not found"
-            )
-        return customer
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Customer {customer_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    customer = await db.get_item(str(customer_id))
+    return _render(customer, CustomerResponse)
 
 @customer_router.get(
     "/",
     response_model=List[CustomerResponse],
-    summary="List all customers",
-    tags=["customers"]
+    summary="List all customers"
 )
 async def list_customers(
+    response: Response,
     db: CustomerDB = Depends(get_customer_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(10, gt=0, le=100)
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's X-Next-Cursor header"),
+    limit: int = Query(10, gt=0, le=100),
+    fields: Optional[str] = Query(None, description="Comma-separated customer fields to return; id is always included")
 ):
     """
-    Retrieve a list of customers with pagination.
+    Retrieve a page of customers.
+
+    When more customers remain, the ``X-Next-Cursor`` response header holds the
+    cursor for the next page. With ``fields`` only those attributes are read
+    from the table and returned.
     """
-    return await db.list_items(skip=skip, limit=limit)
+    try:
+        start_key = decode_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    attributes = None
+    if fields:
+        attributes = ("id", *(name for name in dict.fromkeys(fields.split(",")) if name and name != "id"))
+        unknown = [name for name in attributes if name not in CustomerResponse.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown customer fields: {', '.join(unknown)}"
+            )
+    customers, next_key = await db.list_items(cursor=start_key, limit=limit, attributes=attributes)
+    headers = {"X-Next-Cursor": encode_cursor(next_key)} if next_key else None
+    if headers:
+        response.headers.update(headers)
+    return _render(customers, CustomerResponse, headers=headers, exclude_unset=attributes is not None)
 
 @customer_router.patch(
     "/{customer_id}",
+    dependencies=[Depends(limit_writes)],
     response_model=CustomerResponse,
-    summary="Update customer",
-    tags=["customers"]
+    summary="Update customer"
 )
 async def update_customer(
-    customer_id: str,
+    customer_id: UUID,
     customer: CustomerUpdate,
     db: CustomerDB = Depends(get_customer_db)
 ):
     """
     Update a customer's information.
     """
-    try:
-        # Validate UUID format
-        try:
-            customer_id_uuid = UUID(customer_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid customer ID format"
-            )
-            
-        return await db.update_item(str(customer_id_uuid), customer)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Customer {customer_id} not found"
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.update_item(str(customer_id), customer)
 
 @customer_router.delete(
     "/{customer_id}",
+    dependencies=[Depends(limit_writes)],
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete customer",
-    tags=["customers"]
+    summary="Delete customer"
 )
 async def delete_customer(
-    customer_id: str,
+    customer_id: UUID,
     db: CustomerDB = Depends(get_customer_db)
 ):
     """
     Delete a customer by their ID.
     """
-    try:
-        # Validate UUID format
-        try:
-            customer_id_uuid = UUID(customer_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid customer ID format"
-            )
-            
-        await db.delete_item(str(customer_id_uuid))
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Customer {customer_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    await db.delete_item(str(customer_id))
 
 @customer_router.get(
     "/email/{email}",
@@ -242,26 +227,15 @@ async def get_customer_by_email(
     """
     Retrieve a customer by their email address.
     """
-    try:
-        return await db.get_by_email(email)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Customer with email {email} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.get_by_email(email)
 
 # Warehouse routes
 @warehouse_router.post(
     "/",
+    dependencies=[Depends(limit_writes)],
     response_model=WarehouseResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new warehouse",
-    tags=["warehouses"]
+    summary="Create a new warehouse"
 )
 async def create_warehouse(
     warehouse_data: WarehouseCreate,
@@ -271,158 +245,66 @@ async def create_warehouse(
     try:
         warehouse = await warehouse_service.create_warehouse(warehouse_data)
         return warehouse
-    except ItemNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
 
 @warehouse_router.get(
     "/{warehouse_id}",
     response_model=WarehouseResponse,
-    summary="Get warehouse by ID",
-    tags=["warehouses"]
+    summary="Get warehouse by ID"
 )
 async def get_warehouse(
-    warehouse_id: str,
+    warehouse_id: UUID,
     db: WarehouseDB = Depends(get_warehouse_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            warehouse_id_uuid = UUID(warehouse_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid warehouse ID format"
-            )
-            
-        warehouse = await db.get_warehouse(str(warehouse_id_uuid))
-        if not warehouse:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Warehouse {warehouse_id} not found"
-            )
-        return warehouse
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Warehouse {warehouse_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    warehouse = await db.get_warehouse(str(warehouse_id))
+    return _render(warehouse, WarehouseResponse)
 
 @warehouse_router.get(
     "/",
     response_model=List[WarehouseResponse],
-    summary="List warehouses by customer",
-    tags=["warehouses"]
+    summary="List warehouses by customer"
 )
 async def list_warehouses_by_customer(
     customer_id: UUID,
     db: WarehouseDB = Depends(get_warehouse_db)
 ):
-    try:
-        return await db.list_by_customer(str(customer_id))
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await _stream(db.iter_by_customer(str(customer_id)), WarehouseResponse)
 
 @warehouse_router.patch(
     "/{warehouse_id}",
+    dependencies=[Depends(limit_writes)],
     response_model=WarehouseResponse,
-    summary="Update warehouse",
-    tags=["warehouses"]
+    summary="Update warehouse"
 )
 async def update_warehouse(
-    warehouse_id: str,
+    warehouse_id: UUID,
     update_data: WarehouseUpdate,
     db: WarehouseDB = Depends(get_warehouse_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            warehouse_id_uuid = UUID(warehouse_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid warehouse ID format"
-            )
-            
-        return await db.update_warehouse(str(warehouse_id_uuid), update_data)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Warehouse {warehouse_id} not found"
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.update_warehouse(str(warehouse_id), update_data)
 
 @warehouse_router.delete(
     "/{warehouse_id}",
+    dependencies=[Depends(limit_writes)],
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete a warehouse",
-    tags=["warehouses"]
+    summary="Delete a warehouse"
 )
 async def delete_warehouse(
-    warehouse_id: str,
+    warehouse_id: UUID,
     warehouse_service: WarehouseService = Depends(get_warehouse_service)
 ):
     """Delete a warehouse."""
     try:
-        # Validate UUID format
-        try:
-            warehouse_id_uuid = UUID(warehouse_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid warehouse ID format"
-            )
-            
-        await warehouse_service.delete_warehouse(str(warehouse_id_uuid))
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Warehouse {warehouse_id} not found"
-        )
+        await warehouse_service.delete_warehouse(str(warehouse_id))
     except ValidationError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
-    except OperationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
 
 @warehouse_router.get(
     "/{warehouse_id}/availability",
@@ -430,7 +312,7 @@ async def delete_warehouse(
     summary="Check warehouse availability"
 )
 async def check_warehouse_availability(
-    warehouse_id: str,
+    warehouse_id: UUID,
     db: WarehouseDB = Depends(get_warehouse_db)
 ):
     """
@@ -438,9 +320,9 @@ async def check_warehouse_availability(
     Returns capacity information and current usage.
     """
     try:
-        availability = await db.check_availability(warehouse_id)
+        availability = await db.check_availability(str(warehouse_id))
         return {
-            "warehouse_id": warehouse_id,
+            "warehouse_id": str(warehouse_id),
             "available": availability["available"],
             "total_capacity": availability["total_capacity"],
             "used_capacity": availability["used_capacity"],
@@ -456,441 +338,202 @@ async def check_warehouse_availability(
     "/{warehouse_id}/rooms",
     response_model=List[RoomResponse],
     summary="List rooms by warehouse",
-    tags=["rooms"]
+    tags=["rooms"]  # Also listed under the router's "warehouses" tag
 )
 async def list_rooms_by_warehouse(
-    warehouse_id: str,
+    warehouse_id: UUID,
     warehouse_service: WarehouseService = Depends(get_warehouse_service)
 ):
-    try:
-        # Validate UUID format
-        try:
-            warehouse_id_uuid = UUID(warehouse_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid warehouse ID format"
-            )
-            
-        return await warehouse_service.list_rooms(str(warehouse_id_uuid))
-    except ItemNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return _render(await warehouse_service.list_rooms(str(warehouse_id)), RoomResponse)
 
 # Room routes
 @room_router.post(
     "/",
+    dependencies=[Depends(limit_writes)],
     response_model=RoomResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new room",
-    tags=["rooms"]
+    summary="Create a new room"
 )
 async def create_room(
     room: RoomCreate,
     db: RoomDB = Depends(get_room_db)
 ):
-    try:
-        return await db.create_room(room)
-    except ItemNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.create_room(room)
 
 @room_router.get(
     "/{room_id}",
     response_model=RoomResponse,
-    summary="Get room by ID",
-    tags=["rooms"]
+    summary="Get room by ID"
 )
 async def get_room(
-    room_id: str,
+    room_id: UUID,
     db: RoomDB = Depends(get_room_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            room_id_uuid = UUID(room_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid room ID format"
-            )
-            
-        room = await db.get_room(str(room_id_uuid))
-        if not room:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Room {room_id} not found"
-            )
-        return room
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Room {room_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    room = await db.get_room(str(room_id))
+    return _render(room, RoomResponse)
 
 @room_router.patch(
     "/{room_id}",
+    dependencies=[Depends(limit_writes)],
     response_model=RoomResponse,
-    summary="Update room",
-    tags=["rooms"]
+    summary="Update room"
 )
 async def update_room(
-    room_id: str,
+    room_id: UUID,
     update_data: RoomUpdate,
     db: RoomDB = Depends(get_room_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            room_id_uuid = UUID(room_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid room ID format"
-            )
-            
-        return await db.update_room(str(room_id_uuid), update_data)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Room {room_id} not found"
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.update_room(str(room_id), update_data)
 
 @room_router.delete(
     "/{room_id}",
+    dependencies=[Depends(limit_writes)],
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete room",
-    tags=["rooms"]
+    summary="Delete room"
 )
 async def delete_room(
-    room_id: str,
+    room_id: UUID,
     db: RoomDB = Depends(get_room_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            room_id_uuid = UUID(room_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid room ID format"
-            )
-            
-        await db.delete_room(str(room_id_uuid))
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Room {room_id} not found"
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    await db.delete_room(str(room_id))
 
 @room_router.get(
     "/{room_id}/conditions",
     response_model=dict,
-    summary="Get room conditions",
-    tags=["rooms"]
+    summary="Get room conditions"
 )
 async def get_room_conditions(
-    room_id: str,
+    room_id: UUID,
     db: RoomDB = Depends(get_room_db)
 ):
-    try:
-        room = await db.get_room(room_id)
-        return {
-            "temperature": room.temperature,
-            "humidity": room.humidity
-        }
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Room {room_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    room = await db.get_room(str(room_id))
+    return {
+        "temperature": room.temperature,
+        "humidity": room.humidity
+    }
 
 # Inventory routes
 @inventory_router.post(
     "/",
+    dependencies=[Depends(limit_writes)],
     response_model=InventoryResponse,
     status_code=status.HTTP_201_CREATED,
-    summary="Add inventory",
-    tags=["inventory"]
+    summary="Add inventory"
 )
 async def add_inventory(
     inventory: InventoryCreate,
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        return await db.create_inventory(inventory)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except ConflictError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.create_inventory(inventory)
+
+@inventory_router.post(
+    "/batch",
+    dependencies=[Depends(limit_writes)],
+    response_model=List[InventoryResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Add inventory in bulk"
+)
+async def add_inventory_batch(
+    items: List[InventoryCreate] = Body(..., min_length=1, max_length=BATCH_CREATE_LIMIT),
+    db: InventoryDB = Depends(get_inventory_db)
+):
+    """Add up to 100 inventory items.
+
+    Every room and warehouse is checked before anything is stored. Items are
+    written in transactions of up to 100 operations (one per item plus one
+    per warehouse), each together with its warehouse totals. If a later
+    transaction fails, the items of the earlier ones remain stored; the error
+    says how many, so a retry should send only the rest.
+    """
+    return _render(
+        await db.batch_create_inventory(items), InventoryResponse, status_code=status.HTTP_201_CREATED
+    )
+
+# Registered before "/{inventory_id}", which would otherwise match "/search"
+@inventory_router.get(
+    "/search",
+    response_model=List[InventoryListItem],
+    summary="Search inventory by SKU"
+)
+async def search_inventory(
+    sku: str = Query(..., description="SKU to search for"),
+    controller: InventoryController = Depends(get_inventory_controller)
+) -> List[InventoryListItem]:
+    """Search inventory by SKU."""
+    return await controller.search(sku)
 
 @inventory_router.get(
     "/{inventory_id}",
     response_model=InventoryResponse,
-    summary="Get inventory by ID",
-    tags=["inventory"]
+    summary="Get inventory by ID"
 )
 async def get_inventory(
-    inventory_id: str,
+    inventory_id: UUID,
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            inventory_id_uuid = UUID(inventory_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid inventory ID format"
-            )
-            
-        inventory = await db.get_inventory(str(inventory_id_uuid))
-        if not inventory:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Inventory {inventory_id} not found"
-            )
-        return inventory
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Inventory {inventory_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    inventory = await db.get_inventory(str(inventory_id))
+    return _render(inventory, InventoryResponse)
 
 @inventory_router.patch(
     "/{inventory_id}",
+    dependencies=[Depends(limit_writes)],
     response_model=InventoryResponse,
-    summary="Update inventory",
-    tags=["inventory"]
+    summary="Update inventory"
 )
 async def update_inventory(
-    inventory_id: str,
-    update_data: dict,
+    inventory_id: UUID,
+    update_data: InventoryUpdate,
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            inventory_id_uuid = UUID(inventory_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid inventory ID format"
-            )
-            
-        return await db.update_inventory(str(inventory_id_uuid), update_data)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Inventory {inventory_id} not found"
-        )
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.update_inventory(str(inventory_id), update_data)
 
 @inventory_router.delete(
     "/{inventory_id}",
+    dependencies=[Depends(limit_writes)],
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete inventory",
-    tags=["inventory"]
+    summary="Delete inventory"
 )
 async def delete_inventory(
-    inventory_id: str,
+    inventory_id: UUID,
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        # Validate UUID format
-        try:
-            inventory_id_uuid = UUID(inventory_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid inventory ID format"
-            )
-            
-        await db.delete_inventory(str(inventory_id_uuid))
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Inventory {inventory_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    await db.delete_inventory(str(inventory_id))
 
 @inventory_router.post(
     "/{inventory_id}/transfer",
+    dependencies=[Depends(limit_writes)],
     response_model=InventoryResponse,
-    summary="Transfer inventory",
-    tags=["inventory"]
+    summary="Transfer inventory"
 )
 async def transfer_inventory(
-    inventory_id: str,
-    transfer_data: dict,
+    inventory_id: UUID,
+    transfer_data: InventoryTransfer,
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        return await db.transfer_inventory(inventory_id, transfer_data)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Inventory {inventory_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.transfer_inventory(str(inventory_id), transfer_data)
 
 @inventory_router.get(
     "/{inventory_id}/history",
     response_model=List[dict],
-    summary="Get inventory history",
-    tags=["inventory"]
+    summary="Get inventory history"
 )
 async def get_inventory_history(
-    inventory_id: str,
+    inventory_id: UUID,
+    after: Optional[datetime] = Query(None, description="Return records after this timestamp, e.g. the last one seen"),
+    limit: int = Query(50, gt=0, le=500),
     db: InventoryDB = Depends(get_inventory_db)
 ):
-    try:
-        return await db.get_inventory_history(inventory_id)
-    except ItemNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Inventory {inventory_id} not found"
-        )
-    except DatabaseError as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await db.get_inventory_history(str(inventory_id), after=after, limit=limit)
 
 @inventory_router.get(
     "/room/{room_id}",
-    response_model=List[InventoryResponse],
-    summary="List inventory by room",
-    tags=["inventory"]
+    response_model=List[InventoryListItem],
+    summary="List inventory by room"
 )
 async def list_inventory_by_room(
-    room_id: str,
-    warehouse_service: WarehouseService = Depends(get_warehouse_service)
+    room_id: UUID,
+    controller: InventoryController = Depends(get_inventory_controller)
 ):
     """List all inventory items in a room."""
-    controller = InventoryController(warehouse_service)
-    return await controller.list_by_room(room_id)
-
-@inventory_router.get(
-    "/search",
-    response_model=List[InventoryResponse],
-    summary="Search inventory by SKU",
-    tags=["inventory"]
-)
-async def search_inventory(
-    sku: str = Query(..., description="SKU to search for"),
-    warehouse_service: WarehouseService = Depends(get_warehouse_service)
-) -> List[InventoryResponse]:
-    """Search inventory by SKU."""
-    try:
-        controller = InventoryController(warehouse_service)
-        return await controller.search(sku)
-    except ValidationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=str(e)
-        )
-    except ItemNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error searching inventory: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=str(e)
-        )
+    return await controller.list_by_room(str(room_id))
 
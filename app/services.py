@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID
 from datetime import datetime, timezone
 from app.database import WarehouseDB, CustomerDB, ItemNotFoundError, InventoryDB, OperationError, ValidationError
@@ -14,14 +15,88 @@ from app.models import (
     RoomResponse,
     RoomStatus,
     InventoryCreate,
+    InventoryListItem,
     InventoryResponse,
     VerificationStatus
 )
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter
 from decimal import Decimal
 
 logger = logging.getLogger(__name__)
 
+def _as_uuid(value: str | UUID) -> UUID:
+    """Return ``value`` as a UUID without round-tripping UUIDs through str."""
+    return value if isinstance(value, UUID) else UUID(value)
+
+def _to_decimal(value: Any) -> Decimal:
+    """Return ``value`` as a Decimal; DynamoDB numbers already are, so skip the str round trip."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+# Validate whole pages of stored items in one pydantic-core call
+_ROOM_LIST_ADAPTER = TypeAdapter(List[RoomResponse])
+_INVENTORY_LIST_ADAPTER = TypeAdapter(List[InventoryListItem])
+
+# Allowed status transitions, keyed by the current status
+_NO_TRANSITIONS: frozenset = frozenset()
+_ROOM_TRANSITIONS: Dict[RoomStatus, frozenset] = {
+    RoomStatus.ACTIVE: frozenset({RoomStatus.MAINTENANCE, RoomStatus.DECOMMISSIONED}),
+    RoomStatus.MAINTENANCE: frozenset({RoomStatus.ACTIVE, RoomStatus.DECOMMISSIONED}),
+    RoomStatus.DECOMMISSIONED: frozenset({RoomStatus.ACTIVE})
+}
+_VERIFICATION_TRANSITIONS: Dict[VerificationStatus, frozenset] = {
+    VerificationStatus.PENDING: frozenset({VerificationStatus.VERIFIED, VerificationStatus.REJECTED}),
+    VerificationStatus.VERIFIED: frozenset({VerificationStatus.REJECTED}),
+    VerificationStatus.REJECTED: frozenset({VerificationStatus.VERIFIED})
+}
+
+def _validate_status_transition(current: RoomStatus, new: RoomStatus) -> bool:
+    """Validate if a room status transition is allowed."""
+    return new in _ROOM_TRANSITIONS.get(current, _NO_TRANSITIONS)
+
+def _validate_verification_status_transition(
+    current_status: VerificationStatus, new_status: VerificationStatus
+) -> bool:
+    """Validate if a customer verification status transition is allowed."""
+    return new_status in _VERIFICATION_TRANSITIONS.get(current_status, _NO_TRANSITIONS)
+
+def _validate_room_dimensions(dimensions: Tuple[Any, Any, Any]) -> bool:
+    """Validate a room's (length, width, height)."""
+    try:
+        return all(Decimal(str(dim)) > 0 for dim in dimensions)
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+
+def _validate_warehouse_capacity(total_capacity: Any) -> bool:
+    """Validate a warehouse's total capacity."""
+    try:
+        return Decimal(str(total_capacity)) > 0
+    except (TypeError, ValueError, ArithmeticError):
+        return False
+
+# All that capacity checks need from stored inventory items
+_WEIGHT_ATTRIBUTES = ("quantity", "unit_weight")
+
+def _item_weight(item: Dict[str, Any] | InventoryResponse) -> Decimal:
+    """Return an inventory item's total weight from a stored dict or a model."""
+    if not isinstance(item, dict):
+        return _to_decimal(item.total_weight)
+    if "total_weight" in item:
+        return _to_decimal(item["total_weight"])
+    return _to_decimal(item.get("quantity", 0)) * _to_decimal(item.get("unit_weight", 0))
+
+async def _gather(*aws: Any) -> List[Any]:
+    """Await independent calls concurrently.
+
+    Every call runs to completion; the first failure in argument order is then
+    re-raised, so callers see the same error a sequence of awaits would give.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
 class WarehouseService:
     def __init__(self, warehouse_db: WarehouseDB, inventory_db: InventoryDB, customer_db: CustomerDB):
         self.warehouse_db = warehouse_db
@@ -51,12 +126,7 @@ class WarehouseService:
         """Get warehouse by ID."""
         logger.info(f"Retrieving warehouse {warehouse_id}")
         try:
-            warehouse_dict = await self.warehouse_db.get_warehouse(UUID(str(warehouse_id)))
-            if not warehouse_dict:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Warehouse {warehouse_id} not found"
-                )
+            warehouse_dict = await self.warehouse_db.get_warehouse(_as_uuid(warehouse_id))
             return WarehouseResponse(**warehouse_dict)
         except ItemNotFoundError as e:
             raise HTTPException(
@@ -64,38 +134,45 @@ class WarehouseService:
                 detail=str(e)
             )
 
+    async def _require_warehouse(self, warehouse_id: str | UUID) -> None:
+        """Raise 404 unless the warehouse exists, without loading it."""
+        if not await self.warehouse_db.warehouse_exists(warehouse_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Warehouse {warehouse_id} not found"
+            )
+
     async def update_warehouse(
         self, warehouse_id: str | UUID, update_data: Dict[str, Any]
     ) -> WarehouseResponse:
         """Update warehouse details."""
         logger.info(f"Updating warehouse {warehouse_id}")
+        warehouse_id = _as_uuid(warehouse_id)
         
         # Check if warehouse exists
         warehouse = await self.get_warehouse(warehouse_id)
-        if not warehouse:
-            raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
         
         # Validate update data
         if "total_capacity" in update_data:
-            if not self._validate_warehouse_capacity({**warehouse.model_dump(), **update_data}):
+            if not _validate_warehouse_capacity(update_data["total_capacity"]):
                 raise HTTPException(
                     status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                     detail="Invalid warehouse capacity configuration"
                 )
         
         # Update warehouse
-        updated_warehouse_dict = await self.warehouse_db.update_warehouse(UUID(str(warehouse_id)), update_data)
+        updated_warehouse_dict = await self.warehouse_db.update_warehouse(warehouse_id, update_data)
         logger.info(f"Updated warehouse {warehouse_id}")
         return WarehouseResponse(**updated_warehouse_dict)
 
     async def delete_warehouse(self, warehouse_id_str: str) -> None:
         """Delete a warehouse."""
         try:
-            # Check if warehouse exists
-            warehouse = await self.get_warehouse(warehouse_id_str)
-            
-            # Check for inventory
-            inventory = await self.warehouse_db.get_inventory(warehouse_id_str)
+            # Check the warehouse exists and has no inventory
+            _, inventory = await _gather(
+                self._require_warehouse(warehouse_id_str),
+                self.warehouse_db.get_inventory(warehouse_id_str)
+            )
             if inventory:
                 raise ValidationError("Cannot delete warehouse with existing inventory")
 
@@ -118,7 +195,7 @@ class WarehouseService:
         logger.info(f"Creating room in warehouse {warehouse_id}")
         
         # Verify warehouse exists
-        warehouse = await self.get_warehouse(warehouse_id)
+        await self._require_warehouse(warehouse_id)
         
         # Validate room dimensions
         dimensions = room_data.dimensions
@@ -135,7 +212,7 @@ class WarehouseService:
         room = RoomResponse(**room_dict)
         
         # Update warehouse total capacity
-        await self._update_warehouse_capacity(warehouse_id)
+        await self._adjust_warehouse_capacity(warehouse_id, self._capacity_volume(room))
         
         logger.info(f"Created room {room.id} in warehouse {warehouse_id}")
         return room
@@ -170,23 +247,24 @@ class WarehouseService:
             if room.current_utilization > 0:
                 raise ValueError("Cannot modify dimensions of room with inventory")
             
-            if not self._validate_room_dimensions(
-                await self.get_warehouse(warehouse_id),
-                {**room.model_dump(), **room_data}
+            if not _validate_room_dimensions(
+                tuple(room_data.get(dim, getattr(room.dimensions, dim)) for dim in ("length", "width", "height"))
             ):
                 raise ValueError("Invalid room dimensions")
         
         # Update room
-        updated_room = await self.warehouse_db.update_room(
+        updated_room = RoomResponse(**await self.warehouse_db.update_room(
             warehouse_id, room_id, room_data
-        )
+        ))
         
         # Update warehouse capacity if dimensions changed
         if any(key in room_data for key in ["length", "width", "height"]):
-            await self._update_warehouse_capacity(warehouse_id)
+            await self._adjust_warehouse_capacity(
+                warehouse_id, self._capacity_volume(updated_room) - self._capacity_volume(room)
+            )
         
         logger.info(f"Updated room {room_id}")
-        return RoomResponse(**updated_room)
+        return updated_room
 
     async def delete_room(self, warehouse_id: str, room_id: str) -> None:
         """
@@ -210,7 +288,7 @@ class WarehouseService:
         await self.warehouse_db.delete_room(warehouse_id, room_id)
         
         # Update warehouse capacity
-        await self._update_warehouse_capacity(warehouse_id)
+        await self._adjust_warehouse_capacity(warehouse_id, -self._capacity_volume(room))
         
         logger.info(f"Deleted room {room_id}")
 
@@ -249,13 +327,12 @@ class WarehouseService:
         """
         logger.info(f"Listing rooms for warehouse {warehouse_id}")
         try:
-            # Verify warehouse exists
-            warehouse = await self.get_warehouse(warehouse_id)
-            if not warehouse:
-                raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
-            
-            rooms = await self.warehouse_db.get_rooms(warehouse_id)
-            return [RoomResponse(**room) for room in rooms]
+            # Verify warehouse exists while fetching its rooms
+            _, rooms = await _gather(
+                self._require_warehouse(warehouse_id),
+                self.warehouse_db.get_rooms(warehouse_id)
+            )
+            return _ROOM_LIST_ADAPTER.validate_python(rooms)
         except Exception as e:
             logger.error(f"Error listing rooms for warehouse {warehouse_id}: {str(e)}")
             raise
@@ -280,27 +357,33 @@ class WarehouseService:
         logger.info(f"Updating status of room {room_id} to {status}")
         
         room = await self.get_room(warehouse_id, room_id)
-        if not self._validate_status_transition(room.status, status):
+        if not _validate_status_transition(room.status, status):
             raise ValueError(f"Invalid status transition from {room.status} to {status}")
         
-        updated_room = await self.warehouse_db.update_room(
+        updated_room = RoomResponse(**await self.warehouse_db.update_room(
             warehouse_id, room_id, {"status": status}
+        ))
+        # Only active rooms count towards the warehouse's capacity
+        await self._adjust_warehouse_capacity(
+            warehouse_id, self._capacity_volume(updated_room) - self._capacity_volume(room)
         )
         
         logger.info(f"Updated room {room_id} status to {status}")
-        return RoomResponse(**updated_room)
+        return updated_room
 
     async def update_room_dimensions(self, warehouse_id: str, room_id: str, length: Decimal, width: Decimal, height: Decimal) -> RoomResponse:
         """Update room dimensions."""
         logger.info(f"Updating dimensions of room {room_id}")
         try:
-            # Get the room
-            room = await self.get_room(warehouse_id, room_id)
-            if not room:
-                raise ItemNotFoundError(f"Room {room_id} not found")
+            # Fetch the room, its inventory and the warehouse's rooms together;
+            # a missing room still fails first
+            room, inventory, rooms = await _gather(
+                self.get_room(warehouse_id, room_id),
+                self.inventory_db.list_by_room(room_id),
+                self.list_rooms(warehouse_id)
+            )
 
             # Check if room has inventory
-            inventory = await self.inventory_db.list_by_room(room_id)
             if inventory:
                 raise ValueError("Cannot modify dimensions of room with inventory")
 
@@ -308,11 +391,10 @@ class WarehouseService:
             if not all(dim > 0 for dim in [length, width, height]):
                 raise ValidationError("All dimensions must be positive")
 
-            # Get all rooms to validate total warehouse capacity
-            rooms = await self.list_rooms(warehouse_id)
+            # Validate total warehouse capacity against the other rooms
             total_volume = sum(
                 self._calculate_room_volume(r) for r in rooms 
-                if r.id != UUID(room_id)  # Exclude current room
+                if r.id != room.id  # Exclude current room
             )
 
             # Calculate new room volume
@@ -328,49 +410,48 @@ class WarehouseService:
                     "height": str(height)
                 }
             }
-            updated_room = await self.warehouse_db.update_room(warehouse_id, room_id, update_data)
+            updated_room = RoomResponse(**await self.warehouse_db.update_room(warehouse_id, room_id, update_data))
+            await self._adjust_warehouse_capacity(
+                warehouse_id, self._capacity_volume(updated_room) - self._capacity_volume(room)
+            )
             logger.info(f"Updated room {room_id} dimensions")
-            return RoomResponse(**updated_room)
+            return updated_room
         except Exception as e:
             logger.error(f"Error updating room dimensions: {str(e)}")
             raise
 
-    def _validate_status_transition(self, current: RoomStatus, new: RoomStatus) -> bool:
-        """Validate if a status transition is allowed."""
-        allowed_transitions = {
-            RoomStatus.ACTIVE: [RoomStatus.MAINTENANCE, RoomStatus.DECOMMISSIONED],
-            RoomStatus.MAINTENANCE: [RoomStatus.ACTIVE, RoomStatus.DECOMMISSIONED],
-            RoomStatus.DECOMMISSIONED: [RoomStatus.ACTIVE]
-        }
-        return new in allowed_transitions.get(current, [])
+    @staticmethod
+    def _calculate_room_volume(room: RoomResponse) -> Decimal:
+        """Return a room's volume from its dimensions."""
+        dimensions = room.dimensions
+        return dimensions.length * dimensions.width * dimensions.height
 
-    def _validate_room_dimensions(self, warehouse: WarehouseResponse, room_data: Dict[str, Any]) -> bool:
-        """Validate room dimensions against warehouse constraints."""
-        try:
-            dimensions = room_data.get("dimensions")
-            if not dimensions:
-                return False
-            
-            # Check if all dimensions are positive
-            if not all(getattr(dimensions, dim, 0) > 0 for dim in ["length", "width", "height"]):
-                return False
-            
-            # Additional validation can be added here
-            return True
-        except Exception:
-            return False
-
-    async def _update_warehouse_capacity(self, warehouse_id: str) -> None:
-        """Update warehouse total capacity based on room dimensions."""
-        rooms = await self.list_rooms(warehouse_id)
-        total_capacity = sum(
-            room.dimensions.length * room.dimensions.width * room.dimensions.height
-            for room in rooms
-            if room.status == RoomStatus.ACTIVE
-        )
-        await self.warehouse_db.update_warehouse(
-            warehouse_id, {"total_capacity": total_capacity}
-        )
+    def _capacity_volume(self, room: RoomResponse) -> Decimal:
+        """Return the volume a room contributes to its warehouse's room volume total."""
+        return self._calculate_room_volume(room) if room.status == RoomStatus.ACTIVE else Decimal(0)
+
+    async def _adjust_warehouse_capacity(self, warehouse_id: str, delta: Decimal) -> None:
+        """Apply a room change to the warehouse's room volume total as one atomic delta."""
+        if delta:
+            await self.warehouse_db.adjust_capacity(warehouse_id, delta)
+
+    async def rebuild_warehouse_capacity(self, warehouse_id: str) -> Decimal:
+        """Recompute a warehouse's room volume total from scratch, e.g. to repair drift.
+
+        Room writes keep the total current through ``_adjust_warehouse_capacity``;
+        this full pass reads only each room's dimensions and status.
+        """
+        total_capacity = Decimal(0)
+        for room in await self.warehouse_db.get_rooms(warehouse_id, attributes=("dimensions", "status")):
+            if room.get("status", RoomStatus.ACTIVE) == RoomStatus.ACTIVE:
+                dimensions = room["dimensions"]
+                total_capacity += (
+                    _to_decimal(dimensions["length"])
+                    * _to_decimal(dimensions["width"])
+                    * _to_decimal(dimensions["height"])
+                )
+        await self.warehouse_db.update_warehouse(warehouse_id, {"rooms_volume": total_capacity})
+        return total_capacity
 
     async def list_warehouses(
         self, customer_id: Optional[str] = None
@@ -393,20 +474,18 @@ class WarehouseService:
         """Add inventory to a warehouse with capacity validation."""
         logger.info(f"Adding inventory to warehouse {warehouse_id}")
 
-        # Check warehouse exists and has capacity
-        warehouse = await self.get_warehouse(warehouse_id)
-        if not warehouse:
-            raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
+        # Fetch warehouse, room and the weights of current stock together;
+        # the stock stays as raw dicts since only two numbers are summed
+        warehouse, room, current_level = await _gather(
+            self.get_warehouse(warehouse_id),
+            self.get_room(warehouse_id, str(inventory_data.room_id)),
+            self.inventory_db.list_by_warehouse(warehouse_id, attributes=_WEIGHT_ATTRIBUTES)
+        )
 
-        # Verify room exists and belongs to warehouse
-        room = await self.get_room(warehouse_id, str(inventory_data.room_id))
-        if not room:
-            raise ItemNotFoundError(f"Room {inventory_data.room_id} not found")
+        # Verify room belongs to warehouse
         if str(room.warehouse_id) != warehouse_id:
             raise ValidationError("Room does not belong to specified warehouse")
 
-        current_level = await self.get_inventory_levels(warehouse_id)
-
         # Calculate total weight
         total_weight = inventory_data.quantity * inventory_data.unit_weight
 
@@ -433,14 +512,6 @@ class WarehouseService:
                 detail=str(e)
             )
 
-    def _validate_warehouse_capacity(self, warehouse_data: Dict[str, Any]) -> bool:
-        """Validate warehouse capacity configuration."""
-        try:
-            capacity = Decimal(str(warehouse_data.get("total_capacity", 0)))
-            return capacity > 0
-        except (TypeError, ValueError):
-            return False
-
     def _check_warehouse_capacity(self, warehouse: WarehouseResponse, current_level: List[Dict | InventoryResponse], inventory_data: InventoryCreate) -> bool:
         """Check if warehouse has sufficient capacity for new inventory.
         
@@ -453,10 +524,7 @@ class WarehouseService:
             bool: True if warehouse has sufficient capacity, False otherwise
         """
         # Calculate total weight of current inventory
-        used_capacity = sum(
-            Decimal(str(item["total_weight"] if isinstance(item, dict) else item.total_weight))
-            for item in current_level
-        )
+        used_capacity = sum((_item_weight(item) for item in current_level), Decimal(0))
         
         # Calculate weight of new inventory
         new_weight = inventory_data.quantity * inventory_data.unit_weight
@@ -471,22 +539,12 @@ class WarehouseService:
         logger.info(f"Created customer {customer.id}")
         return customer
 
-    def _validate_verification_status_transition(
-        self, current_status: VerificationStatus, new_status: VerificationStatus
-    ) -> bool:
-        """Validate if the verification status transition is allowed."""
-        allowed_transitions = {
-            VerificationStatus.PENDING: {VerificationStatus.VERIFIED, VerificationStatus.REJECTED},
-            VerificationStatus.VERIFIED: {VerificationStatus.REJECTED},
-            VerificationStatus.REJECTED: {VerificationStatus.VERIFIED}
-        }
-        return new_status in allowed_transitions.get(current_status, set())
-
     async def verify_customer(self, customer_id: UUID, verification_data: Dict[str, Any]) -> CustomerResponse:
         """Verify customer and update verification status."""
         logger.info(f"Verifying customer {customer_id}")
+        customer_key = str(customer_id)
         try:
-            customer = await self.customer_db.get_customer(str(customer_id))
+            customer = await self.customer_db.get_customer(customer_key)
             if not customer:
                 raise ValueError(f"Customer {customer_id} not found")
             
@@ -495,12 +553,12 @@ class WarehouseService:
             current_status = VerificationStatus(customer.verification_status)
             
             # Validate status transition
-            if not self._validate_verification_status_transition(current_status, new_status):
+            if not _validate_verification_status_transition(current_status, new_status):
                 raise ValueError(f"Invalid status transition from {current_status} to {new_status}")
             
             # Update verification status
             updated_customer = await self.customer_db.update_item(
-                str(customer_id),
+                customer_key,
                 {"verification_status": new_status}
             )
             return updated_customer
@@ -509,11 +567,13 @@ class WarehouseService:
 
     async def calculate_warehouse_utilization(self, warehouse_id: str) -> dict:
         """Calculate the utilization of a warehouse."""
-        warehouse = await self.warehouse_db.get_warehouse(warehouse_id)
+        warehouse, rooms = await _gather(
+            self.warehouse_db.get_warehouse(warehouse_id),
+            self.warehouse_db.list_rooms(warehouse_id)
+        )
         if not warehouse:
             raise ItemNotFoundError(f"Warehouse with ID {warehouse_id} not found")
 
-        rooms = await self.warehouse_db.list_rooms(warehouse_id)
         if not rooms:
             return {
                 "total_capacity": Decimal('0'),
@@ -524,17 +584,16 @@ class WarehouseService:
         total_capacity = Decimal('0')
         total_used = Decimal('0')
 
-        for room in rooms:
-            if room.get('status') == RoomStatus.ACTIVE:
-                room_capacity = await self.calculate_room_capacity(room)
-                total_capacity += room_capacity
-                
-                inventory_items = await self.warehouse_db.list_inventory_by_room(room["id"])
-                room_used = sum(
-                    Decimal(str(item.get("total_weight", 0)))
-                    for item in inventory_items
-                )
-                total_used += room_used
+        active_rooms = [room for room in rooms if room.get('status') == RoomStatus.ACTIVE]
+        room_inventories = await _gather(*(
+            self.warehouse_db.list_inventory_by_room(room["id"]) for room in active_rooms
+        ))
+        for room, inventory_items in zip(active_rooms, room_inventories):
+            total_capacity += await self.calculate_room_capacity(room)
+            total_used += sum(
+                (_to_decimal(item.get("total_weight", 0)) for item in inventory_items),
+                Decimal('0')
+            )
 
         utilization_percentage = (
             (total_used / total_capacity) * Decimal('100')
@@ -562,8 +621,6 @@ class WarehouseService:
         try:
             # Get room details
             room = await self.get_room(warehouse_id, room_id)
-            if not room:
-                raise ValueError(f"Room {room_id} not found")
             
             # Calculate required volume
             required_volume = width * length * height
@@ -587,35 +644,37 @@ class WarehouseService:
         """Calculate the capacity of a room based on its dimensions."""
         if isinstance(room, dict) and 'dimensions' in room:
             dimensions = room['dimensions']
-            length = Decimal(str(dimensions['length']))
-            width = Decimal(str(dimensions['width']))
-            height = Decimal(str(dimensions['height']))
-            return length * width * height
+            return (
+                _to_decimal(dimensions['length'])
+                * _to_decimal(dimensions['width'])
+                * _to_decimal(dimensions['height'])
+            )
         raise ValueError("Invalid room data format")
 
     async def list_inventory_by_room(self, room_id: str) -> List[InventoryResponse]:
         """List all inventory items in a room."""
         try:
-            # First validate the room exists
-            room = await self.warehouse_db.get_room_by_id(room_id)
+            # Validate the room exists while fetching its inventory
+            room, inventory_items = await _gather(
+                self.warehouse_db.get_room_by_id(room_id),
+                self.inventory_db.list_by_room(room_id)
+            )
             if not room:
                 raise ItemNotFoundError(f"Room with id {room_id} not found")
             
-            # Get inventory for the room
-            inventory_items = await self.inventory_db.list_by_room(room_id)
             return inventory_items
         except Exception as e:
             logger.error(f"Error listing inventory for room {room_id}: {str(e)}")
             raise
 
-    async def search_inventory(self, sku: str) -> List[InventoryResponse]:
+    async def search_inventory(self, sku: str) -> List[InventoryListItem]:
         """Search inventory by SKU."""
         try:
             if not sku or not isinstance(sku, str):
                 raise ValidationError("A valid SKU string is required for search")
             
             inventory_items = await self.inventory_db.search_by_sku(sku)
-            return [InventoryResponse(**item) for item in inventory_items]
+            return _INVENTORY_LIST_ADAPTER.validate_python(inventory_items)
         except ValidationError as e:
             logger.error(f"Validation error searching inventory with SKU {sku}: {str(e)}")
             raise
@@ -1,24 +1,25 @@
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
 from datetime import datetime
 from decimal import Decimal
+import asyncio
+import base64
+import binascii
 import logging
-import json
+import time
+from collections import OrderedDict
+import orjson
 from pydantic import ValidationError
 from uuid import UUID
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
-class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for handling Decimal types and other custom objects."""
-    def default(self, obj):
-        if isinstance(obj, Decimal):
-            return str(obj)
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, UUID):
-            return str(obj)
-        elif hasattr(obj, 'dict'):
-            return obj.dict()
-        return super().default(obj)
+def _json_default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 def json_serialize(obj: Any) -> str:
     """
@@ -30,11 +31,91 @@ def json_serialize(obj: Any) -> str:
     Returns:
         JSON string representation of the object
     """
-    return json.dumps(jsonable_encoder(obj), cls=CustomJSONEncoder)
+    return orjson.dumps(jsonable_encoder(obj), default=_json_default).decode()
 
 def json_dumps(obj):
     """Convert object to JSON string with custom encoder."""
-    return json.dumps(obj, cls=CustomJSONEncoder)
+    return orjson.dumps(obj, default=_json_default).decode()
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson; Decimals fall back to their string form."""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+def encode_cursor(key: Dict[str, Any]) -> str:
+    """Encode a DynamoDB ``LastEvaluatedKey`` as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(orjson.dumps(key, default=_json_default)).decode()
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by ``encode_cursor``; raises ValueError if malformed."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, orjson.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, dict):
+        raise ValueError("Invalid cursor")
+    return key
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at <= self.timer():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (value, self.timer() + (self.ttl if ttl is None else ttl))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def keys(self) -> list:
+        return list(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class SingleFlight:
+    """Share one running call between concurrent callers asking for the same key.
+
+    Nothing is kept once the call finishes; this only collapses identical
+    lookups that overlap in time, such as several dashboards polling at once.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._calls.pop(key, None))
+        # Shielded so one caller going away does not cancel the others' result
+        return await asyncio.shield(future)
+
+    def __len__(self) -> int:
+        return len(self._calls)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -143,6 +143,7 @@ def mock_customer_db(test_customer):
             self.update_item = AsyncMock(name='update_item')
             self.delete_item = AsyncMock(name='delete_item')
             self.list_items = AsyncMock(name='list_items')
+            self.batch_create = AsyncMock(name='batch_create')
             
             # Customer-specific methods
             self.get_customer = AsyncMock(name='get_customer')
@@ -189,12 +190,14 @@ async def test_app(mock_customer_db, mock_warehouse_db, mock_room_db, mock_inven
         FastAPI: Configured test application
     """
     from app.main import app
+    from app.dependencies import init_services
     
     # Configure mock databases
     app.state.customer_db = mock_customer_db
     app.state.warehouse_db = mock_warehouse_db
     app.state.room_db = mock_room_db
     app.state.inventory_db = mock_inventory_db
+    init_services(app)
     
     return app
 
@@ -280,8 +283,10 @@ def mock_warehouse_db(test_warehouse, test_room, test_inventory):
             
             # Mock methods with correct names
             self.get_warehouse = AsyncMock(side_effect=self.handle_get_warehouse)
+            self.warehouse_exists = AsyncMock(side_effect=self.handle_warehouse_exists)
             self.create_warehouse = AsyncMock(side_effect=self.handle_create_warehouse)
             self.update_warehouse = AsyncMock(side_effect=self.handle_update_warehouse)
+            self.adjust_capacity = AsyncMock(name='adjust_capacity')
             self.delete_warehouse = AsyncMock(side_effect=self.handle_delete_warehouse)
             self.list_warehouses = AsyncMock(return_value=[test_warehouse])
             self.get_customer = AsyncMock(side_effect=self.handle_get_customer)
@@ -423,6 +428,10 @@ def mock_warehouse_db(test_warehouse, test_room, test_inventory):
                 }
             raise ItemNotFoundError(f"Warehouse {warehouse_id} not found")
 
+        async def handle_warehouse_exists(self, warehouse_id: UUID) -> bool:
+            """Handle warehouse existence checks."""
+            return str(warehouse_id) in self.warehouses
+
         async def handle_list_by_customer(self, customer_id: UUID) -> List[Dict[str, Any]]:
             """Handle list warehouses by customer requests."""
             customer_id_str = str(customer_id)
@@ -432,6 +441,11 @@ def mock_warehouse_db(test_warehouse, test_room, test_inventory):
                     warehouses.append(warehouse)
             return warehouses
 
+        async def iter_by_customer(self, customer_id: UUID):
+            """Stream whatever ``list_by_customer`` is set up to return."""
+            for warehouse in await self.list_by_customer(customer_id):
+                yield warehouse
+
         async def handle_get_room(self, warehouse_id: str, room_id: str) -> Dict[str, Any]:
             """Handle get room requests."""
             # Check if warehouse exists
@@ -901,7 +915,7 @@ def mock_inventory_db(test_inventory):
             self.list_items.side_effect = self.list_inventory
 
             # Set up list_by_warehouse to return empty list for all warehouses
-            async def handle_list_by_warehouse(warehouse_id: str) -> List[Dict[str, Any]]:
+            async def handle_list_by_warehouse(warehouse_id: str, attributes=None) -> List[Dict[str, Any]]:
                 return []  # Return empty list for all warehouses
             
             self.list_by_warehouse.side_effect = handle_list_by_warehouse
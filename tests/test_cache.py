@@ -0,0 +1,99 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from app.cache import ETagMiddleware, ResponseCacheMiddleware
+
+def _app(**options):
+    app = FastAPI()
+    calls = {"rooms": 0, "warehouses": 0}
+
+    @app.get("/api/v1/rooms/{room_id}")
+    async def get_room(room_id: str):
+        calls["rooms"] += 1
+        return {"id": room_id, "reads": calls["rooms"]}
+
+    @app.get("/api/v1/warehouses/{warehouse_id}")
+    async def get_warehouse(warehouse_id: str):
+        calls["warehouses"] += 1
+        return {"id": warehouse_id, "reads": calls["warehouses"]}
+
+    @app.put("/api/v1/rooms/{room_id}")
+    async def update_room(room_id: str):
+        return {"id": room_id}
+
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        ttl=60,
+        invalidates={
+            "/api/v1/rooms": ("/api/v1/rooms", "/api/v1/warehouses"),
+            "/api/v1/warehouses": ("/api/v1/warehouses",),
+        },
+        **options
+    )
+    return app, calls
+
+def test_repeated_get_is_served_from_cache():
+    app, calls = _app()
+    client = TestClient(app)
+
+    first = client.get("/api/v1/rooms/r1")
+    second = client.get("/api/v1/rooms/r1")
+    assert first.json() == second.json()
+    assert second.headers["x-cache"] == "HIT"
+    assert calls["rooms"] == 1
+
+    client.get("/api/v1/rooms/r1", headers={"Authorization": "Bearer other"})
+    assert calls["rooms"] == 2
+
+def test_write_invalidates_dependent_collections():
+    app, calls = _app()
+    client = TestClient(app)
+    client.get("/api/v1/rooms/r1")
+    client.get("/api/v1/warehouses/w1")
+
+    assert client.put("/api/v1/rooms/r1").status_code == 200
+    assert client.get("/api/v1/rooms/r1").json()["reads"] == 2
+    assert client.get("/api/v1/warehouses/w1").json()["reads"] == 2
+
+def test_per_collection_ttl_overrides_default():
+    app, calls = _app(ttls={"/api/v1/warehouses": 0})
+    client = TestClient(app)
+
+    client.get("/api/v1/warehouses/w1")
+    second = client.get("/api/v1/warehouses/w1")
+    assert "x-cache" not in second.headers
+    assert calls["warehouses"] == 2
+
+    client.get("/api/v1/rooms/r1")
+    assert client.get("/api/v1/rooms/r1").headers["x-cache"] == "HIT"
+
+def test_matching_if_none_match_returns_304():
+    app, calls = _app()
+    client = TestClient(ETagMiddleware(app))
+
+    first = client.get("/api/v1/rooms/r1")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    revalidated = client.get("/api/v1/rooms/r1", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    changed = client.get("/api/v1/rooms/r2", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+def test_streamed_bodies_pass_through_untagged():
+    app = FastAPI()
+
+    @app.get("/api/v1/warehouses")
+    async def list_warehouses():
+        async def body():
+            yield b"["
+            yield b"]"
+        return StreamingResponse(body(), media_type="application/json")
+
+    response = TestClient(ETagMiddleware(app)).get("/api/v1/warehouses")
+    assert response.json() == []
+    assert "etag" not in response.headers
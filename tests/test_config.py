@@ -0,0 +1,46 @@
+import pytest
+from app.config import Settings
+
+def test_settings_from_env_reads_prefixed_values():
+    settings = Settings.from_env({
+        "WMS_ENV": "staging",
+        "WMS_DEBUG": "false",
+        "WMS_MAX_STACK_HEIGHT": "5",
+        "WMS_CORS_ORIGINS": '["https://example.com"]',
+        "WMS_SMTP_PORT": "25",
+        "ENV": "production",
+    })
+    assert settings.ENV == "staging"
+    assert settings.DEBUG is False
+    assert settings.MAX_STACK_HEIGHT == 5
+    assert settings.CORS_ORIGINS == ("https://example.com",)
+    assert settings.SMTP_PORT == 25
+    assert settings.ROOMS_TABLE == "dev-Rooms"
+
+def test_settings_validation():
+    with pytest.raises(ValueError):
+        Settings.from_env({"WMS_ENV": "qa"})
+    with pytest.raises(ValueError):
+        Settings.from_env({"WMS_ENV": "production"})
+    with pytest.raises(ValueError):
+        Settings.from_env({"WMS_MAX_STACK_HEIGHT": "0"})
+
+def test_settings_groups_are_cached_and_read_only():
+    settings = Settings.from_env({})
+    cors = settings.cors_settings
+    assert cors is settings.cors_settings
+    assert cors["allow_methods"] == settings.CORS_ALLOW_METHODS
+    with pytest.raises(TypeError):
+        cors["allow_origins"] = ("https://evil.example",)
+
+def test_database_settings_tune_botocore_client():
+    settings = Settings.from_env({
+        "WMS_DYNAMODB_MAX_POOL_CONNECTIONS": "20",
+        "WMS_DYNAMODB_READ_TIMEOUT": "0.5",
+    })
+    config = settings.database_settings["config"]
+    assert config.max_pool_connections == 20
+    assert config.read_timeout == 0.5
+    assert config.connect_timeout == 1.0
+    assert config.retries == {"max_attempts": 3, "mode": "adaptive"}
+    assert config.tcp_keepalive is True
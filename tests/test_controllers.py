@@ -7,6 +7,8 @@ from fastapi import HTTPException
 from pydantic import BaseModel, ValidationError
 
 from app.controllers import (
+    _dumper_for,
+    _list_dumper_for,
     BaseController,
     CustomerController,
     WarehouseController,
@@ -140,6 +142,53 @@ async def test_base_controller_format_response(warehouse_service):
     assert isinstance(result, dict)
     assert result["name"] == data["name"]
 
+@pytest.mark.asyncio
+async def test_base_controller_format_response_skips_revalidation(warehouse_service):
+    controller = BaseController(service=warehouse_service)
+
+    # Service output is trusted, so field validators must not run again
+    data = {
+        "id": UUID('95c47d79-b85a-4162-a0f8-7922885371ca'),
+        "name": "Test Customer",
+        "email": "test@example.com",
+        "phone_number": "+1-234-567-8900",
+        "address": "123 Test St",
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "verification_status": "PENDING"
+    }
+    result = controller.format_response(data, CustomerResponse)
+    assert result["phone_number"] == data["phone_number"]
+
+    model = CustomerResponse(**data)
+    assert controller.format_response(model, CustomerResponse) == model.model_dump()
+
+def test_dumper_for_is_cached_per_model():
+    assert _dumper_for(CustomerResponse) is _dumper_for(CustomerResponse)
+    assert _dumper_for(CustomerResponse) is not _dumper_for(WarehouseResponse)
+
+    with pytest.raises(ValueError):
+        _dumper_for(CustomerResponse)(["not", "a", "dict"])
+
+def test_list_dumper_matches_single_item_dumper():
+    data = {
+        "id": UUID('95c47d79-b85a-4162-a0f8-7922885371ca'),
+        "name": "Test Customer",
+        "email": "test@example.com",
+        "phone_number": "+1234567890",
+        "address": "123 Test St",
+        "created_at": datetime.now(),
+        "updated_at": datetime.now(),
+        "verification_status": "PENDING"
+    }
+    model = CustomerResponse(**data)
+    dump = _list_dumper_for(CustomerResponse)
+    assert dump is _list_dumper_for(CustomerResponse)
+    assert dump([data, model]) == [_dumper_for(CustomerResponse)(data), model.model_dump()]
+
+    with pytest.raises(ValueError):
+        dump([None])
+
 # Customer Controller Tests
 @pytest.mark.asyncio
 async def test_customer_controller_create_customer(warehouse_service, valid_customer_data):
@@ -612,4 +661,24 @@ async def test_room_controller_update_room_validation_error():
         await controller.update_room(warehouse_id, room_id, invalid_update)
     
     assert exc.value.status_code == 422
-    assert "Invalid temperature value" in str(exc.value.detail) 
\ No newline at end of file
+    assert "Invalid temperature value" in str(exc.value.detail) 
+
+def test_exceptions_module_reuses_database_hierarchy():
+    from app import exceptions, database
+    assert exceptions.ItemNotFoundError is database.ItemNotFoundError
+    assert exceptions.ValidationError is database.ValidationError
+    assert issubclass(exceptions.StatusTransitionError, database.ValidationError)
+
+@pytest.mark.asyncio
+async def test_controller_lets_unexpected_errors_propagate(warehouse_service):
+    controller = CustomerController(service=warehouse_service)
+    controller.service.get_customer = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        await controller.get_customer(uuid4())
+
+def test_controllers_use_slots(warehouse_service):
+    for controller_cls in (CustomerController, WarehouseController, RoomController):
+        controller = controller_cls(service=warehouse_service)
+        assert not hasattr(controller, "__dict__")
+        assert controller.service is warehouse_service
@@ -0,0 +1,806 @@
+import asyncio
+import threading
+from dataclasses import replace
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+import boto3
+from fastapi.testclient import TestClient
+from moto import mock_dynamodb
+
+from app import database
+from app.config import get_settings
+from app.database import (
+    ConflictError,
+    CustomerDB,
+    InventoryDB,
+    RoomDB,
+    WarehouseDB,
+    ItemNotFoundError,
+    ValidationError,
+    WAREHOUSE_ID_INDEX,
+    _set_clause,
+    get_dynamodb_resource,
+    get_item_resource,
+    get_query_table,
+    get_table
+)
+from app.models import (
+    CustomerCreate,
+    CustomerResponse,
+    CustomerUpdate,
+    InventoryCreate,
+    InventoryTransfer,
+    InventoryUpdate,
+    RoomBase,
+    RoomCreate,
+    RoomDimensions,
+    RoomUpdate,
+    VerificationStatus,
+    WarehouseCreate,
+    WarehouseResponse
+)
+from app.services import WarehouseService
+from . import aws_credentials
+
+settings = get_settings()
+
+def _create_table(
+    name: str, warehouse_index: bool = False, customer_index: bool = False, sku_index: bool = False
+):
+    kwargs = {}
+    attributes = {"id": "S"}
+    indexes = []
+    if warehouse_index:
+        indexes.append((WAREHOUSE_ID_INDEX, ("warehouse_id",)))
+    if customer_index:
+        indexes.append(("customer-id-index", ("customer_id",)))
+    if sku_index:
+        indexes.append(("sku-warehouse_id-index", ("sku", "warehouse_id")))
+    for index_name, keys in indexes:
+        attributes.update(dict.fromkeys(keys, "S"))
+    if indexes:
+        kwargs["GlobalSecondaryIndexes"] = [{
+            "IndexName": index_name,
+            "KeySchema": [
+                {"AttributeName": key, "KeyType": key_type} for key, key_type in zip(keys, ("HASH", "RANGE"))
+            ],
+            "Projection": {"ProjectionType": "ALL"}
+        } for index_name, keys in indexes]
+    return boto3.resource("dynamodb", region_name=settings.AWS_REGION).create_table(
+        TableName=name,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": key, "AttributeType": kind} for key, kind in attributes.items()],
+        BillingMode="PAY_PER_REQUEST",
+        **kwargs
+    )
+
+@pytest.fixture(autouse=True)
+def fresh_dynamodb_resource():
+    # The shared resource must be created inside each test's moto mock
+    caches = (get_dynamodb_resource, get_table, get_item_resource, get_query_table)
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+@pytest.fixture
+def customer_db(aws_credentials):
+    with mock_dynamodb():
+        _create_table(settings.CUSTOMERS_TABLE)
+        yield CustomerDB()
+
+@pytest.fixture
+def warehouse_db(aws_credentials):
+    with mock_dynamodb():
+        _create_table(settings.CUSTOMERS_TABLE)
+        _create_table(settings.WAREHOUSES_TABLE, customer_index=True)
+        _create_table(settings.ROOMS_TABLE, warehouse_index=True)
+        _create_table(settings.INVENTORY_TABLE, warehouse_index=True, sku_index=True)
+        yield WarehouseDB()
+
+def _customer(i: int) -> CustomerCreate:
+    return CustomerCreate(
+        name=f"Customer {i}",
+        email=f"customer{i}@example.com",
+        phone_number="+1234567890",
+        address=f"{i} Test Street, Test City"
+    )
+
+@pytest.mark.asyncio
+async def test_batch_create_and_batch_get(customer_db):
+    created = await customer_db.batch_create([_customer(i) for i in range(120)])
+    assert len(created) == 120
+
+    ids = [str(c.id) for c in created] * 2 + ["00000000-0000-0000-0000-000000000000"]
+    fetched = await customer_db.batch_get(ids)
+    assert {c.id for c in fetched} == {c.id for c in created}
+
+@pytest.mark.asyncio
+async def test_get_item_builds_typed_response_without_validation(customer_db, monkeypatch):
+    created = await customer_db.create_item(_customer(1))
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("stored items must not be re-validated")
+
+    monkeypatch.setattr(CustomerResponse, "__init__", fail_validation)
+    fetched = await customer_db.get_item(str(created.id))
+    assert isinstance(fetched.id, UUID)
+    assert isinstance(fetched.created_at, datetime)
+    assert fetched.verification_status is VerificationStatus.PENDING
+
+@pytest.mark.asyncio
+async def test_boto3_calls_run_off_the_event_loop(customer_db):
+    created = await customer_db.batch_create([_customer(1)])
+    loop_thread = threading.get_ident()
+    call_threads = []
+    get_item = customer_db.table.get_item
+
+    def recording_get_item(**kwargs):
+        call_threads.append(threading.get_ident())
+        return get_item(**kwargs)
+
+    customer_db.table.get_item = recording_get_item
+    customer = await customer_db.get_item(str(created[0].id))
+    assert customer.id == created[0].id
+    assert call_threads and call_threads[0] != loop_thread
+
+def _room(warehouse_id: str, name: str) -> RoomBase:
+    return RoomBase(
+        name=name,
+        capacity=Decimal("100.00"),
+        temperature=Decimal("20.5"),
+        humidity=Decimal("50"),
+        dimensions=RoomDimensions(length=Decimal("10"), width=Decimal("8"), height=Decimal("4")),
+        warehouse_id=warehouse_id
+    )
+
+@pytest.mark.asyncio
+async def test_update_warehouse_builds_response_without_validation(warehouse_db, monkeypatch):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={
+        "id": warehouse_id,
+        "name": "Main",
+        "address": "1 Dock Road",
+        "total_capacity": Decimal("1000"),
+        "available_capacity": Decimal("1000"),
+        "customer_id": str(uuid4()),
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00"
+    })
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("stored items must not be re-validated")
+
+    monkeypatch.setattr(WarehouseResponse, "__init__", fail_validation)
+    updated = await warehouse_db.update_warehouse(warehouse_id, {"name": "Annex"})
+    assert updated.name == "Annex"
+    assert isinstance(updated.id, UUID)
+    assert isinstance(updated.updated_at, datetime)
+    assert updated.rooms == []
+
+@pytest.mark.asyncio
+async def test_rooms_and_inventory_are_stored_outside_the_warehouse_item(warehouse_db):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={
+        "id": warehouse_id,
+        "name": "Main",
+        "address": "1 Dock Road",
+        "total_capacity": Decimal("1000"),
+        "available_capacity": Decimal("1000"),
+        "customer_id": str(uuid4()),
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "updated_at": "2024-01-01T00:00:00+00:00"
+    })
+
+    await warehouse_db.create_room(warehouse_id, _room(warehouse_id, "Room A"))
+    await warehouse_db.create_room(warehouse_id, _room(warehouse_id, "Room B"))
+    await warehouse_db.add_inventory(warehouse_id, {"product_id": "p-1", "quantity": 30, "unit": "box"})
+
+    item = warehouse_db.table.get_item(Key={"id": warehouse_id})["Item"]
+    assert "rooms" not in item and "inventory" not in item
+
+    warehouse = await warehouse_db.get_warehouse(warehouse_id)
+    assert isinstance(warehouse.total_capacity, Decimal)
+    assert warehouse.available_capacity == Decimal("1000")
+    assert sorted(room.name for room in warehouse.rooms) == ["Room A", "Room B"]
+
+    rooms = await warehouse_db.get_rooms(warehouse_id)
+    assert sorted(room["name"] for room in rooms) == ["Room A", "Room B"]
+    assert len(await warehouse_db.get_inventory(warehouse_id)) == 1
+
+    availability = await warehouse_db.check_availability(warehouse_id)
+    assert availability["total_capacity"] == Decimal("200")
+    assert availability["available_capacity"] == Decimal("170")
+
+    missing_id = str(uuid4())
+    with pytest.raises(ItemNotFoundError):
+        await warehouse_db.create_room(missing_id, _room(missing_id, "Room C"))
+    with pytest.raises(ItemNotFoundError):
+        await warehouse_db.check_availability(missing_id)
+    with pytest.raises(ItemNotFoundError):
+        await warehouse_db.add_inventory(missing_id, {"product_id": "p-2", "quantity": 1, "unit": "box"})
+
+@pytest.mark.asyncio
+async def test_list_items_pages_with_cursor(customer_db):
+    created = await customer_db.batch_create([_customer(i) for i in range(5)])
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await customer_db.list_items(cursor=cursor, limit=2)
+        assert len(page) <= 2
+        seen.extend(c.id for c in page)
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(c.id for c in created)
+
+def test_db_instances_share_one_resource(warehouse_db):
+    customer_db = CustomerDB()
+    assert customer_db.dynamodb is warehouse_db.dynamodb
+    assert customer_db.table is warehouse_db.customers_table
+
+def test_format_item_converts_nested_numbers_iteratively(customer_db):
+    formatted = customer_db._format_item({
+        "quantity": 3,
+        "ratio": 0.1,
+        "active": True,
+        "dimensions": {"length": 2.5, "tags": [1, {"weight": 5000}]},
+    })
+    assert formatted["quantity"] == Decimal("3")
+    assert formatted["ratio"] == Decimal("0.1")
+    assert formatted["active"] is True
+    assert formatted["dimensions"]["length"] == Decimal("2.5")
+    assert formatted["dimensions"]["tags"][0] == Decimal("1")
+    assert formatted["dimensions"]["tags"][1]["weight"] == Decimal("5000")
+    assert "id" in formatted
+
+@pytest.mark.asyncio
+async def test_iter_items_follows_last_evaluated_key(customer_db):
+    created = await customer_db.batch_create([_customer(i) for i in range(5)])
+    seen = [item["id"] async for item in customer_db._iter_items(customer_db.table.scan, Limit=2)]
+    assert sorted(seen) == sorted(str(c.id) for c in created)
+
+@pytest.mark.asyncio
+async def test_list_by_customer_queries_with_key_condition(warehouse_db):
+    customer_id = str(uuid4())
+    for name in ("North", "South"):
+        warehouse_db.table.put_item(Item={
+            "id": str(uuid4()),
+            "name": name,
+            "address": "1 Dock Road",
+            "total_capacity": Decimal("1000"),
+            "available_capacity": Decimal("1000"),
+            "customer_id": customer_id,
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2024-01-01T00:00:00+00:00"
+        })
+
+    warehouses = await warehouse_db.list_by_customer(customer_id)
+    assert sorted(w.name for w in warehouses) == ["North", "South"]
+    streamed = [w async for w in warehouse_db.iter_by_customer(customer_id)]
+    assert sorted(w.name for w in streamed) == ["North", "South"]
+    assert await warehouse_db.list_warehouses(str(uuid4())) == []
+
+@pytest.mark.asyncio
+async def test_room_and_inventory_writes_keep_warehouse_totals(warehouse_db):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+
+    room = await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))
+    inventory = await inventory_db.create_inventory(InventoryCreate(
+        sku="SKU-1",
+        name="Widgets",
+        quantity=Decimal("40"),
+        unit="box",
+        unit_weight=Decimal("1.5"),
+        room_id=room.id,
+        warehouse_id=warehouse_id
+    ))
+    await inventory_db.update_inventory(str(inventory.id), InventoryUpdate(quantity=Decimal("25")))
+
+    availability = await warehouse_db.check_availability(warehouse_id)
+    assert availability["total_capacity"] == Decimal("100")
+    assert availability["used_capacity"] == Decimal("25")
+
+    await inventory_db.delete_inventory(str(inventory.id))
+    await room_db.delete_room(str(room.id))
+    availability = await warehouse_db.check_availability(warehouse_id)
+    assert availability["total_capacity"] == Decimal("0")
+    assert availability["used_capacity"] == Decimal("0")
+
+@pytest.mark.asyncio
+async def test_mutations_take_totals_deltas_from_the_write_itself(warehouse_db):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+    room = await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))
+    inventory = await inventory_db.create_inventory(InventoryCreate(
+        sku="SKU-1",
+        name="Widgets",
+        quantity=Decimal("40"),
+        unit="box",
+        unit_weight=Decimal("1.5"),
+        room_id=room.id,
+        warehouse_id=warehouse_id
+    ))
+
+    def no_reads(**kwargs):
+        raise AssertionError("mutations must not read the item before writing it")
+
+    room_db.table.get_item = no_reads
+    inventory_db.table.get_item = no_reads
+    updated = await room_db.update_room(str(room.id), RoomUpdate(capacity=Decimal("150")))
+    assert updated.capacity == Decimal("150")
+    await asyncio.gather(*(
+        inventory_db.update_inventory(str(inventory.id), InventoryUpdate(quantity=quantity))
+        for quantity in (Decimal("25"), Decimal("30"))
+    ))
+    stored = inventory_db.table.scan()["Items"][0]["quantity"]
+    availability = await warehouse_db.check_availability(warehouse_id)
+    assert availability["total_capacity"] == Decimal("150")
+    assert availability["used_capacity"] == stored
+
+    await inventory_db.delete_inventory(str(inventory.id))
+    await room_db.delete_room(str(room.id))
+    availability = await warehouse_db.check_availability(warehouse_id)
+    assert availability["total_capacity"] == Decimal("0")
+    assert availability["used_capacity"] == Decimal("0")
+
+@pytest.mark.asyncio
+async def test_creates_write_item_and_totals_together(warehouse_db, monkeypatch):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+
+    missing_id = str(uuid4())
+    with pytest.raises(ItemNotFoundError):
+        await inventory_db.create_inventory(InventoryCreate(
+            sku="SKU-1",
+            name="Widgets",
+            quantity=Decimal("40"),
+            unit="box",
+            unit_weight=Decimal("1.5"),
+            room_id=uuid4(),
+            warehouse_id=missing_id
+        ))
+    assert inventory_db.table.scan()["Items"] == []
+
+    # A put that fails on an existing ID must not count the room twice
+    room_id = uuid4()
+    monkeypatch.setattr(database, "uuid4", lambda: room_id)
+    await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))
+    with pytest.raises(ConflictError):
+        await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))
+    assert (await warehouse_db.check_availability(warehouse_id))["total_capacity"] == Decimal("100")
+
+@pytest.mark.asyncio
+async def test_batch_inventory_updates_each_warehouse_total_once(warehouse_db):
+    warehouse_ids = [str(uuid4()), str(uuid4())]
+    for warehouse_id in warehouse_ids:
+        warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+    room_ids = [
+        (await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))).id
+        for warehouse_id in warehouse_ids
+    ]
+    items = [
+        InventoryCreate(
+            sku=f"SKU-{i}",
+            name="Widgets",
+            quantity=Decimal("10"),
+            unit="box",
+            unit_weight=Decimal("1.5"),
+            room_id=room_ids[i % 2],
+            warehouse_id=warehouse_ids[i % 2]
+        )
+        for i in range(5)
+    ]
+
+    created = await inventory_db.batch_create_inventory(items)
+    assert len({item.id for item in created}) == 5
+    used = [(await warehouse_db.check_availability(w))["used_capacity"] for w in warehouse_ids]
+    assert used == [Decimal("30"), Decimal("20")]
+
+    with pytest.raises(ItemNotFoundError):
+        await inventory_db.batch_create_inventory(items[:2] + [items[0].model_copy(update={"warehouse_id": uuid4()})])
+    with pytest.raises(ItemNotFoundError):
+        await inventory_db.batch_create_inventory(items[:2] + [items[0].model_copy(update={"room_id": uuid4()})])
+    with pytest.raises(ValidationError):
+        await inventory_db.batch_create_inventory([items[0].model_copy(update={"room_id": room_ids[1]})])
+    assert len(inventory_db.table.scan()["Items"]) == 5
+    used = [(await warehouse_db.check_availability(w))["used_capacity"] for w in warehouse_ids]
+    assert used == [Decimal("30"), Decimal("20")]
+
+@pytest.mark.asyncio
+async def test_batch_inventory_writes_items_and_totals_in_the_same_transactions(warehouse_db, monkeypatch):
+    warehouse_ids = [str(uuid4()), str(uuid4())]
+    for warehouse_id in warehouse_ids:
+        warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+    room_ids = [
+        (await room_db.create_room(RoomCreate(**_room(warehouse_id, "Room A").model_dump()))).id
+        for warehouse_id in warehouse_ids
+    ]
+    items = [
+        InventoryCreate(
+            sku=f"SKU-{i}",
+            name="Widgets",
+            quantity=Decimal("1"),
+            unit="box",
+            unit_weight=Decimal("1.5"),
+            room_id=room_ids[i % 2],
+            warehouse_id=warehouse_ids[i % 2]
+        )
+        for i in range(150)
+    ]
+    client = inventory_db.dynamodb.meta.client
+    transactions = []
+    transact_write_items = client.transact_write_items
+
+    def record(**kwargs):
+        transactions.append(kwargs["TransactItems"])
+        return transact_write_items(**kwargs)
+
+    monkeypatch.setattr(client, "transact_write_items", record)
+    await inventory_db.batch_create_inventory(items)
+    assert [len(operations) for operations in transactions] == [100, 54]
+    assert all(
+        sum("Update" in operation for operation in operations) == 2 for operations in transactions
+    )
+    assert len(inventory_db.table.scan()["Items"]) == 150
+    used = [(await warehouse_db.check_availability(w))["used_capacity"] for w in warehouse_ids]
+    assert used == [Decimal("75"), Decimal("75")]
+
+@pytest.mark.asyncio
+async def test_get_item_projects_requested_attributes(customer_db):
+    created = await customer_db.create_item(_customer(1))
+    partial = await customer_db.get_item(str(created.id), attributes=("id", "name"))
+    assert partial.model_dump(exclude_unset=True) == {"id": created.id, "name": "Customer 1"}
+
+@pytest.mark.asyncio
+async def test_only_read_then_write_paths_use_consistent_reads(customer_db):
+    created = await customer_db.create_item(_customer(1))
+    calls = []
+    get_item = customer_db.table.get_item
+
+    def recording_get_item(**kwargs):
+        calls.append(kwargs.get("ConsistentRead", False))
+        return get_item(**kwargs)
+
+    customer_db.table.get_item = recording_get_item
+    await customer_db.get_item(str(created.id))
+    await customer_db.get_item(str(created.id), attributes=("name",), consistent=True)
+    assert calls == [False, True]
+
+@pytest.mark.asyncio
+async def test_not_found_errors_name_the_entity(customer_db):
+    missing_id = str(uuid4())
+    with pytest.raises(ItemNotFoundError, match=f"^Customer {missing_id} not found$"):
+        await customer_db.get_item(missing_id)
+
+@pytest.mark.asyncio
+async def test_scan_all_merges_parallel_segments(customer_db):
+    created = await customer_db.batch_create([_customer(i) for i in range(12)])
+    segments = []
+    scan = customer_db.table.scan
+
+    def segmented_scan(Segment, TotalSegments, **kwargs):
+        # moto ignores Segment, so split the items the way DynamoDB would
+        segments.append((Segment, TotalSegments))
+        response = scan(**kwargs)
+        response["Items"] = [
+            item for item in response["Items"]
+            if UUID(item["id"]).int % TotalSegments == Segment
+        ]
+        return response
+
+    customer_db.table.scan = segmented_scan
+    items = await customer_db._scan_all()
+    assert sorted(item["id"] for item in items) == sorted(str(c.id) for c in created)
+    total = settings.DYNAMODB_SCAN_SEGMENTS
+    assert sorted(segments) == [(segment, total) for segment in range(total)]
+
+def test_set_clause_is_cached_per_field_shape():
+    expression, names = _set_clause(("updated_at", "quantity"))
+    assert expression == "SET #updated_at = :updated_at, #quantity = :quantity"
+    assert names == {"#updated_at": "updated_at", "#quantity": "quantity"}
+    assert _set_clause(("updated_at", "quantity"))[0] is expression
+
+@pytest.mark.asyncio
+async def test_update_and_delete_of_missing_item_skip_the_existence_read(customer_db, monkeypatch):
+    async def no_reads(*args, **kwargs):
+        raise AssertionError("mutations must not read the item first")
+
+    monkeypatch.setattr(customer_db, "get_item", no_reads)
+    missing_id = str(uuid4())
+    with pytest.raises(ItemNotFoundError):
+        await customer_db.update_item(missing_id, CustomerUpdate(name="Renamed"))
+    with pytest.raises(ItemNotFoundError):
+        await customer_db.delete_item(missing_id)
+
+@pytest.mark.asyncio
+async def test_customer_exists_is_cached_until_customer_deleted(warehouse_db):
+    customer_db = CustomerDB()
+    customer = await customer_db.create_item(_customer(1))
+    reads = []
+    get_item = warehouse_db.customers_table.get_item
+
+    def counting_get_item(**kwargs):
+        reads.append(kwargs["Key"])
+        return get_item(**kwargs)
+
+    warehouse_db.customers_table.get_item = counting_get_item
+    assert await warehouse_db._customer_exists(customer.id)
+    assert await warehouse_db._customer_exists(customer.id)
+    assert len(reads) == 1
+
+    await customer_db.delete_item(str(customer.id))
+    assert not await warehouse_db._customer_exists(customer.id)
+    assert len(reads) == 2
+
+@pytest.mark.asyncio
+async def test_create_warehouse_stamps_everything_with_one_timestamp(warehouse_db):
+    customer = await CustomerDB().create_item(_customer(1))
+    warehouse = await warehouse_db.create_item(WarehouseCreate(
+        name="Main",
+        address="1 Dock Road",
+        total_capacity=Decimal("1000"),
+        customer_id=customer.id,
+        rooms=[RoomCreate(**_room(str(uuid4()), name).model_dump()) for name in ("A", "B")]
+    ))
+    stamps = {warehouse.created_at, warehouse.updated_at}
+    stamps.update(room.created_at for room in warehouse.rooms)
+    stamps.update(room.updated_at for room in warehouse.rooms)
+    assert len(stamps) == 1
+
+@pytest.mark.asyncio
+async def test_capacity_deltas_start_from_the_rebuilt_base(warehouse_db):
+    customer = await CustomerDB().create_item(_customer(1))
+    warehouse = await warehouse_db.create_item(WarehouseCreate(
+        name="Main",
+        address="1 Dock Road",
+        total_capacity=Decimal("1000"),
+        customer_id=customer.id,
+        rooms=[RoomCreate(**_room(str(uuid4()), name).model_dump()) for name in ("A", "B")]
+    ))
+    warehouse_id = str(warehouse.id)
+    service = WarehouseService(warehouse_db=warehouse_db, inventory_db=InventoryDB(), customer_db=CustomerDB())
+
+    await service.create_room(warehouse_id, RoomCreate(**_room(warehouse_id, "C").model_dump()))
+    stored = warehouse_db.table.get_item(Key={"id": warehouse_id})["Item"]
+    assert stored["rooms_volume"] == await service.rebuild_warehouse_capacity(warehouse_id) == Decimal("960")
+    assert stored["total_capacity"] == Decimal("1000")
+
+def test_room_routes_keep_the_warehouse_room_totals(warehouse_db):
+    from app.dependencies import init_services
+    from app.main import app
+
+    customer_db = CustomerDB()
+    warehouse = asyncio.run(warehouse_db.create_item(WarehouseCreate(
+        name="Main",
+        address="1 Dock Road",
+        total_capacity=Decimal("1000"),
+        customer_id=asyncio.run(customer_db.create_item(_customer(1))).id
+    )))
+    warehouse_id = str(warehouse.id)
+    app.state.customer_db = customer_db
+    app.state.warehouse_db = warehouse_db
+    app.state.room_db = RoomDB()
+    app.state.inventory_db = InventoryDB()
+    init_services(app)
+    client = TestClient(app)
+
+    response = client.post("/api/v1/rooms/", json=_room(warehouse_id, "A").model_dump(mode="json"))
+    assert response.status_code == 201
+    stored = warehouse_db.table.get_item(Key={"id": warehouse_id})["Item"]
+    assert stored["total_capacity"] == Decimal("1000")
+    assert stored["rooms_volume"] == Decimal("320")
+    assert stored["rooms_capacity"] == Decimal("100")
+
+    assert client.delete(f"/api/v1/rooms/{response.json()['id']}").status_code == 204
+    stored = warehouse_db.table.get_item(Key={"id": warehouse_id})["Item"]
+    assert stored["total_capacity"] == Decimal("1000")
+    assert stored["rooms_volume"] == stored["rooms_capacity"] == Decimal("0")
+
+@pytest.mark.asyncio
+async def test_transfer_inventory_is_transactional(warehouse_db):
+    warehouse_id = str(uuid4())
+    warehouse_db.table.put_item(Item={"id": warehouse_id, "name": "Main"})
+    room_db, inventory_db = RoomDB(), InventoryDB()
+    source, target = [
+        await room_db.create_room(RoomCreate(**_room(warehouse_id, name).model_dump()))
+        for name in ("Room A", "Room B")
+    ]
+    inventory = await inventory_db.create_inventory(InventoryCreate(
+        sku="SKU-1",
+        name="Widgets",
+        quantity=Decimal("10"),
+        unit="box",
+        unit_weight=Decimal("1"),
+        room_id=source.id,
+        warehouse_id=warehouse_id
+    ))
+
+    reads = []
+    get_item = inventory_db.table.get_item
+
+    def recording_get_item(**kwargs):
+        reads.append(kwargs.get("ConsistentRead", False))
+        return get_item(**kwargs)
+
+    inventory_db.table.get_item = recording_get_item
+    moved = await inventory_db.transfer_inventory(str(inventory.id), InventoryTransfer(target_room_id=target.id))
+    assert reads and all(reads)
+    assert moved.room_id == target.id
+    assert [entry["to_room_id"] for entry in moved.transfer_history] == [str(target.id)]
+
+    with pytest.raises(ConflictError):
+        await inventory_db.transfer_inventory(str(inventory.id), InventoryTransfer(target_room_id=uuid4()))
+    assert (await inventory_db.get_inventory(str(inventory.id))).room_id == target.id
+
+@pytest.mark.asyncio
+async def test_inventory_history_pages_by_timestamp(warehouse_db):
+    inventory_db = InventoryDB()
+    inventory_id = str(uuid4())
+    history = [
+        {"timestamp": f"2024-01-0{day}T00:00:00+00:00", "to_room_id": str(uuid4())}
+        for day in range(1, 6)
+    ]
+    inventory_db.table.put_item(Item={"id": inventory_id, "name": "Widgets", "transfer_history": history})
+
+    first = await inventory_db.get_inventory_history(inventory_id, limit=2)
+    assert first == history[:2]
+    after = datetime.fromisoformat(first[-1]["timestamp"])
+    assert await inventory_db.get_inventory_history(inventory_id, after=after, limit=2) == history[2:4]
+    assert await inventory_db.get_inventory_history(inventory_id, after=datetime(2024, 1, 4)) == history[4:]
+
+@pytest.mark.asyncio
+async def test_search_inventory_pages_through_warehouse_index(warehouse_db):
+    warehouse_id = str(uuid4())
+    inventory_db = InventoryDB()
+    for i in range(3):
+        inventory_db.table.put_item(Item={
+            "id": str(uuid4()),
+            "sku": f"SKU-{i}",
+            "name": "Widgets",
+            "quantity": Decimal("1"),
+            "warehouse_id": warehouse_id,
+            "transfer_history": [{"to_room_id": str(uuid4())}]
+        })
+
+    with pytest.raises(ValidationError):
+        await inventory_db.search_inventory()
+
+    first, cursor = await inventory_db.search_inventory(warehouse_id=warehouse_id, limit=2)
+    rest, last = await inventory_db.search_inventory(warehouse_id=warehouse_id, limit=2, cursor=cursor)
+    assert len(first) == 2 and cursor is not None
+    assert len(rest) == 1
+    assert {item.sku for item in first + rest} == {"SKU-0", "SKU-1", "SKU-2"}
+    assert all("transfer_history" not in item.model_fields_set for item in first + rest)
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_query(warehouse_db):
+    warehouse_id = str(uuid4())
+    inventory_db = InventoryDB()
+    inventory_db.table.put_item(Item={
+        "id": str(uuid4()),
+        "sku": "SKU-SHARED",
+        "name": "Widgets",
+        "quantity": Decimal("1"),
+        "warehouse_id": warehouse_id
+    })
+    queries = []
+    run = inventory_db._run
+
+    async def counting_run(func, *args, **kwargs):
+        queries.append(kwargs.get("IndexName"))
+        return await run(func, *args, **kwargs)
+
+    inventory_db._run = counting_run
+    results = await asyncio.gather(*(inventory_db.search_inventory(warehouse_id=warehouse_id) for _ in range(5)))
+    assert len(queries) == 1
+    assert all(items[0].sku == "SKU-SHARED" for items, _ in results)
+    assert len(inventory_db._searches) == 0
+
+@pytest.mark.asyncio
+async def test_search_by_sku_shares_the_first_page_query(warehouse_db):
+    inventory_db = InventoryDB()
+    pages = []
+
+    async def search_page(sku, warehouse_id, limit, cursor):
+        pages.append(sku)
+        await asyncio.sleep(0)
+        return ["page"], None
+
+    inventory_db._search_page = search_page
+    results = await asyncio.gather(*(inventory_db.search_by_sku("SKU-1") for _ in range(5)))
+    assert pages == ["SKU-1"]
+    assert results == [["page"]] * 5
+
+@pytest.mark.asyncio
+async def test_search_by_sku_follows_every_page(warehouse_db):
+    warehouse_ids = [str(uuid4()), str(uuid4())]
+    inventory_db = InventoryDB()
+    for i in range(120):
+        inventory_db.table.put_item(Item={
+            "id": str(uuid4()),
+            "sku": "SKU-1" if i < 110 else "SKU-2",
+            "name": "Widgets",
+            "quantity": Decimal("1"),
+            "warehouse_id": warehouse_ids[i % 2],
+            "room_id": str(uuid4())
+        })
+
+    results = await inventory_db.search_by_sku("SKU-1")
+    assert len(results) == 110
+    assert len({item.id for item in results}) == 110
+    assert {item.sku for item in results} == {"SKU-1"}
+
+def test_reads_use_dynamodb_when_dax_is_disabled(customer_db):
+    assert settings.DAX_ENDPOINT is None
+    assert get_item_resource() is get_dynamodb_resource()
+    assert customer_db.query_table is customer_db.table
+
+class _CachingTable:
+    """Stand-in for a DAX table: caches get_item and refreshes only on writes made through it."""
+
+    def __init__(self, table):
+        self._table = table
+        self._items = {}
+
+    def __getattr__(self, name):
+        return getattr(self._table, name)
+
+    def get_item(self, Key, **kwargs):
+        if kwargs.get("ConsistentRead"):
+            return self._table.get_item(Key=Key, **kwargs)
+        if Key["id"] not in self._items:
+            self._items[Key["id"]] = self._table.get_item(Key=Key, **kwargs)
+        return self._items[Key["id"]]
+
+    def _write(self, method, **kwargs):
+        self._items.pop(kwargs["Key"]["id"] if "Key" in kwargs else kwargs["Item"]["id"], None)
+        return getattr(self._table, method)(**kwargs)
+
+    def put_item(self, **kwargs):
+        return self._write("put_item", **kwargs)
+
+    def update_item(self, **kwargs):
+        return self._write("update_item", **kwargs)
+
+    def delete_item(self, **kwargs):
+        return self._write("delete_item", **kwargs)
+
+class _CachingResource:
+    def __init__(self, resource):
+        self._resource = resource
+
+    def __getattr__(self, name):
+        return getattr(self._resource, name)
+
+    def Table(self, name):
+        return _CachingTable(self._resource.Table(name))
+
+@pytest.mark.asyncio
+async def test_writes_go_through_dax_so_the_next_read_sees_them(customer_db, monkeypatch):
+    dax = _CachingResource(get_dynamodb_resource())
+    monkeypatch.setattr(database, "settings", replace(settings, DAX_ENDPOINT="dax://cluster"))
+    monkeypatch.setattr(database, "get_item_resource", lambda: dax)
+    get_table.cache_clear()
+    get_query_table.cache_clear()
+    db = CustomerDB()
+    assert isinstance(db.table, _CachingTable)
+    assert db.query_table.meta.client is get_dynamodb_resource().meta.client
+
+    created = await db.create_item(_customer(1))
+    assert (await db.get_item(str(created.id))).name == created.name
+    await db.update_item(str(created.id), CustomerUpdate(name="Renamed"))
+    assert (await db.get_item(str(created.id))).name == "Renamed"
+
+    await db.delete_item(str(created.id))
+    with pytest.raises(ItemNotFoundError):
+        await db.get_item(str(created.id))
@@ -129,6 +129,7 @@ async def test_list_inventory_by_room(client: CustomTestClient, mock_warehouse_d
     data = response.json()
     assert len(data) == 1
     assert data[0]["id"] == test_inventory["id"]
+    assert "transfer_history" not in data[0]
 
 @pytest.mark.asyncio
 async def test_transfer_inventory_success(client: CustomTestClient, mock_inventory_db, test_inventory, test_room):
@@ -152,6 +153,17 @@ async def test_transfer_inventory_success(client: CustomTestClient, mock_invento
     assert data["room_id"] == test_room["id"]
     assert data["quantity"] == transfer_data["quantity"]
 
+@pytest.mark.asyncio
+async def test_transfer_inventory_requires_target_room(client: CustomTestClient, mock_inventory_db, test_inventory):
+    """Test transfer bodies are validated before reaching the database"""
+    response = await client.post(
+        f"/api/v1/inventory/{test_inventory['id']}/transfer",
+        json={"target_room_id": "not-a-room"}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    mock_inventory_db.transfer_inventory.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_transfer_inventory_exceeds_capacity(client: CustomTestClient, mock_inventory_db, test_inventory, test_room):
     """Test inventory transfer with insufficient capacity"""
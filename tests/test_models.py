@@ -280,3 +280,15 @@ def test_inventory_response():
     assert inventory.unit == "kg"
     assert inventory.unit_weight == Decimal("1.00")
 
+
+def test_update_models_share_field_checks():
+    """Test update models apply the same business checks as their base models."""
+    update = CustomerUpdate(phone_number="(555) 123-4567")
+    assert update.phone_number == "5551234567"
+
+    with pytest.raises(ValidationError) as exc_info:
+        RoomUpdate(temperature=Decimal("20.3"))
+    assert "temperature" in str(exc_info.value)
+
+    with pytest.raises(ValidationError):
+        InventoryUpdate(quantity=Decimal("0"))
@@ -1,12 +1,18 @@
+import asyncio
+import json
 from datetime import datetime, timezone
 from fastapi import status
 import pytest
 from uuid import uuid4
 from decimal import Decimal
-from app.database import ItemNotFoundError, ValidationError, DatabaseError
+from fastapi.testclient import TestClient
+from app import create_app
+from app.config import get_settings
+from app.database import ItemNotFoundError, ValidationError, DatabaseError, CustomerDB, RoomDB
 from app.main import app
-from app.utils import json_serialize
-from app.models import RoomStatus
+from app.utils import json_serialize, ORJSONResponse
+from app.models import RoomStatus, CustomerResponse
+from app.routes import _render
 from .conftest import CustomTestClient
 
 @pytest.mark.asyncio
@@ -26,6 +32,25 @@ async def test_create_customer_invalid_data(client, mock_customer_db):
     response = await client.post("/api/v1/customers", json=invalid_data)
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
+@pytest.mark.asyncio
+async def test_create_customers_in_bulk(client, mock_customer_db, test_customer):
+    customer = mock_customer_db.create_customer_response(test_customer)
+    mock_customer_db.batch_create.return_value = [customer, customer]
+    customer_data = {
+        "name": "New Company",
+        "email": "new@example.com",
+        "phone_number": "+1987654321",
+        "address": "789 New St, New City, NS 54321"
+    }
+
+    response = await client.post("/api/v1/customers/batch", json=[customer_data, customer_data])
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.json()) == 2
+    assert len(mock_customer_db.batch_create.call_args.args[0]) == 2
+
+    response = await client.post("/api/v1/customers/batch", json=[])
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
 @pytest.mark.asyncio
 async def test_get_customer_success(client, mock_customer_db, test_customer):
     response = await client.get(f"/api/v1/customers/{test_customer['id']}")
@@ -133,3 +158,120 @@ async def test_invalid_customer_id_format(client, mock_customer_db):
     response = await client.get('/api/v1/customers/invalid-id')
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+
+@pytest.mark.asyncio
+async def test_malformed_path_ids_are_rejected_before_the_handler(client, mock_room_db):
+    response = await client.get('/api/v1/rooms/not-a-uuid')
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Invalid room ID format"
+    mock_room_db.get_room.assert_not_called()
+
+    response = await client.get('/api/v1/customers/?limit=0')
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+def test_orjson_response_renders_decimal_as_string():
+    response = ORJSONResponse({"capacity": Decimal("100.50"), "id": uuid4()})
+    assert b'"capacity":"100.50"' in response.body
+
+def test_lifespan_creates_databases_once():
+    app = create_app()
+    with TestClient(app):
+        assert isinstance(app.state.customer_db, CustomerDB)
+        assert isinstance(app.state.room_db, RoomDB)
+        assert app.state.inventory_controller.service is app.state.warehouse_service
+        assert app.state.warehouse_service.customer_db is app.state.customer_db
+
+def test_lifespan_sizes_executor_to_connection_pool():
+    app = create_app()
+
+    @app.get("/executor")
+    async def executor_size():
+        return {"max_workers": asyncio.get_running_loop()._default_executor._max_workers}
+
+    with TestClient(app) as test_client:
+        response = test_client.get("/executor")
+    assert response.json()["max_workers"] == get_settings().DYNAMODB_MAX_POOL_CONNECTIONS
+
+def test_responses_carry_request_id():
+    response = TestClient(app).get("/health")
+    request_id = response.headers["X-Request-ID"]
+    assert len(request_id) == 16
+    int(request_id, 16)
+
+def test_cors_preflight_uses_explicit_methods():
+    response = TestClient(app).options(
+        "/api/v1/customers/",
+        headers={"Origin": "https://example.com", "Access-Control-Request-Method": "DELETE"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "DELETE" in response.headers["access-control-allow-methods"]
+    assert "*" not in response.headers["access-control-allow-methods"]
+
+def test_render_serializes_matching_models_directly(test_customer):
+    customer = CustomerResponse(**test_customer)
+    response = _render(customer, CustomerResponse)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == json.loads(customer.model_dump_json())
+
+    assert _render(test_customer, CustomerResponse) is test_customer
+
+def test_unhandled_exception_returns_500():
+    app = create_app()
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    response = TestClient(app, raise_server_exceptions=False).get("/boom")
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.json() == {"detail": "Internal server error"}
+
+@pytest.mark.asyncio
+async def test_list_customers_returns_next_cursor(client, mock_customer_db, test_customer):
+    customer = mock_customer_db.create_customer_response(test_customer)
+    mock_customer_db.list_items.side_effect = None
+    mock_customer_db.list_items.return_value = ([customer], {"id": test_customer["id"]})
+
+    response = await client.get("/api/v1/customers/?limit=1")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 1
+    cursor = response.headers["X-Next-Cursor"]
+
+    await client.get(f"/api/v1/customers/?limit=1&cursor={cursor}")
+    mock_customer_db.list_items.assert_called_with(cursor={"id": test_customer["id"]}, limit=1, attributes=None)
+
+@pytest.mark.asyncio
+async def test_list_customers_rejects_malformed_cursor(client):
+    response = await client.get("/api/v1/customers/?cursor=not-a-cursor")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.asyncio
+async def test_writes_are_shed_when_no_slot_is_free(client, test_app, test_customer):
+    test_app.state.write_limiter = asyncio.Semaphore(1)
+    await test_app.state.write_limiter.acquire()
+
+    response = await client.delete(f"/api/v1/customers/{test_customer['id']}")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+
+    # Reads are not limited
+    response = await client.get(f"/api/v1/customers/{test_customer['id']}")
+    assert response.status_code == status.HTTP_200_OK
+
+    test_app.state.write_limiter.release()
+    response = await client.delete(f"/api/v1/customers/{test_customer['id']}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+@pytest.mark.asyncio
+async def test_list_customers_projects_requested_fields(client, mock_customer_db, test_customer):
+    customer = CustomerResponse.model_construct(id=test_customer["id"], name=test_customer["name"])
+    mock_customer_db.list_items.side_effect = None
+    mock_customer_db.list_items.return_value = ([customer], None)
+
+    response = await client.get("/api/v1/customers/?fields=name")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{"id": test_customer["id"], "name": test_customer["name"]}]
+    assert mock_customer_db.list_items.call_args.kwargs["attributes"] == ("id", "name")
+
+    response = await client.get("/api/v1/customers/?fields=name,password")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
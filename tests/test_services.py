@@ -14,7 +14,13 @@ from app.models import (
     WarehouseUpdate,
     RoomDimensions
 )
-from app.services import WarehouseService
+from app.services import (
+    WarehouseService,
+    _validate_room_dimensions,
+    _validate_status_transition,
+    _validate_verification_status_transition,
+    _validate_warehouse_capacity
+)
 from app.utils import handle_database_error
 from app.database import ItemNotFoundError, ValidationError, DatabaseError
 from uuid import UUID
@@ -170,7 +176,8 @@ async def test_validate_room_dimensions(warehouse_service, test_warehouse, test_
         width=Decimal("8.00"),
         height=Decimal("4.00")
     )
-    assert warehouse_service._validate_room_dimensions(test_warehouse, {"dimensions": dimensions})
+    assert _validate_room_dimensions((dimensions.length, dimensions.width, dimensions.height))
+    assert not _validate_room_dimensions((Decimal("10.00"), 0, "4"))
 
 @pytest.mark.asyncio
 async def test_check_room_availability(warehouse_service, test_warehouse, test_room):
@@ -222,6 +229,26 @@ async def test_calculate_warehouse_utilization(mock_warehouse_db, mock_inventory
     assert "total_used" in result
     assert "utilization_percentage" in result
 
+@pytest.mark.asyncio
+async def test_calculate_warehouse_utilization_sums_stored_decimals(warehouse_service, test_warehouse):
+    """Test utilization totals are exact over DynamoDB's Decimal weights."""
+    room = {
+        "id": str(uuid.uuid4()),
+        "status": RoomStatus.ACTIVE,
+        "dimensions": {"length": Decimal("10"), "width": Decimal("10"), "height": Decimal("3")}
+    }
+    warehouse_db = warehouse_service.warehouse_db
+    warehouse_db.get_warehouse = AsyncMock(return_value=test_warehouse)
+    warehouse_db.list_rooms = AsyncMock(return_value=[room])
+    warehouse_db.list_inventory_by_room = AsyncMock(
+        return_value=[{"total_weight": Decimal("0.1")}, {"total_weight": Decimal("0.2")}, {"total_weight": 1}]
+    )
+
+    result = await warehouse_service.calculate_warehouse_utilization(test_warehouse["id"])
+    assert result["total_capacity"] == Decimal("300")
+    assert result["total_used"] == Decimal("1.3")
+    assert result["utilization_percentage"] == Decimal("0.43")
+
 # Room Tests
 @pytest.mark.asyncio
 async def test_create_room_success(warehouse_service, test_warehouse):
@@ -241,6 +268,24 @@ async def test_create_room_success(warehouse_service, test_warehouse):
     result = await warehouse_service.create_room(test_warehouse["id"], room_data)
     assert result.name == "Test Room"
     assert result.dimensions.length == Decimal("10.00")
+    warehouse_service.warehouse_db.adjust_capacity.assert_awaited_once_with(test_warehouse["id"], Decimal("320"))
+    warehouse_service.warehouse_db.get_rooms.assert_not_called()
+    warehouse_service.warehouse_db.get_warehouse.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_room_missing_warehouse(warehouse_service):
+    """Test room creation in a warehouse that does not exist."""
+    room_data = RoomCreate(
+        name="Test Room",
+        dimensions=RoomDimensions(length=Decimal("10"), width=Decimal("8"), height=Decimal("4")),
+        temperature=Decimal("20"),
+        humidity=Decimal("50"),
+        capacity=Decimal("100"),
+        warehouse_id=uuid.uuid4()
+    )
+    with pytest.raises(HTTPException) as exc_info:
+        await warehouse_service.create_room(str(room_data.warehouse_id), room_data)
+    assert exc_info.value.status_code == 404
 
 @pytest.mark.asyncio
 async def test_update_room_status(warehouse_service, test_warehouse, test_room):
@@ -252,6 +297,9 @@ async def test_update_room_status(warehouse_service, test_warehouse, test_room):
     )
     assert response is not None
     assert response.status == RoomStatus.MAINTENANCE
+    room = RoomResponse(**test_room)
+    volume = room.dimensions.length * room.dimensions.width * room.dimensions.height
+    warehouse_service.warehouse_db.adjust_capacity.assert_awaited_once_with(test_warehouse["id"], -volume)
 
 # Inventory Tests
 @pytest.mark.asyncio
@@ -289,6 +337,32 @@ async def test_add_inventory_success(warehouse_service, test_warehouse, test_roo
     assert response.room_id == valid_inventory_data.room_id
     assert response.warehouse_id == valid_inventory_data.warehouse_id
     assert response.quantity == valid_inventory_data.quantity
+    warehouse_service.inventory_db.list_by_warehouse.assert_awaited_once_with(
+        test_warehouse["id"], attributes=("quantity", "unit_weight")
+    )
+
+def test_capacity_check_sums_weights_from_raw_items(warehouse_service, test_warehouse, valid_inventory_data):
+    """Test stored items are weighed from quantity and unit weight without building models."""
+    warehouse = WarehouseResponse(**test_warehouse)
+    headroom = Decimal(str(warehouse.total_capacity)) - valid_inventory_data.quantity * valid_inventory_data.unit_weight
+    assert warehouse_service._check_warehouse_capacity(
+        warehouse, [{"quantity": headroom, "unit_weight": Decimal("1")}], valid_inventory_data
+    )
+    assert not warehouse_service._check_warehouse_capacity(
+        warehouse, [{"quantity": headroom + 1, "unit_weight": Decimal("1")}], valid_inventory_data
+    )
+
+@pytest.mark.asyncio
+async def test_add_inventory_reports_missing_warehouse_first(warehouse_service, valid_inventory_data):
+    """Test concurrent lookups still surface the warehouse error before the room error."""
+    warehouse_service.warehouse_db.get_warehouse.side_effect = ItemNotFoundError("Warehouse not found")
+    warehouse_service.warehouse_db.get_room.side_effect = ItemNotFoundError("Room not found")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await warehouse_service.add_inventory(str(valid_inventory_data.warehouse_id), valid_inventory_data)
+    assert exc_info.value.status_code == 404
+    assert "Warehouse" in exc_info.value.detail
+    warehouse_service.inventory_db.create_inventory.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_add_inventory_insufficient_capacity(warehouse_service, test_warehouse, test_room):
@@ -425,24 +499,14 @@ async def test_add_inventory_insufficient_room_capacity(warehouse_service, test_
 @pytest.mark.asyncio
 async def test_validate_status_transition():
     """Test room status transition validation."""
-    service = WarehouseService(
-        warehouse_db=AsyncMock(),
-        inventory_db=AsyncMock(),
-        customer_db=AsyncMock()
-    )
-    assert service._validate_status_transition(RoomStatus.ACTIVE, RoomStatus.MAINTENANCE)
-    assert not service._validate_status_transition(RoomStatus.ACTIVE, RoomStatus.ACTIVE)
+    assert _validate_status_transition(RoomStatus.ACTIVE, RoomStatus.MAINTENANCE)
+    assert not _validate_status_transition(RoomStatus.ACTIVE, RoomStatus.ACTIVE)
 
 @pytest.mark.asyncio
 async def test_validate_warehouse_capacity():
     """Test warehouse capacity validation."""
-    service = WarehouseService(
-        warehouse_db=AsyncMock(),
-        inventory_db=AsyncMock(),
-        customer_db=AsyncMock()
-    )
-    assert service._validate_warehouse_capacity({"total_capacity": Decimal("100.00")})
-    assert not service._validate_warehouse_capacity({"total_capacity": Decimal("0.00")})
+    assert _validate_warehouse_capacity(Decimal("100.00"))
+    assert not _validate_warehouse_capacity(Decimal("0.00"))
 
 @pytest.mark.asyncio
 async def test_update_room_dimensions_success(warehouse_service, test_warehouse, test_room):
@@ -486,6 +550,18 @@ async def test_update_room_dimensions_with_inventory(warehouse_service, test_war
             height=3.0
         )
 
+@pytest.mark.asyncio
+async def test_update_room_dimensions_missing_room(warehouse_service, test_warehouse):
+    """Test a missing room is reported even though the other reads run alongside it."""
+    warehouse_service.warehouse_db.get_room = AsyncMock(return_value=None)
+    room_id = str(uuid.uuid4())
+
+    with pytest.raises(ValueError, match=f"Room {room_id} not found"):
+        await warehouse_service.update_room_dimensions(
+            test_warehouse["id"], room_id, length=5.0, width=4.0, height=3.0
+        )
+    warehouse_service.inventory_db.list_by_room.assert_awaited_once_with(room_id)
+
 @pytest.mark.asyncio
 async def test_update_room_dimensions_invalid_dimensions(warehouse_service, test_warehouse, test_room):
     """Test room dimension update with invalid dimensions."""
@@ -598,25 +674,25 @@ async def test_check_warehouse_capacity_insufficient(warehouse_service, test_war
 async def test_validate_verification_status_transitions(warehouse_service):
     """Test all verification status transitions."""
     # Test all valid transitions
-    assert warehouse_service._validate_verification_status_transition(
+    assert _validate_verification_status_transition(
         VerificationStatus.PENDING,
         VerificationStatus.VERIFIED
     )
-    assert warehouse_service._validate_verification_status_transition(
+    assert _validate_verification_status_transition(
         VerificationStatus.PENDING,
         VerificationStatus.REJECTED
     )
-    assert warehouse_service._validate_verification_status_transition(
+    assert _validate_verification_status_transition(
         VerificationStatus.REJECTED,
         VerificationStatus.VERIFIED
     )
     
     # Test invalid transitions
-    assert not warehouse_service._validate_verification_status_transition(
+    assert not _validate_verification_status_transition(
         VerificationStatus.VERIFIED,
         VerificationStatus.PENDING
     )
-    assert not warehouse_service._validate_verification_status_transition(
+    assert not _validate_verification_status_transition(
         VerificationStatus.REJECTED,
         VerificationStatus.PENDING
     )